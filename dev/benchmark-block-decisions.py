@@ -0,0 +1,104 @@
+# measures how many requests per second website_blocker/block.py can decide on, with the per request print() calls
+# which block.py used to make and with the logging which replaced them
+#
+# mitmproxy isn't a python dependency of the app (mitmdump is shipped as a binary), so block.py is loaded with minimal
+# stand-ins for the parts of mitmproxy it uses
+#
+# usage: python dev/benchmark-block-decisions.py [number of requests]
+import importlib.util
+import os
+import sys
+import time
+import types
+from typing import Callable, Dict, List
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+block_py_path = os.path.normpath(os.path.join(script_dir, "../src/website_blocker/block.py"))
+
+ADDRESSES = ",".join(f"site{i}.com" for i in range(200)) + ",reddit.com,youtube.com"
+URLS = ["https://www.reddit.com/r/python", "https://docs.python.org/3/", "https://youtube.com/watch", "https://a.b/"]
+
+
+class Options:
+    def __init__(self) -> None:
+        self.addresses_str = ""
+        self.block_type = ""
+        self.events_socket = ""
+        self.log_level = "warning"
+        self.log_file = ""
+
+    def add_option(self, name: str, _type: type, default: object, _help: str) -> None:
+        setattr(self, name, default)
+
+
+class Response:
+    @staticmethod
+    def make(status_code: int, content: bytes, headers: Dict[str, str]) -> "Response":
+        return Response()
+
+
+class Request:
+    def __init__(self, url: str) -> None:
+        self.pretty_url = url
+        self.method = "GET"
+
+
+class Flow:
+    def __init__(self, url: str) -> None:
+        self.request = Request(url)
+        self.response = None
+
+
+def load_block_py(options: Options) -> types.ModuleType:
+    mitmproxy = types.ModuleType("mitmproxy")
+    mitmproxy.ctx = types.SimpleNamespace(options=options, master=None)
+    mitmproxy.http = types.SimpleNamespace(Response=Response, HTTPFlow=Flow)
+    mitmproxy.addonmanager = types.SimpleNamespace(Loader=Options)
+    sys.modules["mitmproxy"] = mitmproxy
+    sys.modules["mitmproxy.addonmanager"] = mitmproxy.addonmanager
+
+    spec = importlib.util.spec_from_file_location("block", block_py_path)
+    block = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(block)
+    return block
+
+
+def measure(decide: Callable[[Flow], None], flows: List[Flow]) -> float:
+    start_time = time.perf_counter()
+    for flow in flows:
+        decide(flow)
+    return len(flows) / (time.perf_counter() - start_time)
+
+
+def main() -> None:
+    request_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    options = Options()
+    block = load_block_py(options)
+    block.load(options)
+    options.addresses_str = ADDRESSES
+    options.block_type = "blocklist"
+    block.configure({"addresses_str", "block_type", "log_level", "log_file"})
+
+    flows = [Flow(URLS[i % len(URLS)]) for i in range(request_count)]
+
+    # stdout of mitmdump is an inherited pipe nobody reads, writing to /dev/null without buffering is close to it
+    devnull = open(os.devnull, "w", buffering=1)
+
+    def decide_with_print(flow: Flow) -> None:
+        print(type(flow), file=devnull, flush=True)
+        block.request(flow)
+
+    results = {"with print()": measure(decide_with_print, flows), "with logging": measure(block.request, flows)}
+
+    options.log_level = "debug"
+    block.configure({"log_level"})
+    results["with debug logging, rate limited"] = measure(block.request, flows)
+    devnull.close()
+
+    for name, decisions_per_second in results.items():
+        print(f"{name:<35} {decisions_per_second:>12,.0f} decisions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# measures the round trip time of commands sent to the control socket of a running instance of the app (see
+# src/utils/controlServer.py), start the app first
+#
+# usage: python dev/benchmark-control-socket.py [--requests N] [--command status]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from PySide6.QtNetwork import QLocalSocket  # noqa: E402
+
+from constants import APPLICATION_UID, SINGLE_INSTANCE_TIMEOUT  # noqa: E402
+from controlCli import read_message  # noqa: E402
+from utils.socketMessage import encode_message  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--command", default="status", choices=["status", "current_task"])
+    args = parser.parse_args()
+
+    socket = QLocalSocket()
+    socket.connectToServer(APPLICATION_UID)
+    if not socket.waitForConnected(SINGLE_INSTANCE_TIMEOUT):
+        sys.exit("Koncentro isn't running")
+
+    round_trip_times = []
+    for i in range(args.requests):
+        start_time = time.perf_counter()
+        socket.write(encode_message({"command": args.command, "id": i}))
+        socket.flush()
+        reply = read_message(socket, 5000)
+        round_trip_times.append((time.perf_counter() - start_time) * 1_000_000)
+        assert reply is not None and reply.get("id") == i, reply
+
+    round_trip_times.sort()
+    print(f"{args.requests} {args.command} requests, round trip in us:")
+    print(f"  median {statistics.median(round_trip_times):.0f}")
+    print(f"  p99    {round_trip_times[int(len(round_trip_times) * 0.99)]:.0f}")
+    print(f"  max    {round_trip_times[-1]:.0f}")
+
+
+if __name__ == "__main__":
+    main()
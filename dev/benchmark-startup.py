@@ -0,0 +1,139 @@
+# measures startup of the app without a display (offscreen Qt platform) and records the results as JSON, so that
+# startup times of different commits can be compared
+#
+# every run starts src/__main__.py with KONCENTRO_PROFILE_STARTUP (see src/utils/startupProfiler.py) and
+# python -X importtime, waits for the first frame to be painted and then terminates the app. The first run starts
+# with an empty database, the others reuse it. A throwaway config directory is used through XDG_CONFIG_HOME, so the
+# database and settings of the app aren't touched on Linux.
+#
+# usage: python dev/benchmark-startup.py [--runs N] [--output startup-benchmark.json]
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.normpath(os.path.join(script_dir, "../src"))
+
+STARTUP_TIMEOUT = 60  # in seconds
+
+
+def parse_import_times(stderr: str) -> Dict[str, float]:
+    """Sums self time of the modules imported by -X importtime per top level package, in milliseconds"""
+    import_times: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _cumulative, module = line[len("import time:") :].split("|")
+        import_times[module.strip().split(".")[0]] += int(self_time) / 1000
+    return import_times
+
+
+def run_app(config_dir: str, report_path: str) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env.update(
+        {
+            "QT_QPA_PLATFORM": "offscreen",
+            "XDG_CONFIG_HOME": config_dir,
+            "XDG_CURRENT_DESKTOP": env.get("XDG_CURRENT_DESKTOP") or "KDE",
+            "KONCENTRO_PROFILE_STARTUP": report_path,
+            "KONCENTRO_OFFLINE_PROXY": "1",
+        }
+    )
+    if os.path.exists(report_path):
+        os.remove(report_path)
+
+    # stderr is only read after the app is terminated, so it goes to a file instead of a pipe which could fill up
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr_file:
+        process = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "__main__.py"],
+            cwd=src_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+        )
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not os.path.exists(report_path):
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("App exited or timed out before painting its first frame")
+            time.sleep(0.05)
+        time.sleep(0.2)  # report is written in one go, waiting a bit so that it isn't read while being written
+
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+        stderr_file.seek(0)
+        import_times = parse_import_times(stderr_file.read())
+
+    with open(report_path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    report["import_self_ms_by_package"] = dict(sorted(import_times.items(), key=lambda item: item[1], reverse=True))
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", default="startup-benchmark.json")
+    args = parser.parse_args()
+
+    config_dir = tempfile.mkdtemp(prefix="koncentro-startup-benchmark-")
+    report_path = os.path.join(config_dir, "startup-profile.json")
+    runs: List[Dict[str, Any]] = []
+
+    for i in range(args.runs):
+        report = run_app(config_dir, report_path)
+        report["kind"] = "cold" if i == 0 else "warm"
+        runs.append(report)
+        print(f"run {i + 1} ({report['kind']}): first frame {report['first_paint_since_process_start_ms']:.0f}ms")
+
+    warm_runs = [run for run in runs if run["kind"] == "warm"] or runs
+    phase_names = [phase["name"] for phase in warm_runs[0]["phases"]]
+    summary = {
+        "first_paint_since_process_start_ms": statistics.median(
+            run["first_paint_since_process_start_ms"] for run in warm_runs
+        ),
+        "interpreter_startup_wall_ms": statistics.median(run["interpreter_startup_wall_ms"] for run in warm_runs),
+        "phases_wall_ms": {
+            name: statistics.median(
+                phase["wall_ms"] for run in warm_runs for phase in run["phases"] if phase["name"] == name
+            )
+            for name in phase_names
+        },
+        "slowest_imports_self_ms": {
+            package: statistics.median(run["import_self_ms_by_package"].get(package, 0) for run in warm_runs)
+            for package in list(warm_runs[0]["import_self_ms_by_package"])[:15]
+        },
+    }
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "summary_of_warm_runs": summary,
+        "runs": runs,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"median first frame of warm runs: {summary['first_paint_since_process_start_ms']:.0f}ms")
+    for package, self_ms in summary["slowest_imports_self_ms"].items():
+        print(f"  import {package:<30} {self_ms:>8.1f}ms")
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
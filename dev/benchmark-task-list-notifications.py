@@ -0,0 +1,160 @@
+# counts the change notifications the todo TaskListModel (src/models/taskListModel.py) sends for common operations and
+# how often they make the TaskList view lay out all of its rows again, and measures how long each operation takes
+# including the layout and painting of the view
+#
+# the list has the given number of root tasks with SUBTASKS_PER_TASK subtasks each. Runs against a throwaway database by
+# pointing XDG_CONFIG_HOME to a temporary directory, so it only works on Linux
+#
+# usage: python dev/benchmark-task-list-notifications.py [root task count]
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="koncentro-benchmark-")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from loguru import logger  # noqa: E402
+from PySide6.QtCore import QModelIndex, Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from models.dbTables import Base, CurrentWorkspace, Task, TaskType, Workspace, engine  # noqa: E402
+from models.taskListModel import TaskListModel  # noqa: E402
+from prefabs.taskList import TaskList  # noqa: E402
+from utils.db_utils import get_session  # noqa: E402
+
+SUBTASKS_PER_TASK = 4
+TICKS = 100
+
+
+class CountingTaskList(TaskList):
+    relayout_count = 0  # a class attribute as the view is laid out while it is built
+
+    def doItemsLayout(self) -> None:
+        self.relayout_count += 1
+        super().doItemsLayout()
+
+
+def seed_tasks(root_count: int) -> None:
+    Base.metadata.create_all(engine)
+    with get_session() as session:
+        workspace = Workspace(workspace_name="Benchmark")
+        session.add(workspace)
+        session.flush()
+        session.add(CurrentWorkspace(current_workspace_id=workspace.id))
+
+        for i in range(root_count):
+            root_id = session.execute(
+                insert(Task).values(
+                    workspace_id=workspace.id,
+                    task_name=f"Task {i}",
+                    task_type=TaskType.TODO,
+                    task_position=i,
+                    elapsed_time=SUBTASKS_PER_TASK * 1000,
+                    is_parent_task=True,
+                    is_expanded=True,
+                )
+            ).inserted_primary_key[0]
+            session.execute(
+                insert(Task),
+                [
+                    {
+                        "workspace_id": workspace.id,
+                        "task_name": f"Task {i}.{j}",
+                        "task_type": TaskType.TODO,
+                        "task_position": j,
+                        "elapsed_time": 1000,
+                        "is_parent_task": False,
+                        "parent_task_id": root_id,
+                    }
+                    for j in range(SUBTASKS_PER_TASK)
+                ],
+            )
+
+
+def main() -> None:
+    root_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    logger.remove()
+    app = QApplication(sys.argv)
+
+    seed_tasks(root_count)
+    model = TaskListModel(TaskType.TODO)
+    view = CountingTaskList()
+    view.setModel(model)
+    view.resize(600, 800)
+    view.show()
+    app.processEvents()
+
+    counts: Dict[str, int] = {}
+
+    def counter(name: str) -> Callable[..., None]:
+        def count(*_args: object) -> None:
+            counts[name] += 1
+
+        return count
+
+    signal_names = ["layoutChanged", "modelReset", "rowsInserted", "rowsRemoved", "rowsMoved", "dataChanged"]
+    for name in signal_names:
+        getattr(model, name).connect(counter(name))
+
+    def collapsed_root() -> QModelIndex:
+        return model.index(root_count // 2, 0)
+
+    def tick_subtask() -> None:
+        index = model.index(0, 0, model.index(1, 0))
+        for _ in range(TICKS):
+            model.setData(
+                index, model.data(index, TaskListModel.ElapsedTimeRole) + 1000, TaskListModel.ElapsedTimeRole, False
+            )
+
+    def tick_subtask_with_event_loop() -> None:
+        index = model.index(0, 0, model.index(1, 0))
+        for _ in range(TICKS):
+            model.setData(
+                index, model.data(index, TaskListModel.ElapsedTimeRole) + 1000, TaskListModel.ElapsedTimeRole, False
+            )
+            app.processEvents()
+
+    operations: List[tuple] = [
+        ("collapse a task", lambda: view.collapse(collapsed_root())),
+        ("expand a task", lambda: view.expand(collapsed_root())),
+        ("add a task", lambda: model.insertRow(model.rowCount(), QModelIndex(), "New task")),
+        ("add a subtask", lambda: model.insertRow(0, model.index(2, 0), "New subtask")),
+        ("rename a task", lambda: model.setData(model.index(3, 0), "Renamed", Qt.ItemDataRole.DisplayRole)),
+        (f"{TICKS} ticks in one event loop turn", tick_subtask),
+        (f"{TICKS} ticks, one per event loop turn", tick_subtask_with_event_loop),
+        ("delete a subtask", lambda: model.deleteTask(0, model.index(2, 0))),
+        ("delete a task", lambda: model.deleteTask(4)),
+        # like TaskListView.onCurrentWorkspaceChanged() did before the model was reset by load_data()
+        ("reload the list", lambda: (model.load_data(), view._restoreExpansionStateOfAllTasks())),
+    ]
+
+    print(f"{root_count} tasks with {SUBTASKS_PER_TASK} subtasks each")
+    print(
+        f"{'operation':40} {'layoutChanged':>13} {'modelReset':>10} {'rows':>5} {'dataChanged':>11} "
+        f"{'relayouts':>9} {'ms':>8}"
+    )
+    for name, operation in operations:
+        for signal_name in signal_names:
+            counts[signal_name] = 0
+        view.relayout_count = 0
+
+        start_time = time.perf_counter()
+        operation()
+        app.processEvents()  # lets the view lay out and paint what changed
+        elapsed_time = (time.perf_counter() - start_time) * 1000
+
+        row_count = counts["rowsInserted"] + counts["rowsRemoved"] + counts["rowsMoved"]
+        print(
+            f"{name:40} {counts['layoutChanged']:>13} {counts['modelReset']:>10} {row_count:>5} "
+            f"{counts['dataChanged']:>11} {view.relayout_count:>9} {elapsed_time:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
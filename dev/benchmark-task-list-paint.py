@@ -0,0 +1,159 @@
+# measures how long the TaskList view takes to paint its rows with TaskListItemDelegate (src/prefabs/
+# taskListItemDelegate.py), scrolling through the whole list page by page and repainting the visible rows while the
+# timer adds time to a task every second
+#
+# the list has the given number of rows, a fifth of them are root tasks and the rest are their subtasks, all of them
+# expanded. Runs against a throwaway database by pointing XDG_CONFIG_HOME to a temporary directory, so it only works on
+# Linux
+#
+# usage: python dev/benchmark-task-list-paint.py [row count]
+import os
+import sys
+import tempfile
+import time
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="koncentro-benchmark-")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from loguru import logger  # noqa: E402
+from PySide6.QtCore import QModelIndex  # noqa: E402
+from PySide6.QtGui import QPainter  # noqa: E402
+from PySide6.QtWidgets import QApplication, QStyleOptionViewItem, QVBoxLayout, QWidget  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from models.dbTables import Base, CurrentWorkspace, Task, TaskType, Workspace, engine  # noqa: E402
+from models.taskListModel import TaskListModel  # noqa: E402
+from prefabs.taskList import TaskList  # noqa: E402
+from prefabs.taskListItemDelegate import TaskListItemDelegate  # noqa: E402
+from utils.db_utils import get_session  # noqa: E402
+
+SUBTASKS_PER_TASK = 4
+REPEATS = 3
+TICKS = 300
+
+
+class TimedTaskListItemDelegate(TaskListItemDelegate):
+    """Adds up the time spent painting rows in the delegate, the rest of a repaint is spent in the view and Qt"""
+
+    paint_time = 0.0
+    paint_count = 0
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        start_time = time.perf_counter()
+        super().paint(painter, option, index)
+        self.paint_time += time.perf_counter() - start_time
+        self.paint_count += 1
+
+    def resetTimes(self) -> None:
+        self.paint_time = 0.0
+        self.paint_count = 0
+
+
+def seed_tasks(row_count: int) -> None:
+    Base.metadata.create_all(engine)
+    with get_session() as session:
+        workspace = Workspace(workspace_name="Benchmark")
+        session.add(workspace)
+        session.flush()
+        session.add(CurrentWorkspace(current_workspace_id=workspace.id))
+
+        for i in range(row_count // (SUBTASKS_PER_TASK + 1)):
+            root_id = session.execute(
+                insert(Task).values(
+                    workspace_id=workspace.id,
+                    task_name=f"Task {i}",
+                    task_type=TaskType.TODO,
+                    task_position=i,
+                    elapsed_time=SUBTASKS_PER_TASK * (i * 7919 % 3_600_000),
+                    target_time=SUBTASKS_PER_TASK * 3_600_000,
+                    is_parent_task=True,
+                    is_expanded=True,
+                )
+            ).inserted_primary_key[0]
+            session.execute(
+                insert(Task),
+                [
+                    {
+                        "workspace_id": workspace.id,
+                        "task_name": f"Subtask {j} of task {i}",
+                        "task_type": TaskType.TODO,
+                        "task_position": j,
+                        "elapsed_time": i * 7919 % 3_600_000,
+                        "target_time": 3_600_000,
+                        "is_parent_task": False,
+                        "parent_task_id": root_id,
+                    }
+                    for j in range(SUBTASKS_PER_TASK)
+                ],
+            )
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    logger.remove()
+    app = QApplication(sys.argv)
+
+    seed_tasks(row_count)
+    model = TaskListModel(TaskType.TODO)
+    # the delegate looks for the pomodoro interface among the children of the main window
+    window = QWidget()
+    window.setObjectName("main_window")
+    view = TaskList(window)
+    delegate = TimedTaskListItemDelegate(view)
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    QVBoxLayout(window).addWidget(view)
+    window.resize(700, 900)
+    window.show()
+    app.processEvents()
+
+    current_index = model.index(0, 0, model.index(0, 0))
+    model.setCurrentTaskID(model.data(current_index, TaskListModel.IDRole))
+    app.processEvents()
+
+    scroll_bar = view.verticalScrollBar()
+    print(f"{row_count} rows, {view.viewport().height()} px high viewport")
+
+    for repeat in range(REPEATS):
+        scroll_bar.setValue(0)
+        app.processEvents()
+        delegate.resetTimes()
+        page_count = 0
+        start_time = time.perf_counter()
+        while True:
+            view.viewport().repaint()
+            page_count += 1
+            if scroll_bar.value() >= scroll_bar.maximum():
+                break
+            scroll_bar.setValue(scroll_bar.value() + scroll_bar.pageStep())
+        scroll_time = time.perf_counter() - start_time
+        print(
+            f"pass {repeat + 1} through {page_count} pages: {scroll_time / page_count * 1000:.2f} ms a page, "
+            f"{delegate.paint_time / delegate.paint_count * 1e6:.0f} µs a row in the delegate"
+        )
+
+    scroll_bar.setValue(0)
+    app.processEvents()
+    delegate.resetTimes()
+    start_time = time.perf_counter()
+    for _ in range(TICKS):
+        model.setData(
+            current_index,
+            model.data(current_index, TaskListModel.ElapsedTimeRole) + 1000,
+            TaskListModel.ElapsedTimeRole,
+            update_db=False,
+        )
+        app.processEvents()  # sends the change to the view
+        view.viewport().repaint()
+    tick_time = time.perf_counter() - start_time
+    print(
+        f"{TICKS} ticks repainting the first page: {tick_time / TICKS * 1000:.2f} ms a tick, "
+        f"{delegate.paint_time / delegate.paint_count * 1e6:.0f} µs a row in the delegate"
+    )
+
+
+if __name__ == "__main__":
+    main()
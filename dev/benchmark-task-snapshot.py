@@ -0,0 +1,142 @@
+# measures how long filling the task lists takes from the database and from the startup snapshot (see
+# src/models/startupSnapshot.py), and how long checking the snapshot against the database takes afterwards
+#
+# every size is the number of tasks in each of the todo and completed lists, a fifth of them are root tasks and the
+# rest are their subtasks. Runs against a throwaway database by pointing XDG_CONFIG_HOME to a temporary directory, so it
+# only works on Linux
+#
+# usage: python dev/benchmark-task-snapshot.py [list size ...]
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+temp_dir = tempfile.mkdtemp(prefix="koncentro-benchmark-")
+os.environ["XDG_CONFIG_HOME"] = temp_dir
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from sqlalchemy import delete, insert  # noqa: E402
+
+from models.config import get_workspace_settings_values  # noqa: E402
+from models.dbTables import Base, CurrentWorkspace, Task, TaskType, Workspace, engine  # noqa: E402
+from models.startupSnapshot import read_startup_snapshot, write_startup_snapshot  # noqa: E402
+from models.taskListModel import TaskListModel, load_task_tree  # noqa: E402
+from utils.db_utils import get_session  # noqa: E402
+
+SUBTASKS_PER_TASK = 4
+
+
+def create_workspace() -> int:
+    Base.metadata.create_all(engine)
+    with get_session() as session:
+        workspace = Workspace(workspace_name="Benchmark")
+        session.add(workspace)
+        session.flush()
+        session.add(CurrentWorkspace(current_workspace_id=workspace.id))
+        return workspace.id
+
+
+def seed_tasks(workspace_id: int, task_type: TaskType, size: int) -> None:
+    with get_session() as session:
+        session.execute(delete(Task).where(Task.task_type == task_type))
+        root_count = size // (SUBTASKS_PER_TASK + 1)
+        roots = [
+            {
+                "workspace_id": workspace_id,
+                "task_name": f"{task_type.name} task {i}",
+                "task_type": task_type,
+                "task_position": i,
+                "elapsed_time": i * 1000,
+                "target_time": i * 2000,
+                "is_parent_task": True,
+                "is_expanded": i % 2 == 0,
+            }
+            for i in range(root_count)
+        ]
+        root_ids = [session.execute(insert(Task).values(**root)).inserted_primary_key[0] for root in roots]
+        session.execute(
+            insert(Task),
+            [
+                {
+                    "workspace_id": workspace_id,
+                    "task_name": f"{task_type.name} subtask {j} of {i}",
+                    "task_type": task_type,
+                    "task_position": j,
+                    "elapsed_time": j * 1000,
+                    "target_time": j * 2000,
+                    "is_parent_task": False,
+                    "parent_task_id": root_id,
+                    "is_expanded": False,
+                }
+                for i, root_id in enumerate(root_ids)
+                for j in range(SUBTASKS_PER_TASK)
+            ],
+        )
+
+
+def timed(function: Callable[[], object], runs: int = 3) -> float:
+    """Returns the fastest of runs calls of function, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return min(timings)
+
+
+def main() -> None:
+    list_sizes = [int(size) for size in sys.argv[1:]] or [1_000, 10_000, 50_000]
+
+    workspace_id = create_workspace()
+
+    snapshot_path = os.path.join(temp_dir, "startup-snapshot.bin")
+    columns = ["load from db", "write snapshot", "load snapshot", "check, same", "check, 1 changed", "check, moved"]
+    print(f"{'tasks':>8} {'snapshot size':>14} " + " ".join(f"{column:>17}" for column in columns))
+
+    for size in list_sizes:
+        for task_type in (TaskType.TODO, TaskType.COMPLETED):
+            seed_tasks(workspace_id, task_type, size)
+        models = {task_type: TaskListModel(task_type) for task_type in (TaskType.TODO, TaskType.COMPLETED)}
+        todo_model = models[TaskType.TODO]
+
+        def write_snapshot() -> None:
+            write_startup_snapshot(
+                snapshot_path,
+                workspace_id,
+                get_workspace_settings_values(),
+                {task_type: model.task_tree() for task_type, model in models.items()},
+            )
+
+        def load_snapshot() -> None:
+            snapshot = read_startup_snapshot(snapshot_path)
+            for task_type, model in models.items():
+                model._set_task_tree(snapshot.takeTaskTree(task_type))
+
+        timings: Dict[str, float] = {
+            "load from db": timed(lambda: [model.load_data() for model in models.values()]),
+            "write snapshot": timed(write_snapshot),
+            "load snapshot": timed(load_snapshot),
+        }
+
+        # what reconcile_with_db() does for the todo list, minus waiting for the background thread
+        db_task_tree = load_task_tree(TaskType.TODO, workspace_id)
+        timings["check, same"] = timed(lambda: todo_model.apply_task_tree(load_task_tree(TaskType.TODO, workspace_id)))
+
+        changed_task_tree = list(db_task_tree)
+        root_record, child_records = changed_task_tree[0]
+        changed_task_tree[0] = (root_record._replace(elapsed_time=root_record.elapsed_time + 1), child_records)
+        timings["check, 1 changed"] = timed(lambda: todo_model.apply_task_tree(changed_task_tree), runs=1)
+
+        moved_task_tree: List = changed_task_tree[1:] + changed_task_tree[:1]
+        timings["check, moved"] = timed(lambda: todo_model.apply_task_tree(moved_task_tree), runs=1)
+        assert todo_model.task_tree()[0][0].task_id == moved_task_tree[0][0].task_id
+
+        snapshot_size = os.path.getsize(snapshot_path) / 1024
+        print(f"{size:>8} {snapshot_size:>12.0f}KB " + " ".join(f"{timings[column]:>15.1f}ms" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# measures how long WebsiteListManager.update_target_list_urls() takes to save blocklists of different sizes
+#
+# runs against a throwaway database by pointing XDG_CONFIG_HOME to a temporary directory, so it only works on Linux
+#
+# usage: python dev/benchmark-website-list-save.py [list size ...]
+import os
+import sys
+import tempfile
+import time
+
+temp_dir = tempfile.mkdtemp(prefix="koncentro-benchmark-")
+os.environ["XDG_CONFIG_HOME"] = temp_dir
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from constants import URLListType  # noqa: E402
+from models.dbTables import Base, CurrentWorkspace, Workspace, engine  # noqa: E402
+from models.websiteListManagerModel import WebsiteListManager  # noqa: E402
+from utils.db_utils import get_session  # noqa: E402
+
+
+def create_workspace() -> None:
+    Base.metadata.create_all(engine)
+    with get_session() as session:
+        workspace = Workspace(workspace_name="Benchmark")
+        session.add(workspace)
+        session.flush()
+        session.add(CurrentWorkspace(current_workspace_id=workspace.id))
+
+
+def main() -> None:
+    list_sizes = [int(size) for size in sys.argv[1:]] or [1_000, 20_000, 100_000]
+
+    create_workspace()
+    manager = WebsiteListManager()
+
+    print(f"{'urls':>8} {'save new list':>15} {'replace half':>15} {'clear list':>15}")
+    for size in list_sizes:
+        urls = {f"site{i}.example.com" for i in range(size)}
+        half_replaced_urls = {url for i, url in enumerate(sorted(urls)) if i % 2} | {
+            f"other{i}.example.com" for i in range(size // 2)
+        }
+
+        timings = []
+        for new_urls in (urls, half_replaced_urls, set()):
+            start_time = time.perf_counter()
+            manager.update_target_list_urls(URLListType.BLOCKLIST, new_urls)
+            timings.append(time.perf_counter() - start_time)
+            assert manager.get_urls(URLListType.BLOCKLIST) == new_urls
+
+        print(f"{size:>8} " + " ".join(f"{timing:>14.3f}s" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# checks what the app imports before it starts doing anything, using python -X importtime
+#
+# the imports of src/__main__.py (which include mainWindow and everything it imports) are run without starting the app,
+# with a throwaway config directory. The check fails if
+#   - a module which should only be imported on first use (see DEFERRED_MODULES) is imported
+#   - more modules than MODULE_COUNT_BUDGET are imported
+#   - the median of the total import time of --runs runs is more than --budget-ms
+#
+# the time budget depends on the machine, it was set with some headroom on a fast desktop, pass a larger --budget-ms on
+# slower machines or --no-time-budget to only run the checks which don't depend on the machine
+#
+# usage: python dev/check-import-time.py [--runs N] [--budget-ms MS] [--no-time-budget]
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import List, Tuple
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.normpath(os.path.join(script_dir, "../src"))
+
+# imported where they are used, importing them at startup costs time even when they end up not being used, like the
+# website blocker libraries when the website blocker is disabled for the current workspace
+DEFERRED_MODULES = [
+    "alembic",  # only needed when the database isn't at the latest revision
+    "certifi",
+    "http.client",
+    "psutil",
+    "semver",
+    "uniproxy",
+    "urllib.request",
+    "validators",
+]
+MODULE_COUNT_BUDGET = 650
+TIME_BUDGET_MS = 1300
+
+IMPORT_CODE = "import runpy; runpy.run_path('__main__.py', run_name='koncentro_import_check')"
+
+
+def run_imports() -> List[Tuple[str, int]]:
+    """Returns (module, self time in us) for every module imported, in the order -X importtime prints them"""
+    with tempfile.TemporaryDirectory(prefix="koncentro-import-check-") as config_dir:
+        env = dict(os.environ)
+        env.update({"QT_QPA_PLATFORM": "offscreen", "XDG_CONFIG_HOME": config_dir, "HOME": config_dir})
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT_CODE],
+            cwd=src_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _cumulative, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_time)))
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=TIME_BUDGET_MS)
+    parser.add_argument("--no-time-budget", action="store_true")
+    args = parser.parse_args()
+
+    runs = [run_imports() for _ in range(1 if args.no_time_budget else args.runs)]
+    imports = runs[0]
+    imported_modules = {module for module, _self_time in imports}
+    errors = []
+
+    for module in DEFERRED_MODULES:
+        if module in imported_modules:
+            errors.append(f"{module} is imported at startup, it should only be imported where it is used")
+
+    print(f"modules imported: {len(imports)} (budget {MODULE_COUNT_BUDGET})")
+    if len(imports) > MODULE_COUNT_BUDGET:
+        errors.append(f"{len(imports)} modules are imported at startup, budget is {MODULE_COUNT_BUDGET}")
+
+    if not args.no_time_budget:
+        total_ms = statistics.median(sum(self_time for _module, self_time in run) / 1000 for run in runs)
+        print(f"total import time: {total_ms:.0f}ms, median of {len(runs)} runs (budget {args.budget_ms:.0f}ms)")
+        if total_ms > args.budget_ms:
+            errors.append(f"imports take {total_ms:.0f}ms, budget is {args.budget_ms:.0f}ms")
+
+    # top level packages sorted by self time of all their modules, to find what to look at when over budget
+    package_times = {}
+    for module, self_time in imports:
+        package = module.split(".")[0]
+        package_times[package] = package_times.get(package, 0) + self_time
+    print("slowest packages:")
+    for package, self_time in sorted(package_times.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {package:<30} {self_time / 1000:>8.1f}ms")
+
+    if errors:
+        print("\n".join(errors))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# runs the pomodoro timer (src/models/timer.py) against a fake clock for hours of simulated time, with every tick waking
+# up late by a random amount like it does in a busy event loop, now and then a stall of a few seconds, a slightly early
+# wakeup or a pause. The event loop isn't run, every tick is delivered by advancing the clock to when the timer asked
+# to be woken up plus the lateness and calling its timeout slot. The check fails if
+#   - a duration doesn't end at the time it would end at with punctual ticks, give or take the lateness of the tick
+#     which notices it. These times are worked out from the durations and pauses alone, so any drift would add up
+#   - the shown remaining time is ever more than a tick off the actual remaining time
+#   - the time reported by timeElapsedSignal for work durations doesn't add up to the time the timer ran in them, to
+#     the millisecond
+#
+# it also prints how far behind a timer which takes 1000 ms off on every tick would have fallen with the same ticks
+#
+# usage: python dev/check-timer-drift.py [--hours H] [--seed N]
+import argparse
+import os
+import random
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Dict, List
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="koncentro-timer-check-")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from loguru import logger  # noqa: E402
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from configValues import ConfigValues  # noqa: E402
+from constants import TIMER_EARLY_WAKEUP_TOLERANCE, TimerState  # noqa: E402
+from models.timer import PomodoroTimer  # noqa: E402
+
+# in minutes, odd values so that durations don't line up with each other
+WORK_DURATION = 25
+BREAK_DURATION = 7
+LONG_BREAK_DURATION = 13
+WORK_INTERVALS = 3
+
+PAUSE_PROBABILITY = 0.0005  # per tick
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000  # in ms, not 0 to catch code which treats the clock as time since start
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def get_duration(timer_state: TimerState) -> int:
+    minutes = {
+        TimerState.WORK: WORK_DURATION,
+        TimerState.BREAK: BREAK_DURATION,
+        TimerState.LONG_BREAK: LONG_BREAK_DURATION,
+    }[timer_state]
+    return minutes * 60 * 1000
+
+
+def get_lateness(rng: random.Random) -> int:
+    """How late a tick wakes up in ms, negative if it wakes up early"""
+    roll = rng.random()
+    if roll < 0.03:
+        return -rng.randint(1, TIMER_EARLY_WAKEUP_TOLERANCE)
+    if roll < 0.035:
+        return rng.randint(500, 5000)  # the event loop was blocked
+    if roll < 0.135:
+        return rng.randint(30, 300)
+    return rng.randint(0, 30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=12)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logger.remove()  # the timer logs every change of duration
+    rng = random.Random(args.seed)
+    _app = QCoreApplication(sys.argv)  # for the QTimer of PomodoroTimer, its event loop is never run
+
+    ConfigValues.WORK_DURATION = WORK_DURATION
+    ConfigValues.BREAK_DURATION = BREAK_DURATION
+    ConfigValues.LONG_BREAK_DURATION = LONG_BREAK_DURATION
+    ConfigValues.WORK_INTERVALS = WORK_INTERVALS
+    ConfigValues.AUTOSTART_WORK = True
+    ConfigValues.AUTOSTART_BREAK = True
+
+    clock = FakeClock()
+    timer = PomodoroTimer(clock, wall_clock=clock)
+    elapsed_times: Dict[TimerState, int] = defaultdict(int)
+
+    def onTimeElapsed(timer_state: TimerState, elapsed_time: int) -> None:
+        elapsed_times[timer_state] += elapsed_time
+
+    timer.timeElapsedSignal.connect(onTimeElapsed)
+
+    errors: List[str] = []
+    end_time = clock.now + int(args.hours * 60 * 60 * 1000)
+
+    timer.updateSessionProgress()
+    timer.setDuration()
+    timer.startDuration()
+
+    # what the timer should do, worked out from the durations and pauses only
+    deadline = clock.now + get_duration(timer.getTimerState())
+    running_since = clock.now  # start of the current stretch of running time
+    expected_work_time = 0
+    durations_ended = 0
+    pauses = 0
+    ticks = 0
+    total_lateness = 0
+    max_end_lateness = 0
+    max_remaining_time_error = 0
+
+    while clock.now < end_time:
+        timer_state = timer.getTimerState()
+
+        if rng.random() < PAUSE_PROBABILITY:
+            pause_time = clock.now + rng.randint(0, timer.pomodoro_timer.interval())
+            if pause_time < deadline - TIMER_EARLY_WAKEUP_TOLERANCE:
+                clock.now = pause_time
+                timer.pauseDuration()
+                if timer_state == TimerState.WORK:
+                    expected_work_time += clock.now - running_since
+                remaining_time = deadline - clock.now
+
+                clock.now += rng.randint(1_000, 600_000)
+                # resumed like the pause/resume button does
+                timer.setDuration()
+                timer.startDuration()
+                deadline = clock.now + remaining_time
+                running_since = clock.now
+                pauses += 1
+
+        lateness = get_lateness(rng)
+        clock.now += max(timer.pomodoro_timer.interval() + lateness, 0)
+        total_lateness += max(lateness, 0)
+        ticks += 1
+        timer.decreaseRemainingTime()
+
+        if clock.now >= deadline - TIMER_EARLY_WAKEUP_TOLERANCE:
+            # this tick has to end the duration
+            if timer.getTimerState() == timer_state:
+                errors.append(f"{timer_state.name} didn't end at {clock.now}, {clock.now - deadline} ms after deadline")
+                break
+            max_end_lateness = max(max_end_lateness, clock.now - deadline)
+            if timer_state == TimerState.WORK:
+                expected_work_time += deadline - running_since
+            running_since = deadline
+            deadline += get_duration(timer.getTimerState())
+            durations_ended += 1
+        elif timer.getTimerState() != timer_state:
+            errors.append(f"{timer_state.name} ended at {clock.now}, {deadline - clock.now} ms before deadline")
+            break
+
+        # the shown remaining time is the actual one rounded up to a whole tick
+        remaining_time_error = timer.getRemainingTime() - (deadline - clock.now)
+        max_remaining_time_error = max(max_remaining_time_error, abs(remaining_time_error))
+        if not -TIMER_EARLY_WAKEUP_TOLERANCE <= remaining_time_error <= timer.timer_resolution:
+            errors.append(f"shown remaining time is {remaining_time_error} ms off at {clock.now}")
+
+    clock.now += rng.randint(0, timer.pomodoro_timer.interval())
+    if timer.getTimerState() == TimerState.WORK:
+        expected_work_time += clock.now - running_since
+    timer.stopSession()
+
+    if elapsed_times[TimerState.WORK] != expected_work_time:
+        errors.append(
+            f"reported work time is {elapsed_times[TimerState.WORK] - expected_work_time} ms off "
+            f"({elapsed_times[TimerState.WORK]} ms instead of {expected_work_time} ms)"
+        )
+
+    print(f"simulated {args.hours} hours: {ticks} ticks, {durations_ended} durations ended, {pauses} pauses")
+    print(f"  latest end of a duration after its deadline: {max_end_lateness} ms")
+    print(f"  largest difference of shown and actual remaining time: {max_remaining_time_error} ms")
+    print(f"  reported work time: {elapsed_times[TimerState.WORK]} ms, expected {expected_work_time} ms")
+    print(f"  a timer taking 1000 ms off per tick would have fallen behind by {total_lateness / 1000:.1f} s")
+
+    for error in errors[:20]:
+        print(f"error: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+# kills a process which writes the timer journal (see src/models/timerJournal.py) with SIGKILL at random points and
+# checks that what the next start recovers from the journal is consistent. Every round runs one of two writers:
+#   - ticking: a pomodoro timer with short ticks runs a work duration on a subtask like the app does, recording a work
+#     interval and checkpointing on every tick. After the kill, the checkpoint is recovered into the database and the
+#     check fails if
+#       - the time added to the subtask and its parent task isn't the time of the interval in the checkpoint
+#       - the interval isn't ended at its start plus that time
+#       - the credited time is more than the timer ran, or more than a tick and some slack less than that
+#       - the remaining time in the checkpoint and the credited time don't add up to the duration, to the millisecond
+#       - recovering the same checkpoint again changes anything
+#   - flooding: checkpoints are written in a tight loop, so that the kill can land in the middle of one. The check
+#     fails if the newest intact checkpoint isn't one which was written whole. As a kill rarely lands in the middle of
+#     copying a few bytes, the start of the next checkpoint is then written over the slot it would go to, and the check
+#     fails if the checkpoint before it isn't read
+#
+# runs against a throwaway database by pointing XDG_CONFIG_HOME to a temporary directory, so it only works on Linux
+#
+# usage: python dev/check-timer-journal-recovery.py [--rounds N] [--seed N]
+import argparse
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+if "--child" not in sys.argv:  # the writers use the directory of the check
+    os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="koncentro-journal-check-")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from loguru import logger  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from configValues import ConfigValues  # noqa: E402
+from constants import TimerState  # noqa: E402
+from models.dbTables import Base, CurrentWorkspace, Task, TaskType, WorkInterval, Workspace, engine  # noqa: E402
+from models.timerJournal import (  # noqa: E402
+    _RECORD,
+    TimerCheckpoint,
+    TimerJournal,
+    _pack,
+    _unpack,
+    now_ms,
+    read_timer_journal,
+    recover_tracked_time,
+)
+from models.workIntervalRecorder import WorkIntervalRecorder  # noqa: E402
+from utils.db_utils import get_session  # noqa: E402
+
+TICK = 50  # in ms, timer_resolution of the ticking writer
+DURATION = 60 * 1000  # in ms, longer than any round so that the duration doesn't end
+# in ms, how much less than the time the timer ran may be credited besides the tick which was cut off, for the time
+# the writer takes to start the timer after reporting that it has and for ticks waking up late on a busy machine
+SLACK = 100
+
+FLOOD_TASK_IDS = (1_000_001, 1_000_002)
+
+
+def flood_checkpoint(i: int) -> TimerCheckpoint:
+    """Checkpoint whose values are all worked out from i, so that a mix of two checkpoints is noticed"""
+    return TimerCheckpoint(
+        written_at=i,
+        is_clean_exit=False,
+        timer_state=TimerState.WORK,
+        is_running=True,
+        session_progress=(i % 8) / 2,
+        sessions_completed=i % 1000,
+        remaining_time=10**9 - i,
+        workspace_id=i % 7,
+        current_task_id=i % 11,
+        interval_id=i,
+        interval_elapsed_time=3 * i,
+        task_elapsed_times={FLOOD_TASK_IDS[0]: 5 * i, FLOOD_TASK_IDS[1]: 7 * i},
+    )
+
+
+def run_flooding_writer(journal_path: str) -> None:
+    journal = TimerJournal(journal_path)
+    i = 0
+    while True:
+        i += 1
+        journal.write(flood_checkpoint(i))
+        if i == 1:
+            print("started", flush=True)
+
+
+def run_ticking_writer(journal_path: str, task_id: int, parent_task_id: int) -> None:
+    from PySide6.QtCore import QCoreApplication
+
+    from models.timer import PomodoroTimer
+
+    app = QCoreApplication(sys.argv)
+    ConfigValues.WORK_DURATION = DURATION // 60 // 1000
+
+    with get_session(is_read_only=True) as session:
+        task_elapsed_times: Dict[int, int] = {
+            task.id: task.elapsed_time
+            for task in session.scalars(select(Task).where(Task.id.in_([task_id, parent_task_id])))
+        }
+
+    timer = PomodoroTimer()
+    timer.timer_resolution = TICK
+    recorder = WorkIntervalRecorder()
+    journal = TimerJournal(journal_path)
+
+    def checkpoint() -> None:
+        journal.write(
+            TimerCheckpoint(
+                written_at=now_ms(),
+                is_clean_exit=False,
+                timer_state=timer.getTimerState(),
+                is_running=timer.isTicking(),
+                session_progress=timer.getSessionProgress(),
+                sessions_completed=timer.getSessionsCompleted(),
+                remaining_time=timer.getExactRemainingTime(),
+                workspace_id=None,
+                current_task_id=task_id,
+                interval_id=recorder.interval_id,
+                interval_elapsed_time=recorder.elapsed_time,
+                task_elapsed_times=dict(task_elapsed_times),
+            )
+        )
+
+    def onTimeElapsed(timer_state: TimerState, elapsed_time: int) -> None:
+        if timer_state == TimerState.WORK:
+            recorder.addElapsedTime(elapsed_time)
+            for elapsed_task_id in task_elapsed_times:
+                task_elapsed_times[elapsed_task_id] += elapsed_time
+        checkpoint()
+
+    timer.timeElapsedSignal.connect(onTimeElapsed)
+
+    timer.updateSessionProgress()
+    timer.setDuration()
+    recorder.startInterval(task_id)
+    timer.startDuration()
+    checkpoint()
+    print(f"started {timer._last_elapsed_time}", flush=True)
+    app.exec()
+
+
+def create_tasks() -> Tuple[int, int]:
+    """Returns the ids of a subtask and its parent task"""
+    Base.metadata.create_all(engine)
+    with get_session() as session:
+        workspace = Workspace(workspace_name="Journal check")
+        session.add(workspace)
+        session.flush()
+        session.add(CurrentWorkspace(current_workspace_id=workspace.id))
+        parent_task = Task(
+            workspace_id=workspace.id,
+            task_name="Parent",
+            task_type=TaskType.TODO,
+            task_position=0,
+            elapsed_time=0,
+            is_parent_task=True,
+        )
+        session.add(parent_task)
+        session.flush()
+        task = Task(
+            workspace_id=workspace.id,
+            task_name="Subtask",
+            task_type=TaskType.TODO,
+            task_position=0,
+            elapsed_time=0,
+            is_parent_task=False,
+            parent_task_id=parent_task.id,
+        )
+        session.add(task)
+        session.flush()
+        return task.id, parent_task.id
+
+
+def get_elapsed_times(task_ids: Tuple[int, int]) -> Dict[int, int]:
+    with get_session(is_read_only=True) as session:
+        return {task.id: task.elapsed_time for task in session.scalars(select(Task).where(Task.id.in_(task_ids)))}
+
+
+def get_interval_lengths() -> Dict[int, int]:
+    """Length of every ended work interval in ms by id"""
+    with get_session(is_read_only=True) as session:
+        return {
+            work_interval.id: (work_interval.ended_at - work_interval.started_at) // timedelta(milliseconds=1)
+            for work_interval in session.scalars(select(WorkInterval).where(WorkInterval.ended_at.is_not(None)))
+        }
+
+
+def start_writer(mode: str, journal_path: str, task_ids: Tuple[int, int]) -> Tuple[subprocess.Popen, int]:
+    """Starts a writer and returns it with the monotonic time in ms at which its timer started, if it has one"""
+    writer = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, journal_path, *map(str, task_ids)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    # qfluentwidgets prints a tip when it is imported
+    for line in writer.stdout:
+        if line.startswith("started"):
+            words = line.split()
+            return writer, int(words[1]) if len(words) > 1 else 0
+    writer.kill()
+    raise RuntimeError(f"{mode} writer didn't start")
+
+
+def count_torn_slots(journal_path: str) -> int:
+    with open(journal_path, "rb") as journal_file:
+        data = journal_file.read()
+    return sum(_unpack(data[slot * _RECORD.size : (slot + 1) * _RECORD.size]) is None for slot in range(2))
+
+
+def tear_next_write(rng: random.Random, journal_path: str) -> int:
+    """
+    Writes the start of the next checkpoint of the flooding writer over the slot it would go to, like a kill in the
+    middle of copying it would leave it, as a kill rarely lands there. Returns the i of the checkpoint torn
+    """
+    with open(journal_path, "rb") as journal_file:
+        data = journal_file.read()
+    sequence, checkpoint = max(
+        filter(None, (_unpack(data[slot * _RECORD.size : (slot + 1) * _RECORD.size]) for slot in range(2))),
+        key=lambda record: record[0],
+    )
+    offset = ((sequence + 1) % 2) * _RECORD.size
+    torn_data = _pack(sequence + 1, flood_checkpoint(checkpoint.written_at + 1))[: rng.randint(1, _RECORD.size - 1)]
+    with open(journal_path, "r+b") as journal_file:
+        journal_file.seek(offset)
+        journal_file.write(torn_data)
+    return checkpoint.written_at + 1
+
+
+def check_ticking_round(
+    rng: random.Random, journal_path: str, task_ids: Tuple[int, int], errors: List[str]
+) -> Tuple[int, int]:
+    """Returns the credited time and how much less it is than the time the timer ran"""
+    elapsed_times_before = get_elapsed_times(task_ids)
+    writer, started_at = start_writer("ticking", journal_path, task_ids)
+    time.sleep(rng.uniform(0.01, 1.5))
+    killed_at = time.monotonic_ns() // 1_000_000
+    os.kill(writer.pid, signal.SIGKILL)
+    writer.wait()
+
+    checkpoint = read_timer_journal(journal_path)
+    if checkpoint is None or checkpoint.is_clean_exit or checkpoint.interval_id is None:
+        errors.append(f"no unfinished checkpoint with an open interval after the kill: {checkpoint}")
+        return 0, 0
+
+    credited_time = checkpoint.interval_elapsed_time
+    ran_time = killed_at - started_at
+    if checkpoint.remaining_time + credited_time != DURATION:
+        errors.append(f"remaining time {checkpoint.remaining_time} and credited time {credited_time} don't add up")
+    if not ran_time - TICK - SLACK <= credited_time <= ran_time:
+        errors.append(f"credited {credited_time} ms after the timer ran for {ran_time} ms")
+
+    recover_tracked_time(checkpoint)
+    elapsed_times = get_elapsed_times(task_ids)
+    for task_id in task_ids:
+        if elapsed_times[task_id] != elapsed_times_before[task_id] + credited_time:
+            errors.append(
+                f"task {task_id} went from {elapsed_times_before[task_id]} to {elapsed_times[task_id]} ms instead of "
+                f"by {credited_time} ms"
+            )
+    interval_length = get_interval_lengths().get(checkpoint.interval_id)
+    if interval_length != credited_time:
+        errors.append(f"interval {checkpoint.interval_id} is {interval_length} ms long instead of {credited_time} ms")
+
+    interval_lengths = get_interval_lengths()
+    recover_tracked_time(checkpoint)
+    if get_elapsed_times(task_ids) != elapsed_times or get_interval_lengths() != interval_lengths:
+        errors.append("recovering the same checkpoint twice changed the database")
+
+    return credited_time, ran_time - credited_time
+
+
+def check_flooding_round(rng: random.Random, journal_path: str, errors: List[str]) -> int:
+    """Returns the number of torn slots found"""
+    writer, _ = start_writer("flooding", journal_path, (0, 0))
+    time.sleep(rng.uniform(0.001, 0.05))
+    os.kill(writer.pid, signal.SIGKILL)
+    writer.wait()
+
+    checkpoint = read_timer_journal(journal_path)
+    if checkpoint is None:
+        errors.append("no intact checkpoint after the kill")
+    elif checkpoint != flood_checkpoint(checkpoint.written_at):
+        errors.append(f"checkpoint {checkpoint.written_at} was read half written")
+    torn_slots = count_torn_slots(journal_path)
+
+    torn_i = tear_next_write(rng, journal_path)
+    checkpoint = read_timer_journal(journal_path)
+    if checkpoint != flood_checkpoint(torn_i - 1):
+        errors.append(f"checkpoint {torn_i - 1} wasn't read after tearing the write of the next one")
+    return torn_slots
+
+
+def main() -> None:
+    if "--child" in sys.argv:
+        mode, journal_path, task_id, parent_task_id = sys.argv[sys.argv.index("--child") + 1 :]
+        logger.remove()
+        if mode == "flooding":
+            run_flooding_writer(journal_path)
+        else:
+            run_ticking_writer(journal_path, int(task_id), int(parent_task_id))
+        return
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logger.remove()
+    rng = random.Random(args.seed)
+    task_ids = create_tasks()
+    journal_path = os.path.join(os.environ["XDG_CONFIG_HOME"], "timer-journal.bin")
+
+    errors: List[str] = []
+    total_credited_time = 0
+    max_lost_time = 0
+    torn_slots = 0
+    for round_number in range(args.rounds):
+        if round_number % 2 == 0:
+            credited_time, lost_time = check_ticking_round(rng, journal_path, task_ids, errors)
+            total_credited_time += credited_time
+            max_lost_time = max(max_lost_time, lost_time)
+        else:
+            torn_slots += check_flooding_round(rng, journal_path, errors)
+
+    print(f"killed {args.rounds} writers at random points")
+    print(f"  ticking: {total_credited_time} ms credited, at most {max_lost_time} ms lost in one kill")
+    print(f"  flooding: {torn_slots} slots torn by a kill found and skipped, {args.rounds // 2} torn on purpose")
+
+    for error in errors[:20]:
+        print(f"error: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+# runs the pomodoro timer (src/models/timer.py), the todo task list model and the task time accounting with its
+# persistence (src/models/taskTimeTracker.py) for days of simulated time in a few seconds. Nothing waits for real time,
+# the timers of PomodoroTimer are made by a factory which fires them when the simulation advances a fake clock to when
+# they are due, plus some lateness. A simulated user picks tasks, pauses, resumes, skips and now and then stops the
+# session. The check fails if
+#   - the time reported by timeElapsedSignal and the time the timer was paused or stopped don't add up to the simulated
+#     time, to the millisecond
+#   - the work time reported isn't the time added to the tasks in the model and in the database, and the time of the
+#     work intervals in the database, to the millisecond
+#   - the elapsed time of a task with subtasks isn't the sum of the time of its subtasks, in the model or the database
+#   - a work duration isn't followed by a long break when it is the WORK_INTERVALS-th since the session started or the
+#     last long break, and by a break otherwise, or if a work duration runs longer than WORK_DURATION
+#
+# it also reports how fast the simulation ran and how many database writes and how much CPU time a simulated hour took.
+# Runs against a throwaway database by pointing XDG_CONFIG_HOME to a temporary directory, so it only works on Linux
+#
+# usage: python dev/simulate-pomodoro-day.py [--hours H] [--seed N]
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="koncentro-simulation-")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.normpath(os.path.join(script_dir, "../src")))
+
+from loguru import logger  # noqa: E402
+from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal  # noqa: E402
+from sqlalchemy import event, select  # noqa: E402
+
+from configValues import ConfigValues  # noqa: E402
+from constants import TimerState  # noqa: E402
+from models.dbTables import Base, CurrentWorkspace, Task, TaskType, WorkInterval, Workspace, engine  # noqa: E402
+from models.taskListModel import TaskListModel  # noqa: E402
+from models.taskTimeTracker import TaskTimeTracker  # noqa: E402
+from models.timer import PomodoroTimer  # noqa: E402
+from models.timerJournal import TimerJournal  # noqa: E402
+from utils.db_utils import get_session  # noqa: E402
+
+WORK_DURATION = 25
+BREAK_DURATION = 5
+LONG_BREAK_DURATION = 15
+WORK_INTERVALS = 4
+
+# per tick
+SWITCH_TASK_PROBABILITY = 0.0005
+PAUSE_PROBABILITY = 0.0003
+SKIP_PROBABILITY = 0.0001
+STOP_PROBABILITY = 0.00002
+
+ROOT_TASKS_WITH_SUBTASKS = 4
+SUBTASKS_PER_TASK = 3
+ROOT_TASKS_WITHOUT_SUBTASKS = 3
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000  # in ms
+
+    def __call__(self) -> int:
+        return self.now
+
+
+class SimulatedTimer(QObject):
+    """Stands in for the QTimer of PomodoroTimer, fired by the simulation instead of an event loop"""
+
+    timeout = Signal()
+
+    def __init__(self, clock: FakeClock) -> None:
+        super().__init__()
+        self.clock = clock
+        self.due_at: Optional[int] = None
+        self._interval = 0
+
+    def setSingleShot(self, _is_single_shot: bool) -> None:
+        pass
+
+    def setTimerType(self, _timer_type: Qt.TimerType) -> None:
+        pass
+
+    def start(self, interval: int) -> None:
+        self._interval = interval
+        self.due_at = self.clock.now + interval
+
+    def stop(self) -> None:
+        self.due_at = None
+
+    def isActive(self) -> bool:
+        return self.due_at is not None
+
+    def interval(self) -> int:
+        return self._interval
+
+    def fire(self) -> None:
+        self.due_at = None  # single shot
+        self.timeout.emit()
+
+
+def get_lateness(rng: random.Random) -> int:
+    """How late a tick wakes up in ms"""
+    roll = rng.random()
+    if roll < 0.002:
+        return rng.randint(500, 5000)  # the event loop was blocked
+    if roll < 0.1:
+        return rng.randint(30, 300)
+    return rng.randint(0, 30)
+
+
+def create_tasks() -> int:
+    """Creates a workspace with tasks with and without subtasks, returns the id of the workspace"""
+    Base.metadata.create_all(engine)
+    with get_session() as session:
+        workspace = Workspace(workspace_name="Simulation")
+        session.add(workspace)
+        session.flush()
+        session.add(CurrentWorkspace(current_workspace_id=workspace.id))
+
+        position = 0
+        for i in range(ROOT_TASKS_WITH_SUBTASKS + ROOT_TASKS_WITHOUT_SUBTASKS):
+            subtask_count = SUBTASKS_PER_TASK if i < ROOT_TASKS_WITH_SUBTASKS else 0
+            root_task = Task(
+                workspace_id=workspace.id,
+                task_name=f"Task {i}",
+                task_type=TaskType.TODO,
+                task_position=position,
+                elapsed_time=sum(1000 * (j + 1) for j in range(subtask_count)) if subtask_count else 5000,
+                is_parent_task=True,
+            )
+            session.add(root_task)
+            session.flush()
+            position += 1
+            for j in range(subtask_count):
+                session.add(
+                    Task(
+                        workspace_id=workspace.id,
+                        task_name=f"Task {i}.{j}",
+                        task_type=TaskType.TODO,
+                        task_position=position,
+                        elapsed_time=1000 * (j + 1),
+                        is_parent_task=False,
+                        parent_task_id=root_task.id,
+                    )
+                )
+                position += 1
+        return workspace.id
+
+
+def get_db_elapsed_times() -> Dict[int, int]:
+    with get_session(is_read_only=True) as session:
+        return {task.id: task.elapsed_time for task in session.scalars(select(Task))}
+
+
+def get_db_interval_time() -> int:
+    with get_session(is_read_only=True) as session:
+        return sum(
+            (work_interval.ended_at - work_interval.started_at) // timedelta(milliseconds=1)
+            for work_interval in session.scalars(select(WorkInterval))
+        )
+
+
+def check_parent_times(elapsed_times: Dict[int, int], children: Dict[int, List[int]], where: str) -> List[str]:
+    return [
+        f"task {parent_id} has {elapsed_times[parent_id]} ms in the {where}, its subtasks "
+        f"{sum(elapsed_times[child_id] for child_id in child_ids)} ms"
+        for parent_id, child_ids in children.items()
+        if elapsed_times[parent_id] != sum(elapsed_times[child_id] for child_id in child_ids)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logger.remove()  # the timer and the recorder log every change
+    rng = random.Random(args.seed)
+    _app = QCoreApplication(sys.argv)  # for the signals of the models, its event loop is never run
+
+    ConfigValues.WORK_DURATION = WORK_DURATION
+    ConfigValues.BREAK_DURATION = BREAK_DURATION
+    ConfigValues.LONG_BREAK_DURATION = LONG_BREAK_DURATION
+    ConfigValues.WORK_INTERVALS = WORK_INTERVALS
+    ConfigValues.AUTOSTART_WORK = True
+    ConfigValues.AUTOSTART_BREAK = True
+
+    workspace_id = create_tasks()
+    todo_model = TaskListModel(TaskType.TODO)
+    # tasks the user works on, a task with subtasks gets its time from them
+    children = {node.task_id: [child.task_id for child in node.children] for node in todo_model.root_nodes}
+    children = {parent_id: child_ids for parent_id, child_ids in children.items() if child_ids}
+    workable_task_ids = [
+        task_id
+        for node in todo_model.root_nodes
+        for task_id in ([child.task_id for child in node.children] or [node.task_id])
+    ]
+    db_elapsed_times_before = get_db_elapsed_times()
+
+    clock = FakeClock()
+    timer = PomodoroTimer(clock, wall_clock=clock, timer_factory=lambda: SimulatedTimer(clock))
+    tracker = TaskTimeTracker(
+        timer, todo_model, TimerJournal(os.path.join(os.environ["XDG_CONFIG_HOME"], "timer-journal.bin")), workspace_id
+    )
+
+    db_writes = 0
+
+    def countWrite(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        nonlocal db_writes
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+            db_writes += 1
+
+    event.listen(engine, "before_cursor_execute", countWrite)
+
+    reported_times: Dict[TimerState, int] = {timer_state: 0 for timer_state in TimerState}
+    errors: List[str] = []
+    works_since_long_break = 0
+    durations_ended = 0
+    time_in_timer_state = 0  # catches a work duration which is followed by another without a break
+
+    def onTimeElapsed(timer_state: TimerState, elapsed_time: int) -> None:
+        nonlocal time_in_timer_state
+        reported_times[timer_state] += elapsed_time
+        time_in_timer_state += elapsed_time
+        if timer_state == TimerState.WORK and time_in_timer_state > WORK_DURATION * 60 * 1000:
+            errors.append(f"worked {time_in_timer_state} ms without a break")
+            time_in_timer_state = 0
+
+    timer.timeElapsedSignal.connect(onTimeElapsed)
+
+    def onTimerStateChanged(timer_state: TimerState, _is_skipped: bool) -> None:
+        nonlocal works_since_long_break, durations_ended, time_in_timer_state
+        time_in_timer_state = 0
+        previous_timer_state = timer.previous_timer_state
+        if timer_state == TimerState.NOTHING:
+            works_since_long_break = 0
+            return
+        if previous_timer_state != TimerState.WORK:
+            return
+        durations_ended += 1
+        works_since_long_break += 1
+        expected_timer_state = TimerState.LONG_BREAK if works_since_long_break == WORK_INTERVALS else TimerState.BREAK
+        if timer_state != expected_timer_state:
+            errors.append(
+                f"work duration {works_since_long_break} since the last long break was followed by {timer_state.name}"
+            )
+        if timer_state == TimerState.LONG_BREAK:
+            works_since_long_break = 0
+
+    timer.timerStateChangedSignal.connect(onTimerStateChanged)
+
+    def startTimer() -> None:
+        # like the pause/resume button does
+        if timer.getTimerState() == TimerState.NOTHING:
+            timer.updateSessionProgress()
+        timer.setDuration()
+        timer.startDuration()
+
+    start_time = clock.now
+    end_time = clock.now + int(args.hours * 60 * 60 * 1000)
+    idle_time = 0  # time the timer was paused or stopped
+    ticks = pauses = skips = stops = task_switches = 0
+    cpu_start_time = time.process_time()
+    wall_start_time = time.perf_counter()
+
+    todo_model.setCurrentTaskID(rng.choice(workable_task_ids))
+    startTimer()
+
+    while clock.now < end_time:
+        roll = rng.random()
+        if roll < SWITCH_TASK_PROBABILITY:
+            todo_model.setCurrentTaskID(rng.choice(workable_task_ids))
+            task_switches += 1
+        elif roll < SWITCH_TASK_PROBABILITY + PAUSE_PROBABILITY + STOP_PROBABILITY:
+            # pauses or stops somewhere before the next tick, and starts again some minutes later
+            clock.now += rng.randint(0, timer.pomodoro_timer.interval())
+            if roll < SWITCH_TASK_PROBABILITY + PAUSE_PROBABILITY:
+                timer.pauseDuration()
+                pauses += 1
+            else:
+                timer.stopSession()
+                stops += 1
+            away_time = rng.randint(1_000, 30 * 60 * 1000)
+            clock.now += away_time
+            idle_time += away_time
+            startTimer()
+        elif roll < SWITCH_TASK_PROBABILITY + PAUSE_PROBABILITY + STOP_PROBABILITY + SKIP_PROBABILITY:
+            clock.now += rng.randint(0, timer.pomodoro_timer.interval())
+            timer.skipDuration()
+            skips += 1
+
+        pomodoro_timer: SimulatedTimer = timer.pomodoro_timer
+        clock.now = pomodoro_timer.due_at + get_lateness(rng)
+        pomodoro_timer.fire()
+        ticks += 1
+
+    timer.stopSession()
+    tracker.close()
+    cpu_time = time.process_time() - cpu_start_time
+    wall_time = time.perf_counter() - wall_start_time
+    simulated_time = clock.now - start_time
+
+    reported_time = sum(reported_times.values())
+    if reported_time + idle_time != simulated_time:
+        errors.append(
+            f"reported {reported_time} ms and idle {idle_time} ms add up to "
+            f"{reported_time + idle_time - simulated_time} ms more than the {simulated_time} ms simulated"
+        )
+
+    model_elapsed_times = {
+        task_id: todo_model.getTaskNodeById(task_id).elapsed_time for task_id in db_elapsed_times_before
+    }
+    db_elapsed_times = get_db_elapsed_times()
+    work_time = reported_times[TimerState.WORK]
+    for where, elapsed_times in [("model", model_elapsed_times), ("database", db_elapsed_times)]:
+        added_time = sum(elapsed_times[task_id] - db_elapsed_times_before[task_id] for task_id in workable_task_ids)
+        if added_time != work_time:
+            errors.append(f"{added_time} ms were added to tasks in the {where} instead of {work_time} ms")
+        errors.extend(check_parent_times(elapsed_times, children, where))
+    interval_time = get_db_interval_time()
+    if interval_time != work_time:
+        errors.append(f"work intervals add up to {interval_time} ms instead of {work_time} ms")
+
+    simulated_hours = simulated_time / (60 * 60 * 1000)
+    print(
+        f"simulated {simulated_hours:.1f} hours in {wall_time:.2f} s ({simulated_time / 1000 / wall_time:.0f}x real "
+        f"time): {ticks} ticks, {durations_ended} work durations ended, {task_switches} task switches, {pauses} "
+        f"pauses, {skips} skips, {stops} stops"
+    )
+    print(
+        f"  reported {work_time} ms of work, {reported_time - work_time} ms of breaks, the timer was paused or "
+        f"stopped for {idle_time} ms"
+    )
+    print(
+        f"  per simulated hour: {db_writes / simulated_hours:.1f} database writes, "
+        f"{cpu_time / simulated_hours * 1000:.1f} ms CPU"
+    )
+
+    for error in errors[:20]:
+        print(f"error: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
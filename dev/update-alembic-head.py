@@ -0,0 +1,50 @@
+# writes the head revision of the alembic migrations to src/alembicHeadRevision.py so that the app can check whether
+# the database is up to date without loading alembic and all migration scripts on every start
+#
+# run this after adding a migration, it is also run by the build workflow
+# usage: python dev/update-alembic-head.py [--check]
+#   --check: don't write anything, exit with 1 if src/alembicHeadRevision.py is out of date
+import os
+import sys
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+alembic_ini_path = os.path.normpath(os.path.join(script_dir, "../alembic.ini"))
+head_revision_path = os.path.normpath(os.path.join(script_dir, "../src/alembicHeadRevision.py"))
+
+TEMPLATE = """# generated by dev/update-alembic-head.py, don't edit by hand
+# head revision of the alembic migrations in src/migrations/versions, compared with the revision stored in the database
+# at startup to decide whether migrations have to be run
+ALEMBIC_HEAD_REVISION = "{revision}"
+"""
+
+
+def main() -> None:
+    heads = ScriptDirectory.from_config(Config(alembic_ini_path)).get_heads()
+    if len(heads) != 1:
+        print(f"Expected exactly one alembic head, found: {heads}")
+        sys.exit(1)
+
+    content = TEMPLATE.format(revision=heads[0])
+
+    current_content = ""
+    if os.path.exists(head_revision_path):
+        with open(head_revision_path, "r", encoding="utf-8") as f:
+            current_content = f.read()
+
+    if "--check" in sys.argv[1:]:
+        if current_content != content:
+            print(f"{head_revision_path} is out of date, run python dev/update-alembic-head.py")
+            sys.exit(1)
+        return
+
+    if current_content != content:
+        with open(head_revision_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"Alembic head revision updated to {heads[0]}")
+
+
+if __name__ == "__main__":
+    main()
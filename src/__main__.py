@@ -1,26 +1,43 @@
-import os.path
-import platform
-import signal
 import sys
-import types
-from pathlib import Path
-
-from alembic import command
-from alembic.config import Config
-from loguru import logger
-from PySide6.QtGui import QFont, QFontDatabase
-from PySide6.QtWidgets import QApplication, QMessageBox
-
-import resources.fonts_rc
-from constants import APPLICATION_NAME, APPLICATION_UID, FLATPAK_APP_ID, ORGANIZATION_NAME
-from mainWindow import MainWindow
-from prefabs.qtSingleApplication import QtSingleApplication
-from utils.checkFlatpakSandbox import is_flatpak_sandbox
-from utils.checkInitService import check_init_service
-from utils.checkValidDb import checkValidDB
-from utils.isNuitka import is_nuitka
-from utils.patchTooltip import apply_patches
-from utils.updateAppVersionInDb import updateAppVersionInDB
+
+# checked before the other imports, "ctl" talks to the running instance (see controlCli.py) and needs none of the app's
+# modules, so that it doesn't wait for PySide6's widgets and the database models to load
+if __name__ == "__main__" and sys.argv[1:2] == ["ctl"]:
+    from controlCli import main as control_cli_main
+
+    sys.exit(control_cli_main(sys.argv[2:]))
+
+# imported first so that the time taken by the other imports is measured too
+from utils.startupProfiler import startup_profiler  # noqa: E402  # isort: skip
+
+import os.path  # noqa: E402
+import platform  # noqa: E402
+import signal  # noqa: E402
+import sqlite3  # noqa: E402
+import time  # noqa: E402
+import types  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from loguru import logger  # noqa: E402
+from PySide6.QtCore import QTimer  # noqa: E402
+from PySide6.QtGui import QFont, QFontDatabase  # noqa: E402
+from PySide6.QtWidgets import QApplication, QMessageBox  # noqa: E402
+
+from alembicHeadRevision import ALEMBIC_HEAD_REVISION  # noqa: E402
+from configPaths import db_path  # noqa: E402
+from configValues import ConfigValues  # noqa: E402
+from constants import APPLICATION_NAME, APPLICATION_UID, FLATPAK_APP_ID, ORGANIZATION_NAME  # noqa: E402
+from mainWindow import MainWindow  # noqa: E402
+from models.config import initialize_app_settings  # noqa: E402
+from prefabs.qtSingleApplication import QtSingleApplication  # noqa: E402
+from utils.checkFlatpakSandbox import is_flatpak_sandbox  # noqa: E402
+from utils.checkInitService import check_init_service  # noqa: E402
+from utils.checkValidDb import checkValidDB  # noqa: E402
+from utils.controlServer import ControlServer  # noqa: E402
+from utils.isNuitka import is_nuitka  # noqa: E402
+from utils.patchTooltip import apply_patches  # noqa: E402
+from utils.startupOrchestrator import StartupOrchestrator  # noqa: E402
+from utils.updateAppVersionInDb import updateAppVersionInDB  # noqa: E402
 
 
 def handle_signal(_signal: signal.Signals, _frame: types.FrameType | None) -> None:
@@ -31,8 +48,33 @@ def handle_signal(_signal: signal.Signals, _frame: types.FrameType | None) -> No
     app_instance.quit()
 
 
+def is_db_at_head() -> bool:
+    """
+    Checks with a single query whether the database exists and is already at the head revision baked in by
+    dev/update-alembic-head.py, so that alembic and the migration scripts don't have to be loaded on every start
+    """
+    if not os.path.exists(db_path):
+        return False
+
+    try:
+        connection = sqlite3.connect(f"{Path(db_path).as_uri()}?mode=ro", uri=True)
+        try:
+            revisions = {row[0] for row in connection.execute("SELECT version_num FROM alembic_version")}
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Could not read alembic revision of the database: {e}")
+        return False
+
+    return revisions == {ALEMBIC_HEAD_REVISION}
+
+
 # https://alembic.sqlalchemy.org/en/latest/cookbook.html#building-an-up-to-date-database-from-scratch
 def run_alembic_upgrade() -> None:
+    # imported here as alembic is only needed when the database isn't at the head revision
+    from alembic import command
+    from alembic.config import Config
+
     if is_nuitka():
         # from: https://nuitka.net/user-documentation/common-issue-solutions.html#onefile-finding-files
         alembic_ini_path = os.path.join(os.path.dirname(sys.argv[0]), "alembic.ini")
@@ -43,19 +85,38 @@ def run_alembic_upgrade() -> None:
     command.upgrade(alembic_cfg, "head")
 
 
+def bootstrap_database() -> None:
+    """Brings the database up to date, run in a background thread by StartupOrchestrator"""
+    with startup_profiler.phase("database schema check"):
+        schema_check_start_time = time.perf_counter()
+        if is_db_at_head():
+            logger.debug(f"Database is at head revision {ALEMBIC_HEAD_REVISION}, skipping migrations")
+        else:
+            run_alembic_upgrade()  # create db if it doesn't exist and run migrations
+        logger.debug(f"Database schema check took {(time.perf_counter() - schema_check_start_time) * 1000:.1f} ms")
+    with startup_profiler.phase("checkValidDB"):
+        checkValidDB()  # Check if the database is valid, if it doesn't have required sample data, add it
+    with startup_profiler.phase("updateAppVersionInDB"):
+        updateAppVersionInDB()
+
+
+def get_fonts_dir() -> str:
+    if is_nuitka():
+        # from: https://nuitka.net/user-documentation/common-issue-solutions.html#onefile-finding-files
+        return os.path.join(os.path.dirname(sys.argv[0]), "resources", "fonts")
+    return str(Path(__file__).parent / "resources" / "fonts")
+
+
 def substitute_fonts() -> None:
     # Windows already has Segoe UI, so no need to substitute fonts
     if not os.name == "nt":
-        fonts = [
-            ":/fontsPrefix/fonts/selawk.ttf",
-            ":/fontsPrefix/fonts/selawkb.ttf",
-            ":/fontsPrefix/fonts/selawkl.ttf",
-            ":/fontsPrefix/fonts/selawksb.ttf",
-            ":/fontsPrefix/fonts/selawksl.ttf",
-        ]
+        # loaded from the font files instead of a compiled resource module, importing the resource module took longer
+        # than registering all the fonts and kept a copy of them in memory
+        fonts_dir = get_fonts_dir()
+        fonts = ["selawk.ttf", "selawkb.ttf", "selawkl.ttf", "selawksb.ttf", "selawksl.ttf"]
 
         for font in fonts:
-            id = QFontDatabase.addApplicationFont(font)
+            id = QFontDatabase.addApplicationFont(os.path.join(fonts_dir, font))
             if id < 0:
                 logger.error(f"Failed to load font: {font}")
 
@@ -84,13 +145,13 @@ def check_desktop_environment() -> bool:
 
 
 if __name__ == "__main__":
-    if platform.system().lower() == "linux":
-        check_desktop_environment()
-        check_init_service()
+    startup_profiler.recordImports()
 
-    run_alembic_upgrade()  # create db if it doesn't exist and run migrations
-    checkValidDB()  # Check if the database is valid, if it doesn't have required sample data, add it
-    updateAppVersionInDB()
+    if platform.system().lower() == "linux":
+        with startup_profiler.phase("check_desktop_environment"):
+            check_desktop_environment()
+        with startup_profiler.phase("check_init_service"):
+            check_init_service()
 
     # Needed for wayland linux sessions only. Shows a box around the tooltip in macOS and Windows
     if platform.system().lower() == "linux":
@@ -100,14 +161,23 @@ if __name__ == "__main__":
             print(f"Warning: Could not apply tooltip patch: {e}")
 
     appUID = APPLICATION_UID
-    app = QtSingleApplication(appUID, sys.argv)
+    with startup_profiler.phase("QtSingleApplication"):
+        app = QtSingleApplication(appUID, sys.argv)
 
     if app.isRunning():
         logger.info("Application is already running, activating window of the existing instance.")
+        if not app.sendMessage({"command": QtSingleApplication.ACTIVATE_COMMAND, "arguments": sys.argv[1:]}):
+            logger.warning("Could not send arguments to the existing instance")
         logger.info("Exiting current instance....")
         sys.exit(0)
 
-    substitute_fonts()
+    # only once this is known to be the only instance, so that a second launch neither migrates nor writes to the
+    # database of the running one, nor waits for the bootstrap before it exits
+    startup_orchestrator = StartupOrchestrator(bootstrap_database)
+    startup_orchestrator.startDatabaseBootstrap()
+
+    with startup_profiler.phase("substitute_fonts"):
+        substitute_fonts()
 
     # Set application information for notifications
     app.setApplicationName(APPLICATION_NAME)
@@ -118,10 +188,23 @@ if __name__ == "__main__":
         app.setDesktopFileName(FLATPAK_APP_ID)  # so that "python" isn't shown in the app name on hover
         # in KDE's task manager (KDE equivalent of Windows task bar)
 
-    mainWindow = MainWindow()
-    mainWindow.show()
+    with startup_profiler.phase("initialize_app_settings"):
+        initialize_app_settings()
+        # from here on the values in ConfigValues follow the settings, including the workspace settings which are
+        # loaded by MainWindow once the database is ready
+        ConfigValues.initialize()
+
+    with startup_profiler.phase("MainWindow"):
+        mainWindow = MainWindow(startup_orchestrator)
+    startup_profiler.watchFirstPaint(mainWindow)
+    with startup_profiler.phase("MainWindow.show"):
+        mainWindow.show()
+    # tasks and settings may have been loaded from the startup snapshot, checking them against the database once the
+    # first frame is drawn
+    QTimer.singleShot(0, mainWindow.reconcileStartupSnapshot)
 
     app.setActivationWindow(mainWindow)
+    control_server = ControlServer(app, mainWindow)
 
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
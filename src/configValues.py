@@ -1,22 +1,85 @@
+from typing import Dict, Tuple, Union
+
+from loguru import logger
+from qfluentwidgets import ConfigItem, QConfig
+
+from constants import SuspendPolicy
 from models.config import app_settings, workspace_specific_settings
+from prefabs.config.configItemSQL import ConfigItemSQL
+
+# the attributes of ConfigValues and the settings they mirror
+_SETTINGS: Dict[str, Tuple[QConfig, Union[ConfigItem, ConfigItemSQL]]] = {
+    "BREAK_DURATION": (workspace_specific_settings, workspace_specific_settings.break_duration),
+    "WORK_DURATION": (workspace_specific_settings, workspace_specific_settings.work_duration),
+    "LONG_BREAK_DURATION": (workspace_specific_settings, workspace_specific_settings.long_break_duration),
+    "WORK_INTERVALS": (workspace_specific_settings, workspace_specific_settings.work_intervals),
+    "AUTOSTART_WORK": (workspace_specific_settings, workspace_specific_settings.autostart_work),
+    "AUTOSTART_BREAK": (workspace_specific_settings, workspace_specific_settings.autostart_break),
+    "ENABLE_WEBSITE_BLOCKER": (workspace_specific_settings, workspace_specific_settings.enable_website_blocker),
+    "PROXY_PORT": (app_settings, app_settings.proxy_port),
+    "CHECK_FOR_UPDATES_ON_START": (app_settings, app_settings.check_for_updates_on_start),
+    "HAS_COMPLETED_TASK_VIEW_TUTORIAL": (app_settings, app_settings.has_completed_task_view_tutorial),
+    "HAS_COMPLETED_POMODORO_VIEW_TUTORIAL": (app_settings, app_settings.has_completed_pomodoro_view_tutorial),
+    "HAS_COMPLETED_WEBSITE_BLOCKER_VIEW_TUTORIAL": (
+        app_settings,
+        app_settings.has_completed_website_blocker_view_tutorial,
+    ),
+    "HAS_COMPLETED_WORKSPACE_MANAGER_DIALOG_TUTORIAL": (
+        app_settings,
+        app_settings.has_completed_workspace_manager_dialog_tutorial,
+    ),
+    "SHOULD_MINIMIZE_TO_TRAY": (app_settings, app_settings.should_minimize_to_tray),
+    "SUSPEND_POLICY": (app_settings, app_settings.suspend_policy),
+}
 
 
 class ConfigValues:
-    BREAK_DURATION = workspace_specific_settings.get(workspace_specific_settings.break_duration)
-    WORK_DURATION = workspace_specific_settings.get(workspace_specific_settings.work_duration)
-    LONG_BREAK_DURATION = workspace_specific_settings.get(workspace_specific_settings.long_break_duration)
-    WORK_INTERVALS = workspace_specific_settings.get(workspace_specific_settings.work_intervals)
-    AUTOSTART_WORK = workspace_specific_settings.get(workspace_specific_settings.autostart_work)
-    AUTOSTART_BREAK = workspace_specific_settings.get(workspace_specific_settings.autostart_break)
-    ENABLE_WEBSITE_BLOCKER = workspace_specific_settings.get(workspace_specific_settings.enable_website_blocker)
-    PROXY_PORT = app_settings.get(app_settings.proxy_port)
-    CHECK_FOR_UPDATES_ON_START = app_settings.get(app_settings.check_for_updates_on_start)
-    HAS_COMPLETED_TASK_VIEW_TUTORIAL = app_settings.get(app_settings.has_completed_task_view_tutorial)
-    HAS_COMPLETED_POMODORO_VIEW_TUTORIAL = app_settings.get(app_settings.has_completed_pomodoro_view_tutorial)
-    HAS_COMPLETED_WEBSITE_BLOCKER_VIEW_TUTORIAL = app_settings.get(
-        app_settings.has_completed_website_blocker_view_tutorial
+    """
+    Values of the settings, read from memory. They hold the default values until initialize() is called at startup,
+    after that every change of a setting, whether it is loaded from the settings file or the database, changed from the
+    settings view or by switching workspaces, is copied here by the valueChanged signal of the setting.
+    """
+
+    BREAK_DURATION: int = workspace_specific_settings.break_duration.defaultValue
+    WORK_DURATION: int = workspace_specific_settings.work_duration.defaultValue
+    LONG_BREAK_DURATION: int = workspace_specific_settings.long_break_duration.defaultValue
+    WORK_INTERVALS: int = workspace_specific_settings.work_intervals.defaultValue
+    AUTOSTART_WORK: bool = workspace_specific_settings.autostart_work.defaultValue
+    AUTOSTART_BREAK: bool = workspace_specific_settings.autostart_break.defaultValue
+    ENABLE_WEBSITE_BLOCKER: bool = workspace_specific_settings.enable_website_blocker.defaultValue
+    PROXY_PORT: int = app_settings.proxy_port.defaultValue
+    CHECK_FOR_UPDATES_ON_START: bool = app_settings.check_for_updates_on_start.defaultValue
+    HAS_COMPLETED_TASK_VIEW_TUTORIAL: bool = app_settings.has_completed_task_view_tutorial.defaultValue
+    HAS_COMPLETED_POMODORO_VIEW_TUTORIAL: bool = app_settings.has_completed_pomodoro_view_tutorial.defaultValue
+    HAS_COMPLETED_WEBSITE_BLOCKER_VIEW_TUTORIAL: bool = (
+        app_settings.has_completed_website_blocker_view_tutorial.defaultValue
     )
-    HAS_COMPLETED_WORKSPACE_MANAGER_DIALOG_TUTORIAL = app_settings.get(
-        app_settings.has_completed_workspace_manager_dialog_tutorial
+    HAS_COMPLETED_WORKSPACE_MANAGER_DIALOG_TUTORIAL: bool = (
+        app_settings.has_completed_workspace_manager_dialog_tutorial.defaultValue
     )
-    SHOULD_MINIMIZE_TO_TRAY = app_settings.get(app_settings.should_minimize_to_tray)
+    SHOULD_MINIMIZE_TO_TRAY: bool = app_settings.should_minimize_to_tray.defaultValue
+    SUSPEND_POLICY: SuspendPolicy = app_settings.suspend_policy.defaultValue
+
+    _is_initialized = False
+
+    @classmethod
+    def initialize(cls) -> None:
+        """
+        Copies the current values of the settings and keeps them in sync from then on. Called once at startup, before
+        or after the settings are loaded, independent of whether the settings view has been built yet
+        """
+        if cls._is_initialized:
+            return
+        cls._is_initialized = True
+
+        for name in _SETTINGS:
+            cls.update(name)
+            _SETTINGS[name][1].valueChanged.connect(lambda _value, name=name: cls.update(name))
+
+    @classmethod
+    def update(cls, name: str) -> None:
+        config, item = _SETTINGS[name]
+        value = config.get(item)
+        if getattr(cls, name) != value:
+            setattr(cls, name, value)
+            logger.debug(f"Updated {name} to: {value}")
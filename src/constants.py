@@ -17,6 +17,47 @@ DEFAULT_ENABLE_WEBSITE_BLOCKER = True
 
 APPLICATION_UID = "com.bishwasaha.koncentro"
 
+# when set to any non-empty value, the website blocker uses a stand-in proxy backend which never changes the system
+# proxy settings and logs how many external commands every proxy change would have cost
+OFFLINE_PROXY_ENV_VAR = "KONCENTRO_OFFLINE_PROXY"
+
+# when set, startup is profiled and the report is logged once the main window is painted. If the value is a path
+# instead of "1", the report is also written to it as JSON. See utils/startupProfiler.py
+PROFILE_STARTUP_ENV_VAR = "KONCENTRO_PROFILE_STARTUP"
+
+# in ms, how long a new instance waits for a running instance to accept its connection and its message, see
+# prefabs/qtSingleApplication.py
+SINGLE_INSTANCE_TIMEOUT = 250
+
+# in ms, if the database bootstrap hasn't finished this long after the window shell is built, a splash screen is shown
+# until it does. Shorter waits aren't worth a flash of the splash screen
+STARTUP_PLACEHOLDER_DELAY = 150
+
+# blocked hits reported by the website blocker are merged in memory and written to the database this often
+BLOCKED_HITS_FLUSH_INTERVAL = 60  # in seconds
+# each row takes 4 variables, SQLite versions before 3.32.0 allow only 999 variables in a statement
+BLOCKED_HITS_ROWS_PER_STATEMENT = 200
+
+# written when the app quits and read at the next start so that the main window can be drawn before the database is
+# read, see models/startupSnapshot.py. The format version has to be increased whenever the format changes
+STARTUP_SNAPSHOT_FILE_NAME = "startup-snapshot.bin"
+STARTUP_SNAPSHOT_FORMAT_VERSION = 1
+
+# in ms, a timer tick which wakes up at most this early is counted as the tick it was scheduled for instead of
+# scheduling another tick for the few remaining milliseconds, see models/timer.py
+TIMER_EARLY_WAKEUP_TOLERANCE = 20
+
+# in ms, a tick which finds that at least this much time went by without the timer running, because the computer was
+# suspended, is handled according to the suspend policy setting instead of as a late tick, see models/timer.py. Large
+# enough that a busy event loop or the system clock being corrected doesn't count as a suspension
+SUSPEND_DETECTION_THRESHOLD = 30 * 1000
+
+# checkpoints of the timer and of the time not yet saved to the database, written on every tick and read at the next
+# start to recover from a crash, see models/timerJournal.py. The format version has to be increased whenever the format
+# changes
+TIMER_JOURNAL_FILE_NAME = "timer-journal.bin"
+TIMER_JOURNAL_FORMAT_VERSION = 1
+
 # for dotfile to detect if its the first time the app is run
 FIRST_RUN_DOTFILE_NAME = ".first_run"
 
@@ -56,6 +97,16 @@ class TimerState(Enum):
     LONG_BREAK = "Long Break"
 
 
+class SuspendPolicy(Enum):
+    """
+    What the timer does with the time the computer was suspended for while it was running
+    """
+
+    PAUSE = "Pause"  # paused at the time the computer was suspended
+    STOP = "Stop"  # the session is stopped at the time the computer was suspended
+    CREDIT = "Credit"  # the time counts as if the timer had kept running
+
+
 class UpdateCheckResult(Enum):
     UP_TO_DATE = "App is up to date"
     UPDATE_AVAILABLE = "Update available"
@@ -70,6 +121,7 @@ class InterfaceType(Enum):
     POMODORO_INTERFACE = 1
     WEBSITE_BLOCKER_INTERFACE = 2
     SETTINGS_INTERFACE = 3
+    STATISTICS_INTERFACE = 4
 
     DIALOG = -1
 
@@ -81,6 +133,7 @@ class NavPanelButtonPosition(Enum):
     TASK_INTERFACE = (0, 2)
     POMODORO_INTERFACE = (0, 3)
     WEBSITE_BLOCKER_INTERFACE = (0, 4)
+    STATISTICS_INTERFACE = (0, 5)
 
     # 1 = Scroll Layout of Panel of Navigation Panel
 
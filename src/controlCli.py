@@ -0,0 +1,72 @@
+# command line client for the control socket of a running instance of the app, see utils/controlServer.py for the
+# protocol
+#
+# usage: python src/controlCli.py <command> [workspace id or name]
+#        python src ctl <command> [workspace id or name]    (the same, for builds which only have the app executable)
+#
+# the reply is printed as JSON, "subscribe" keeps printing an event per line until interrupted. Exits with 1 when the
+# command failed and with 2 when the app isn't running
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+from PySide6.QtNetwork import QLocalSocket
+
+from constants import APPLICATION_UID, SINGLE_INSTANCE_TIMEOUT
+from utils.socketMessage import decode_message, encode_message
+
+COMMANDS = ["status", "start", "pause", "skip", "stop", "current-task", "switch-workspace", "subscribe"]
+REPLY_TIMEOUT = 5000  # in ms, commands which change the timer state wait for the UI to update
+
+
+def read_message(socket: QLocalSocket, timeout: int) -> Optional[Dict[str, object]]:
+    while not socket.canReadLine():
+        if not socket.waitForReadyRead(timeout):
+            return None
+    return decode_message(bytes(socket.readLine().data()))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="koncentro ctl", description="Control the timer of a running Koncentro")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("workspace", nargs="?", help="id or name of the workspace, for switch-workspace")
+    args = parser.parse_args(argv)
+
+    request: Dict[str, object] = {"command": args.command.replace("-", "_")}
+    if args.command == "switch-workspace":
+        if args.workspace is None:
+            parser.error("switch-workspace needs the id or name of a workspace")
+        if args.workspace.isdigit():
+            request["workspace_id"] = int(args.workspace)
+        else:
+            request["workspace_name"] = args.workspace
+
+    socket = QLocalSocket()
+    socket.connectToServer(APPLICATION_UID)
+    if not socket.waitForConnected(SINGLE_INSTANCE_TIMEOUT):
+        print("Koncentro isn't running", file=sys.stderr)
+        return 2
+
+    socket.write(encode_message(request))
+    socket.flush()
+
+    reply = read_message(socket, REPLY_TIMEOUT)
+    if reply is None:
+        print("Koncentro didn't reply", file=sys.stderr)
+        return 1
+    print(json.dumps(reply), flush=True)
+    if not reply.get("ok"):
+        return 1
+
+    if args.command == "subscribe":
+        try:
+            while (event := read_message(socket, -1)) is not None:
+                print(json.dumps(event), flush=True)
+        except (KeyboardInterrupt, BrokenPipeError):
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,11 +1,11 @@
 import platform
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
-from PySide6.QtCore import QModelIndex, QSize, Qt, QTimer
-from PySide6.QtGui import QCloseEvent, QFont, QIcon, QKeySequence, QMouseEvent, QShortcut
+from PySide6.QtCore import QEvent, QModelIndex, QSize, Qt, QTimer
+from PySide6.QtGui import QCloseEvent, QFont, QIcon, QKeySequence, QMouseEvent, QShortcut, QShowEvent
 from PySide6.QtWidgets import QApplication
 from qfluentwidgets import (
     FluentIcon,
@@ -14,6 +14,7 @@ from qfluentwidgets import (
     MessageBox,
     NavigationItemPosition,
     PushButton,
+    SplashScreen,
     SystemThemeListener,
 )
 
@@ -22,50 +23,93 @@ from configValues import ConfigValues
 from constants import (
     APPLICATION_NAME,
     FIRST_RUN_DOTFILE_NAME,
+    STARTUP_PLACEHOLDER_DELAY,
     InterfaceType,
     NavPanelButtonPosition,
+    SuspendPolicy,
     TimerState,
     UpdateCheckResult,
     URLListType,
     WebsiteBlockType,
     WindowGeometryKeys,
 )
-from models.config import app_settings, load_workspace_settings, settings, workspace_specific_settings
+from models.blockedHitsRecorder import BlockedHitsRecorder
+from models.config import (
+    app_settings,
+    get_workspace_settings_values,
+    initialize_workspace_settings,
+    load_workspace_settings,
+    settings,
+    workspace_specific_settings,
+)
 from models.dbTables import TaskType
+from models.startupSnapshot import get_snapshot_path, get_startup_snapshot, write_startup_snapshot
 from models.taskListModel import TaskListModel
+from models.taskTimeTracker import TaskTimeTracker
+from models.timerJournal import (
+    TimerJournal,
+    get_timer_journal_path,
+    get_unfinished_checkpoint,
+    now_ms,
+    recover_tracked_time,
+)
+from models.websiteListManagerModel import WebsiteListManager
 from models.workspaceListModel import WorkspaceListModel
+from models.workspaceLookup import WorkspaceLookup
 from prefabs.customFluentIcon import CustomFluentIcon
 from prefabs.koncentroFluentWindow import KoncentroFluentWindow
+from prefabs.lazyInterface import LazyInterface
 from prefabs.systemTray import SystemTray
 from prefabs.taskListItemDelegate import TaskListItemDelegate
 from resources import logos_rc
-from tutorial.pomodoroInterfaceTutorial import PomodoroInterfaceTutorial
-from tutorial.taskInterfaceTutorial import TaskInterfaceTutorial
-from tutorial.websiteBlockerInterfaceTutorial import WebsiteBlockerInterfaceTutorial
-from tutorial.workspaceManagerDialogTutorial import WorkspaceManagerDialogTutorial
 from utils.checkForUpdates import UpdateChecker
 from utils.checkInternetWorker import CheckInternetWorker
 from utils.findMitmdumpExecutable import get_mitmdump_path
 from utils.isMitmdumpRunning import isMitmdumpRunningWorker
+from utils.startupProfiler import startup_profiler
 from utils.timeConversion import convert_ms_to_hh_mm_ss
+from utils.uiTickDispatcher import UITickDispatcher, is_widget_shown
 from views.dialogs.preSetupConfirmationDialog import PreSetupConfirmationDialog
 from views.dialogs.setupAppDialog import SetupAppDialog
 from views.dialogs.updateDialog import UpdateDialog
 from views.dialogs.workspaceManagerDialog import ManageWorkspaceDialog
 from views.subinterfaces.pomodoroView import PomodoroView
-from views.subinterfaces.settingsView import SettingsView
+from views.subinterfaces.statisticsView import StatisticsView
 from views.subinterfaces.tasksView import TaskListView
-from views.subinterfaces.websiteBlockerView import WebsiteBlockerView
+from website_blocker.blockerEventServer import BlockerEventServer
 from website_blocker.websiteBlockerManager import WebsiteBlockerManager
 
+if TYPE_CHECKING:
+    from utils.startupOrchestrator import StartupOrchestrator
+    from views.subinterfaces.settingsView import SettingsView
+    from views.subinterfaces.websiteBlockerView import WebsiteBlockerView
+
 controlKeyText = "Cmd" if platform.system() == "Darwin" else "Ctrl"
 
 
 class MainWindow(KoncentroFluentWindow):
-    def __init__(self) -> None:
+    def __init__(self, startup_orchestrator: Optional["StartupOrchestrator"] = None) -> None:
         super().__init__()
+        # before anything can show the window, see showEvent()
+        self.ui_tick_dispatcher = UITickDispatcher(self)
+        self.initWindow()
 
         self.is_first_run = self.check_first_run()
+
+        # everything above only builds the window shell, everything below reads the database
+        if startup_orchestrator is not None:
+            self.waitForDatabase(startup_orchestrator)
+
+        with startup_profiler.phase("recover_tracked_time"):
+            # here and not while bootstrapping the database, as only the primary instance may touch the journal, a
+            # second launch would find the journal of the running instance unfinished. Before the task lists are
+            # loaded, so that they show the time which was recovered
+            unfinished_checkpoint = get_unfinished_checkpoint()
+            if unfinished_checkpoint is not None:
+                try:
+                    recover_tracked_time(unfinished_checkpoint)
+                except Exception as e:
+                    logger.error(f"Could not recover the time of the unfinished work interval: {e}")
         # self.checkForUpdates()
 
         # if current alembic revision is older than latest alembic revision then update db
@@ -73,40 +117,74 @@ class MainWindow(KoncentroFluentWindow):
         self.update_checker = None
         self.mitmdump_check_worker = None
 
+        with startup_profiler.phase("initialize_workspace_settings"):
+            initialize_workspace_settings()
+
         self.workplace_list_model = WorkspaceListModel()
 
-        self.task_interface = TaskListView()
-        self.task_interface.setObjectName("task_interface")
+        with startup_profiler.phase("TaskListView"):
+            self.task_interface = TaskListView()
+            self.task_interface.setObjectName("task_interface")
 
-        self.pomodoro_interface = PomodoroView()
-        self.pomodoro_interface.setObjectName("pomodoro_interface")
+        with startup_profiler.phase("PomodoroView"):
+            self.pomodoro_interface = PomodoroView()
+            self.pomodoro_interface.setObjectName("pomodoro_interface")
 
-        self.settings_interface = SettingsView()
+        # settings and website blocker interfaces are built when they are opened for the first time, until then
+        # these stand in for them in the stacked widget and the navigation interface
+        self.settings_interface = LazyInterface(self.buildSettingsInterface)
         self.settings_interface.setObjectName("settings_interface")
 
-        self.website_blocker_interface = WebsiteBlockerView(self.workplace_list_model)
+        self.website_blocker_interface = LazyInterface(self.buildWebsiteBlockerInterface)
         self.website_blocker_interface.setObjectName("website_blocker_interface")
 
+        with startup_profiler.phase("TaskTimeTracker"):
+            # adds the time the timer runs to the current task and saves it, checkpointing it on every tick to recover
+            # it after a crash
+            self.task_time_tracker = TaskTimeTracker(
+                self.pomodoro_interface.pomodoro_timer_obj,
+                self.task_interface.todoTasksList.model(),
+                TimerJournal(get_timer_journal_path()),
+                WorkspaceLookup.get_current_workspace_id(),
+                self,
+            )
+
+        with startup_profiler.phase("StatisticsView"):
+            # saves blocked hits reported by mitmdump to the database in batches
+            self.blocked_hits_recorder = BlockedHitsRecorder()
+            self.statistics_interface = StatisticsView(self.blocked_hits_recorder)
+            self.statistics_interface.setObjectName("statistics_interface")
+
         self.setObjectName("main_window")
 
         self.manage_workspace_dialog = None
 
-        self.website_blocker_manager = WebsiteBlockerManager()
+        with startup_profiler.phase("WebsiteBlockerManager"):
+            # receives blocked hits from mitmdump in a background thread
+            self.blocker_event_server = BlockerEventServer()
+            self.blocker_event_server.start()
+            self.blocked_hit_count = 0  # number of requests blocked during the current work session
+
+            self.website_blocker_manager = WebsiteBlockerManager(self.blocker_event_server)
 
         self.themeListener = SystemThemeListener(self)
         self.themeListener.start()
 
         self.isSafeToShowTutorial = False
 
-        self.initNavigation()
-        self.initWindow()
-        self.systemTray = SystemTray(self)
+        with startup_profiler.phase("initNavigation"):
+            self.initNavigation()
+        with startup_profiler.phase("SystemTray"):
+            self.systemTray = SystemTray(self)
         # bottomBar is already a part of KoncentroFluentWindow so not making a new object of BottomBar
         self.bottomBar.initBottomBar(self.pomodoro_interface, self.task_interface)
-        self.connectSignalsToSlots()
+        with startup_profiler.phase("connectSignalsToSlots"):
+            self.connectSignalsToSlots()
+        self.restoreTimerSession()
 
         # Initialize keyboard shortcuts
-        self.initShortcuts()
+        with startup_profiler.phase("initShortcuts"):
+            self.initShortcuts()
 
         self.website_blocker_interface.setEnabled(ConfigValues.ENABLE_WEBSITE_BLOCKER)
 
@@ -141,6 +219,37 @@ class MainWindow(KoncentroFluentWindow):
             position=NavigationItemPosition.BOTTOM,
         )
         self.addSubInterface(self.settings_interface, FluentIcon.SETTING, "Settings", NavigationItemPosition.BOTTOM)
+        # added after settings_interface so that index of settings_interface in stackedWidget (see InterfaceType Enum)
+        # stays the same, its button is still placed in the top layout below the website blocker button
+        self.addSubInterface(self.statistics_interface, FluentIcon.PIE_SINGLE, "Statistics")
+
+    def buildSettingsInterface(self) -> "SettingsView":
+        from views.subinterfaces.settingsView import SettingsView
+
+        logger.debug("Building settings interface")
+        return SettingsView()
+
+    def buildWebsiteBlockerInterface(self) -> "WebsiteBlockerView":
+        from views.subinterfaces.websiteBlockerView import WebsiteBlockerView
+
+        logger.debug("Building website blocker interface")
+        return WebsiteBlockerView(self.workplace_list_model)
+
+    def waitForDatabase(self, startup_orchestrator: "StartupOrchestrator") -> None:
+        """Shows a splash screen over the window shell if the database bootstrap takes long, until it finishes"""
+        with startup_profiler.phase("waitForDatabase"):
+            if startup_orchestrator.waitForDatabase(STARTUP_PLACEHOLDER_DELAY / 1000):
+                return
+
+            logger.debug("Database isn't ready yet, showing splash screen until it is")
+            splash_screen = SplashScreen(self.windowIcon(), self)
+            splash_screen.setIconSize(QSize(102, 102))
+            self.restoreWindowGeometry()
+            self.show()
+            # waiting in short steps so that the splash screen is painted and the window can be moved meanwhile
+            while not startup_orchestrator.waitForDatabase(0.01):
+                QApplication.processEvents()
+            splash_screen.finish()
 
     def initWindow(self) -> None:
         self.setMinimumWidth(715)
@@ -178,26 +287,22 @@ class MainWindow(KoncentroFluentWindow):
     def toggleUIElementsBasedOnTimerState(self, timerState: TimerState, _: bool) -> None:
         # TODO: show a tip to stop the timer before changing settings when timer is running
         workspace_selector_button = self.navigationInterface.panel.widget("WorkspaceSelector")
-        if timerState in [TimerState.WORK, TimerState.BREAK, TimerState.LONG_BREAK]:
-            self.settings_interface.pomodoro_settings_group.setDisabled(True)
-            workspace_selector_button.setDisabled(True)
-            self.settings_interface.proxy_port_card.setDisabled(True)
-            self.settings_interface.setup_app_card.setDisabled(True)
-            if platform.system().lower() == "windows":
-                self.settings_interface.uninstall_mitmproxy_certificate_card.setDisabled(True)
-            self.settings_interface.reset_proxy_settings.setDisabled(True)
-            self.pomodoro_interface.skipButton.setEnabled(True)
-            self.bottomBar.skipButton.setEnabled(True)
-        else:
-            self.settings_interface.pomodoro_settings_group.setDisabled(False)
-            workspace_selector_button.setDisabled(False)
-            self.settings_interface.proxy_port_card.setDisabled(False)
+        is_timer_running = timerState in [TimerState.WORK, TimerState.BREAK, TimerState.LONG_BREAK]
+
+        workspace_selector_button.setDisabled(is_timer_running)
+        self.pomodoro_interface.skipButton.setEnabled(is_timer_running)
+        self.bottomBar.skipButton.setEnabled(is_timer_running)
+
+        # if the settings interface hasn't been built yet then this is done once it is built, see
+        # connectSettingsInterfaceSignalsToSlots()
+        if self.settings_interface.isBuilt():
+            settings_view: SettingsView = self.settings_interface.widget()
+            settings_view.pomodoro_settings_group.setDisabled(is_timer_running)
+            settings_view.proxy_port_card.setDisabled(is_timer_running)
+            settings_view.setup_app_card.setDisabled(is_timer_running)
             if platform.system().lower() == "windows":
-                self.settings_interface.uninstall_mitmproxy_certificate_card.setDisabled(False)
-            self.settings_interface.setup_app_card.setDisabled(False)
-            self.settings_interface.reset_proxy_settings.setDisabled(False)
-            self.pomodoro_interface.skipButton.setEnabled(False)
-            self.bottomBar.skipButton.setEnabled(False)
+                settings_view.uninstall_mitmproxy_certificate_card.setDisabled(is_timer_running)
+            settings_view.reset_proxy_settings.setDisabled(is_timer_running)
 
     def on_session_resumed(self) -> None:
         """Only for cases when autostart work/break is disabled and session is resumed manually"""
@@ -246,7 +351,8 @@ class MainWindow(KoncentroFluentWindow):
             return
 
         logger.debug("Starting website blocking")
-        website_block_type = self.website_blocker_interface.model.get_website_block_type()
+        website_list_manager = self.getWebsiteListManager()
+        website_block_type = website_list_manager.get_website_block_type()
         logger.debug(f"website_block_type: {website_block_type}")
 
         urls = None
@@ -254,10 +360,10 @@ class MainWindow(KoncentroFluentWindow):
         joined_urls = ""
 
         if website_block_type == WebsiteBlockType.BLOCKLIST:  # blocklist
-            urls = self.website_blocker_interface.model.get_urls(URLListType.BLOCKLIST)
+            urls = website_list_manager.get_urls(URLListType.BLOCKLIST)
             block_type = "blocklist"
         elif website_block_type == WebsiteBlockType.ALLOWLIST:  # allowlist
-            urls = self.website_blocker_interface.model.get_urls(URLListType.ALLOWLIST)
+            urls = website_list_manager.get_urls(URLListType.ALLOWLIST)
             block_type = "allowlist"
 
         logger.debug(f"URLs: {urls}")
@@ -269,6 +375,15 @@ class MainWindow(KoncentroFluentWindow):
         mitmdump_path = get_mitmdump_path()
         self.website_blocker_manager.start_blocking(ConfigValues.PROXY_PORT, joined_urls, block_type, mitmdump_path)
 
+    def getWebsiteListManager(self) -> WebsiteListManager:
+        """
+        Returns the model of the website blocker interface. If the interface hasn't been built yet, a new model is
+        returned, which loads the block type and the URL lists of the current workspace from the database
+        """
+        if self.website_blocker_interface.isBuilt():
+            return self.website_blocker_interface.widget().model
+        return WebsiteListManager()
+
     def stop_website_blocking(self) -> None:
         """Stop website blocking"""
         logger.debug("Stopping website blocking")
@@ -279,13 +394,14 @@ class MainWindow(KoncentroFluentWindow):
         current_timer_state = self.pomodoro_interface.pomodoro_timer_obj.getTimerState()
         is_timer_running = self.pomodoro_interface.pomodoro_timer_obj.pomodoro_timer.isActive()
 
-        if current_timer_state == TimerState.WORK and is_timer_running:
+        if current_timer_state == TimerState.WORK and is_timer_running and ConfigValues.ENABLE_WEBSITE_BLOCKER:
             # Only restart blocking if we're in a work session and timer is actually running
             logger.debug("Website blocker settings changed during active work session, restarting blocking")
-            self.stop_website_blocking()
+            # start_website_blocking() restarts mitmdump by itself and keeps the system proxy as it is, so it isn't
+            # preceded by stop_website_blocking() which would unset the proxy only for it to be set again
             self.start_website_blocking()
         else:
-            # Just stop blocking if we're not in an active work session
+            # Just stop blocking if we're not in an active work session or website blocker has been disabled
             logger.debug("Website blocker settings changed, stopping blocking")
             self.stop_website_blocking()
 
@@ -384,75 +500,50 @@ class MainWindow(KoncentroFluentWindow):
 
             logger.debug("Current Task has been moved")
 
-    def updateTaskTime(self) -> None:
-        if self.get_current_task_id() is not None:
-            if self.pomodoro_interface.pomodoro_timer_obj.getTimerState() in [TimerState.BREAK, TimerState.LONG_BREAK]:
-                return
+    def onSuspendDetected(self, suspended_time: int, policy: SuspendPolicy) -> None:
+        hours, minutes, seconds = convert_ms_to_hh_mm_ss(suspended_time)
+        content = {
+            SuspendPolicy.PAUSE: "The timer has been paused where it was when the computer went to sleep",
+            SuspendPolicy.STOP: "The session has been stopped where it was when the computer went to sleep",
+            SuspendPolicy.CREDIT: "The time the computer was asleep for has been counted as if the timer kept running",
+        }[policy]
+        InfoBar.info(
+            title=f"Computer Was Asleep For {hours:02d}:{minutes:02d}:{seconds:02d}",
+            content=content,
+            orient=Qt.Orientation.Vertical,
+            isClosable=True,
+            duration=-1,
+            position=InfoBarPosition.TOP_RIGHT,
+            parent=self,
+        )
 
-            model: TaskListModel = self.task_interface.todoTasksList.model()
-            currentTaskIndex: QModelIndex = self.get_current_task_index()
-            timerResolution = self.pomodoro_interface.pomodoro_timer_obj.timer_resolution
-
-            if currentTaskIndex.parent().isValid():  # is a child task
-                childElapsedTime = model.data(currentTaskIndex, TaskListModel.ElapsedTimeRole) + timerResolution
-                parentIndex = currentTaskIndex.parent()
-
-                # Calculate parent's elapsed time as sum of all its children
-                parentNode = model.get_node(parentIndex)
-                parentElapsedTime = 0
-                for child in parentNode.children:
-                    if child.task_id == model.data(currentTaskIndex, TaskListModel.IDRole):
-                        # Use the updated time for the current child
-                        parentElapsedTime += childElapsedTime
-                    else:
-                        # Use existing time for other children
-                        parentElapsedTime += child.elapsed_time
-
-                logger.debug(f"Child Elapsed Time: {childElapsedTime}")
-                logger.debug(f"Parent Elapsed Time: {parentElapsedTime}")
-
-                if childElapsedTime % 1000 == 0:
-                    logger.debug(f"updating child task {currentTaskIndex.row()} elapsed time to {childElapsedTime}ms")
-                    model.setData(currentTaskIndex, childElapsedTime, TaskListModel.ElapsedTimeRole, update_db=False)
-                    model.setData(parentIndex, parentElapsedTime, TaskListModel.ElapsedTimeRole, update_db=False)
-                if childElapsedTime % 5000 == 0:
-                    self.updateTaskTimeDB()
-            else:  # is a parent task
-                finalElapsedTime = (
-                    model.data(self.get_current_task_index(), TaskListModel.ElapsedTimeRole) + timerResolution
-                )
-                if finalElapsedTime % 1000 == 0:  # only update db when the elapsed time is a multiple of 1000
-                    model.setData(
-                        self.get_current_task_index(), finalElapsedTime, TaskListModel.ElapsedTimeRole, update_db=False
-                    )
-                if finalElapsedTime % 5000 == 0:
-                    self.updateTaskTimeDB()
-
-    def updateTaskTimeDB(self) -> None:
-        # since sessionStoppedSignal is emitted when the timer is stopped, we have to check if the current task index
-        # is valid or not. Current Task Index can be invalid due to it being None when there are no tasks in todo list
-        # when timer began or when current task is deleted and session is stopped automatically
-        current_task_index = self.get_current_task_index()
-        if current_task_index is None:
+    def restoreTimerSession(self) -> None:
+        """
+        Puts the timer back into the session the previous run was in if it crashed or was killed, paused, with the
+        current task it had. The time it had worked on the task has already been saved by recover_tracked_time() in
+        __init__()
+        """
+        checkpoint = get_unfinished_checkpoint()
+        if checkpoint is None or checkpoint.timer_state == TimerState.NOTHING:
+            return
+        if checkpoint.workspace_id != self.task_time_tracker.current_workspace_id:
+            logger.debug("Unfinished timer session is of another workspace, not restoring it")
             return
 
-        model: TaskListModel = self.task_interface.todoTasksList.model()
-        if current_task_index.parent().isValid():  # is a child task
-            childElapsedTime = model.data(current_task_index, TaskListModel.ElapsedTimeRole)
-            parentIndex = current_task_index.parent()
-            parentElapsedTime = model.data(parentIndex, TaskListModel.ElapsedTimeRole)
-            model.setData(current_task_index, childElapsedTime, TaskListModel.ElapsedTimeRole)
-            model.setData(parentIndex, parentElapsedTime, TaskListModel.ElapsedTimeRole)
-            model.update_db()  # update both the child and parent task time at once
-            logger.debug(
-                f"Updated DB with elapsed time for child: {childElapsedTime} and for parent: {parentElapsedTime}"
-            )
-        else:  # is a parent task
-            finalElapsedTime = model.data(self.get_current_task_index(), TaskListModel.ElapsedTimeRole)
-            model.setData(
-                self.get_current_task_index(), finalElapsedTime, TaskListModel.ElapsedTimeRole, update_db=True
-            )
-            logger.debug(f"Updated DB with elapsed time: {finalElapsedTime}")
+        logger.info(f"Restoring timer session which was cut off {(now_ms() - checkpoint.written_at) / 1000:.0f} s ago")
+        todo_model: TaskListModel = self.task_interface.todoTasksList.model()
+        if todo_model.getTaskNodeById(checkpoint.current_task_id) is not None:
+            todo_model.setCurrentTaskID(checkpoint.current_task_id)
+
+        self.pomodoro_interface.pomodoro_timer_obj.restoreSession(
+            checkpoint.timer_state,
+            checkpoint.session_progress,
+            checkpoint.sessions_completed,
+            checkpoint.remaining_time,
+        )
+        # the progress ring and the labels are filled when the state changes, and then only updated on every tick
+        self.pomodoro_interface.updateProgressRing()
+        self.updateTimerStatusLabels()
 
     def connectSignalsToSlots(self) -> None:
         self.pomodoro_interface.pomodoro_timer_obj.timerStateChangedSignal.connect(
@@ -474,26 +565,33 @@ class MainWindow(KoncentroFluentWindow):
         self.bottomBar.pauseResumeButton.clicked.connect(
             lambda: self.spawnTaskStartedInfoBar(self.bottomBar.pauseResumeButton)
         )
-        self.pomodoro_interface.pomodoro_timer_obj.pomodoro_timer.timeout.connect(self.updateTaskTime)
         self.task_interface.completedTasksList.model().taskMovedSignal.connect(self.check_current_task_moved)
-        self.pomodoro_interface.pomodoro_timer_obj.sessionStoppedSignal.connect(self.updateTaskTimeDB)
         self.task_interface.todoTasksList.model().taskDeletedSignal.connect(self.check_current_task_deleted)
-        self.pomodoro_interface.pomodoro_timer_obj.durationSkippedSignal.connect(self.updateTaskTimeDB)
-        self.pomodoro_interface.pomodoro_timer_obj.sessionPausedSignal.connect(self.updateTaskTimeDB)
-        self.website_blocker_interface.blockTypeComboBox.currentIndexChanged.connect(
-            lambda: self.handle_website_blocker_settings_change()
-        )
-        self.website_blocker_interface.saveButton.clicked.connect(
-            lambda: self.handle_website_blocker_settings_change()
-        )  # todo: check if the list has changed before restarting the blocking
+        self.pomodoro_interface.pomodoro_timer_obj.suspendDetectedSignal.connect(self.onSuspendDetected)
+        self.website_blocker_interface.interfaceBuilt.connect(self.connectWebsiteBlockerInterfaceSignalsToSlots)
         self.workplace_list_model.current_workspace_changed.connect(load_workspace_settings)
         self.workplace_list_model.current_workspace_changed.connect(
-            self.website_blocker_interface.onCurrentWorkspaceChanged
+            lambda: setattr(self.task_time_tracker, "current_workspace_id", WorkspaceLookup.get_current_workspace_id())
         )
         self.workplace_list_model.current_workspace_changed.connect(
             self.task_interface.onCurrentWorkspaceChanged  # update task list when workspace is changed
         )
-        self.pomodoro_interface.pomodoro_timer_obj.pomodoro_timer.timeout.connect(self.updateTimerStatusLabels)
+        # the timer labels and the progress ring are only refreshed on a tick while they can be seen
+        self.ui_tick_dispatcher.subscribe(
+            lambda: self.bottomBar.timerLabel.setText(self.getTimerStatusText()),
+            lambda: is_widget_shown(self.bottomBar.timerLabel),
+        )
+        self.ui_tick_dispatcher.subscribe(
+            lambda: self.systemTray.tray_menu_timer_status_action.setText(self.getTimerStatusText()),
+            lambda: self.systemTray.is_tray_menu_open,
+        )
+        self.ui_tick_dispatcher.subscribe(
+            self.pomodoro_interface.updateProgressRing, lambda: is_widget_shown(self.pomodoro_interface.ProgressRing)
+        )
+        self.pomodoro_interface.pomodoro_timer_obj.pomodoro_timer.timeout.connect(self.ui_tick_dispatcher.tick)
+        self.stackedWidget.currentChanged.connect(lambda _index: self.ui_tick_dispatcher.catchUp())
+        # connected after SystemTray marks the menu as open, so that catchUp() refreshes its timer status
+        self.systemTray.tray_menu.aboutToShow.connect(self.ui_tick_dispatcher.catchUp)
         self.pomodoro_interface.pomodoro_timer_obj.timerStateChangedSignal.connect(self.updateTimerStatusLabels)
         workspace_specific_settings.enable_website_blocker.valueChanged.connect(
             self.on_website_block_enabled_setting_changed
@@ -502,7 +600,7 @@ class MainWindow(KoncentroFluentWindow):
             lambda: self.handle_website_blocker_settings_change()
         )
         self.stackedWidget.mousePressEvent = self.onStackedWidgetClicked
-        self.settings_interface.proxy_port_card.valueChanged.connect(self.update_proxy_port)
+        self.settings_interface.interfaceBuilt.connect(self.connectSettingsInterfaceSignalsToSlots)
 
         self.task_interface.todoTasksList.model().currentTaskChangedSignal.connect(
             lambda task_id: self.bottomBar.taskLabel.setText(
@@ -524,10 +622,18 @@ class MainWindow(KoncentroFluentWindow):
             self.pomodoro_interface, self.quitApplicationWithCleanup, self.toggleWindowVisibility
         )
 
-        self.stackedWidget.currentChanged.connect(self.showTutorial)
+        # for blocked hits reported by mitmdump
+        self.blocker_event_server.blockedHitsReceived.connect(self.onBlockedHitsReceived)
+        self.blocker_event_server.blockedHitsReceived.connect(self.blocked_hits_recorder.addHits)
+        self.workplace_list_model.current_workspace_changed.connect(
+            self.blocked_hits_recorder.onCurrentWorkspaceChanged
+        )
+        self.workplace_list_model.current_workspace_changed.connect(self.statistics_interface.onCurrentWorkspaceChanged)
+        self.pomodoro_interface.pomodoro_timer_obj.timerStateChangedSignal.connect(
+            lambda timerState: self.resetBlockedHitCount() if timerState == TimerState.WORK else None
+        )
 
-        # for mica effect
-        self.settings_interface.micaEnableChanged.connect(self.setMicaEffectEnabled)
+        self.stackedWidget.currentChanged.connect(self.showTutorial)
 
         self.pomodoro_interface.pomodoro_timer_obj.sessionPausedSignal.connect(self.setPauseResumeButtonsToPlayIcon)
         self.pomodoro_interface.pomodoro_timer_obj.sessionStoppedSignal.connect(self.setPauseResumeButtonsToPlayIcon)
@@ -540,11 +646,29 @@ class MainWindow(KoncentroFluentWindow):
             )
         )
 
-        self.settings_interface.setup_app_card.clicked.connect(lambda: self.preSetupMitmproxy(False))
-        self.settings_interface.reset_proxy_settings.clicked.connect(self.resetProxySettings)
+    def connectSettingsInterfaceSignalsToSlots(self) -> None:
+        settings_view: SettingsView = self.settings_interface.widget()
 
-    def updateTimerStatusLabels(self) -> None:
-        # check if timer is running
+        settings_view.proxy_port_card.valueChanged.connect(self.update_proxy_port)
+        # for mica effect
+        settings_view.micaEnableChanged.connect(self.setMicaEffectEnabled)
+        settings_view.setup_app_card.clicked.connect(lambda: self.preSetupMitmproxy(False))
+        settings_view.reset_proxy_settings.clicked.connect(self.resetProxySettings)
+
+        # the settings interface can be built while the timer is running
+        self.toggleUIElementsBasedOnTimerState(self.pomodoro_interface.pomodoro_timer_obj.getTimerState(), False)
+
+    def connectWebsiteBlockerInterfaceSignalsToSlots(self) -> None:
+        website_blocker_view: WebsiteBlockerView = self.website_blocker_interface.widget()
+
+        website_blocker_view.blockTypeComboBox.currentIndexChanged.connect(
+            lambda: self.handle_website_blocker_settings_change()
+        )
+        website_blocker_view.saveButton.clicked.connect(
+            lambda: self.handle_website_blocker_settings_change()
+        )  # todo: check if the list has changed before restarting the blocking
+
+    def getTimerStatusText(self) -> str:
         current_timer_state = self.pomodoro_interface.pomodoro_timer_obj.getTimerState()
         if current_timer_state in [TimerState.WORK, TimerState.BREAK, TimerState.LONG_BREAK]:
             # timer is running
@@ -565,23 +689,32 @@ class MainWindow(KoncentroFluentWindow):
             hh, mm, ss = convert_ms_to_hh_mm_ss(remaining_time_ms)
             t_hh, t_mm, t_ss = convert_ms_to_hh_mm_ss(total_session_length_ms)
 
-            timer_text = f"{current_timer_state.value}\n{hh:02d}:{mm:02d}:{ss:02d} / {t_hh:02d}:{t_mm:02d}:{t_ss:02d}"
-            self.bottomBar.timerLabel.setText(timer_text)
-            self.systemTray.tray_menu_timer_status_action.setText(timer_text)
+            return f"{current_timer_state.value}\n{hh:02d}:{mm:02d}:{ss:02d} / {t_hh:02d}:{t_mm:02d}:{t_ss:02d}"
 
-        else:
-            # timer is not running
-            hh, mm, ss = 0, 0, 0
-            t_hh, t_mm, t_ss = 0, 0, 0
+        # timer is not running
+        hh, mm, ss = 0, 0, 0
+        t_hh, t_mm, t_ss = 0, 0, 0
+
+        return f"Idle\n{hh:02d}:{mm:02d}:{ss:02d} / {t_hh:02d}:{t_mm:02d}:{t_ss:02d}"
+
+    def updateTimerStatusLabels(self) -> None:
+        """Sets the text of the timer labels whether they can be seen or not, ticks are handled by ui_tick_dispatcher"""
+        timer_text = self.getTimerStatusText()
+        self.bottomBar.timerLabel.setText(timer_text)
+        self.systemTray.tray_menu_timer_status_action.setText(timer_text)
+
+    def onBlockedHitsReceived(self, blocked_hits: list) -> None:
+        self.blocked_hit_count += len(blocked_hits)
+        self.systemTray.updateBlockedHitCount(self.blocked_hit_count)
 
-            timer_text = f"Idle\n{hh:02d}:{mm:02d}:{ss:02d} / {t_hh:02d}:{t_mm:02d}:{t_ss:02d}"
-            self.bottomBar.timerLabel.setText(timer_text)
-            self.systemTray.tray_menu_timer_status_action.setText(timer_text)
+    def resetBlockedHitCount(self) -> None:
+        self.blocked_hit_count = 0
+        self.systemTray.updateBlockedHitCount(self.blocked_hit_count)
 
     def resetProxySettings(self) -> None:
         logger.debug("Reset proxy settings button clicked")
-        self.website_blocker_manager.stop_blocking(delete_proxy=True)
-        self.settings_interface.proxy_port_card.setValue(8080)
+        self.website_blocker_manager.reset_proxy()
+        self.settings_interface.widget().proxy_port_card.setValue(8080)
 
         InfoBar.success(
             title="Proxy Settings Reset",
@@ -632,6 +765,8 @@ class MainWindow(KoncentroFluentWindow):
             and self.isSafeToShowTutorial
             and index == InterfaceType.TASK_INTERFACE.value
         ):
+            from tutorial.taskInterfaceTutorial import TaskInterfaceTutorial
+
             self.taskInterfaceTutorial = TaskInterfaceTutorial(self, InterfaceType.TASK_INTERFACE)
             self.taskInterfaceTutorial.start()
 
@@ -640,6 +775,8 @@ class MainWindow(KoncentroFluentWindow):
             and self.isSafeToShowTutorial
             and index == InterfaceType.POMODORO_INTERFACE.value
         ):
+            from tutorial.pomodoroInterfaceTutorial import PomodoroInterfaceTutorial
+
             self.pomodoroInterfaceTutorial = PomodoroInterfaceTutorial(self, InterfaceType.POMODORO_INTERFACE)
             self.pomodoroInterfaceTutorial.start()
 
@@ -648,6 +785,8 @@ class MainWindow(KoncentroFluentWindow):
             and self.isSafeToShowTutorial
             and index == InterfaceType.WEBSITE_BLOCKER_INTERFACE.value
         ):
+            from tutorial.websiteBlockerInterfaceTutorial import WebsiteBlockerInterfaceTutorial
+
             self.websiteBlockerInterfaceTutorial = WebsiteBlockerInterfaceTutorial(
                 self, InterfaceType.WEBSITE_BLOCKER_INTERFACE
             )
@@ -657,6 +796,8 @@ class MainWindow(KoncentroFluentWindow):
         self.isSafeToShowTutorial = True
 
         if not ConfigValues.HAS_COMPLETED_WORKSPACE_MANAGER_DIALOG_TUTORIAL and self.isSafeToShowTutorial:
+            from tutorial.workspaceManagerDialogTutorial import WorkspaceManagerDialogTutorial
+
             self.workspaceManagerTutorial = WorkspaceManagerDialogTutorial(self, InterfaceType.DIALOG)
             self.workspaceManagerTutorial.start()
 
@@ -801,6 +942,15 @@ class MainWindow(KoncentroFluentWindow):
         elif result == UpdateCheckResult.UPDATE_URL_DOES_NOT_EXIST or UpdateCheckResult.RATE_LIMITED:
             self.showTutorial(InterfaceType.TASK_INTERFACE.value)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self.ui_tick_dispatcher.catchUp()  # after being hidden in the system tray
+
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self.ui_tick_dispatcher.catchUp()
+
     def closeEvent(self, event: QCloseEvent) -> None:
         # Check if minimize to system tray is enabled
         if ConfigValues.SHOULD_MINIMIZE_TO_TRAY:
@@ -822,18 +972,48 @@ class MainWindow(KoncentroFluentWindow):
 
         logger.debug("Saving data and running cleanup tasks before quitting application...")
 
+        # adds the time since the last tick to the current task, the work interval is ended by the cleanup tasks
+        self.pomodoro_interface.pomodoro_timer_obj.stopTicking()
+        self.writeStartupSnapshot()
+
         # Run cleanup tasks in a background thread
         cleanup_thread = threading.Thread(
             target=self._cleanup_background_tasks,
         )
         cleanup_thread.start()
 
+    def writeStartupSnapshot(self) -> None:
+        """Saves what is needed to draw the first frame of the next start without waiting for the database"""
+        todo_model: TaskListModel = self.task_interface.todoTasksList.model()
+        completed_model: TaskListModel = self.task_interface.completedTasksList.model()
+        write_startup_snapshot(
+            get_snapshot_path(),
+            WorkspaceLookup.get_current_workspace_id(),
+            get_workspace_settings_values(),
+            {TaskType.TODO: todo_model.task_tree(), TaskType.COMPLETED: completed_model.task_tree()},
+        )
+
+    def reconcileStartupSnapshot(self) -> None:
+        """
+        Checks what was loaded from the startup snapshot against the database, called after the first frame. Only
+        the settings and tasks which differ are updated.
+        """
+        if get_startup_snapshot() is None:
+            return
+
+        with startup_profiler.phase("reconcileStartupSnapshot"):
+            load_workspace_settings()  # valueChanged is only emitted by settings whose value differs
+            self.task_interface.todoTasksList.model().reconcile_with_db()
+            self.task_interface.completedTasksList.model().reconcile_with_db()
+
     def _cleanup_background_tasks(self) -> None:
         logger.debug("Running cleanup tasks in background thread...")
         try:
-            self.updateTaskTimeDB()
+            self.task_time_tracker.close()
             self.website_blocker_manager.stop_blocking(delete_proxy=True)
             self.website_blocker_manager.cleanup()
+            self.blocker_event_server.stop()
+            self.blocked_hits_recorder.flush()
             self.themeListener.terminate()
             self.themeListener.deleteLater()
             logger.debug("Cleanup tasks completed successfully.")
@@ -903,6 +1083,10 @@ class MainWindow(KoncentroFluentWindow):
         self.switchToWebsiteBlockerInterfaceShortcut.activated.connect(
             lambda: self.switchTo(self.website_blocker_interface)
         )
+        self.switchToStatisticsInterfaceShortcut = QShortcut(
+            QKeySequence(Qt.KeyboardModifier.ControlModifier | Qt.Key.Key_4), self
+        )
+        self.switchToStatisticsInterfaceShortcut.activated.connect(lambda: self.switchTo(self.statistics_interface))
         self.switchToSettingsInterfaceShortcut = QShortcut(
             QKeySequence(Qt.KeyboardModifier.ControlModifier | Qt.Key.Key_0), self
         )
@@ -936,6 +1120,13 @@ class MainWindow(KoncentroFluentWindow):
                 self.switchToWebsiteBlockerInterfaceShortcut.key().toString(QKeySequence.SequenceFormat.NativeText)
             })"
         )
+        self.navigationInterface.panel.topLayout.itemAt(
+            NavPanelButtonPosition.STATISTICS_INTERFACE.value[1]
+        ).widget().setToolTip(
+            f"Statistics ({
+                self.switchToStatisticsInterfaceShortcut.key().toString(QKeySequence.SequenceFormat.NativeText)
+            })"
+        )
         self.navigationInterface.panel.bottomLayout.itemAt(
             NavPanelButtonPosition.SETTINGS_INTERFACE.value[1]
         ).widget().setToolTip(
@@ -964,6 +1155,7 @@ class MainWindow(KoncentroFluentWindow):
         self.switchToTaskInterfaceShortcut.setEnabled(False)
         self.switchToPomodoroInterfaceShortcut.setEnabled(False)
         self.switchToWebsiteBlockerInterfaceShortcut.setEnabled(False)
+        self.switchToStatisticsInterfaceShortcut.setEnabled(False)
         self.switchToSettingsInterfaceShortcut.setEnabled(False)
         self.openManageWorkspacesDialogShortcut.setEnabled(False)
         self.goBackShortcut.setEnabled(False)
@@ -972,6 +1164,7 @@ class MainWindow(KoncentroFluentWindow):
         self.switchToTaskInterfaceShortcut.setEnabled(True)
         self.switchToPomodoroInterfaceShortcut.setEnabled(True)
         self.switchToWebsiteBlockerInterfaceShortcut.setEnabled(True)
+        self.switchToStatisticsInterfaceShortcut.setEnabled(True)
         self.switchToSettingsInterfaceShortcut.setEnabled(True)
         self.openManageWorkspacesDialogShortcut.setEnabled(True)
         self.goBackShortcut.setEnabled(True)
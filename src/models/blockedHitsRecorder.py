@@ -0,0 +1,115 @@
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from PySide6.QtCore import QObject, QTimer, Signal
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert
+
+from constants import BLOCKED_HITS_FLUSH_INTERVAL, BLOCKED_HITS_ROWS_PER_STATEMENT
+from models.dbTables import BlockedHit
+from models.workspaceLookup import WorkspaceLookup
+from utils.db_utils import get_session
+
+# (workspace_id, domain, start of the minute in UTC)
+BucketKey = Tuple[int, str, datetime]
+
+
+def get_time_bucket(timestamp: float) -> datetime:
+    """Start of the minute in which timestamp lies, as a naive UTC datetime like the ones stored in blocked_hits"""
+    return datetime.fromtimestamp(timestamp - timestamp % 60, timezone.utc).replace(tzinfo=None)
+
+
+class BlockedHitsRecorder(QObject):
+    """
+    Merges blocked hits reported by mitmdump in memory and writes them to the blocked_hits table every
+    BLOCKED_HITS_FLUSH_INTERVAL seconds. Hits are counted per workspace, domain and minute before they are written, so
+    a client retrying a blocked URL thousands of times in a minute costs a single row update.
+    """
+
+    hitsFlushed = Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.current_workspace_id: Optional[int] = WorkspaceLookup.get_current_workspace_id()
+        self.pending_hits: Counter[BucketKey] = Counter()
+        # flush() is also called from the cleanup thread while quitting
+        self._lock = threading.Lock()
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(BLOCKED_HITS_FLUSH_INTERVAL * 1000)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start()
+
+    def onCurrentWorkspaceChanged(self) -> None:
+        self.current_workspace_id = WorkspaceLookup.get_current_workspace_id()
+
+    def addHits(self, blocked_hits: list) -> None:
+        """blocked_hits is a list of [domain, unix timestamp] as sent by block.py"""
+        if self.current_workspace_id is None:
+            return
+
+        with self._lock:
+            for domain, timestamp in blocked_hits:
+                self.pending_hits[(self.current_workspace_id, domain, get_time_bucket(timestamp))] += 1
+
+    def flush(self) -> bool:
+        """Writes the pending hits, returns True if any were written and hitsFlushed was emitted"""
+        with self._lock:
+            if not self.pending_hits:
+                return False
+            pending_hits = self.pending_hits
+            self.pending_hits = Counter()
+
+        rows = [
+            {"workspace_id": workspace_id, "domain": domain, "time_bucket": time_bucket, "count": count}
+            for (workspace_id, domain, time_bucket), count in pending_hits.items()
+        ]
+
+        try:
+            with get_session() as session:
+                # chunked to stay below SQLite's limit on the number of variables in a statement
+                for i in range(0, len(rows), BLOCKED_HITS_ROWS_PER_STATEMENT):
+                    statement = insert(BlockedHit).values(rows[i : i + BLOCKED_HITS_ROWS_PER_STATEMENT])
+                    statement = statement.on_conflict_do_update(
+                        index_elements=["workspace_id", "domain", "time_bucket"],
+                        set_={"count": BlockedHit.count + statement.excluded.count},
+                    )
+                    session.execute(statement)
+        except Exception as e:
+            logger.error(f"Could not save blocked hits: {e}")
+            # put back to be saved by the next flush, along with the hits received in the meantime
+            with self._lock:
+                self.pending_hits.update(pending_hits)
+            return False
+
+        logger.debug(f"Saved {sum(pending_hits.values())} blocked hits in {len(rows)} rows")
+        self.hitsFlushed.emit()
+        return True
+
+
+def get_blocked_hit_totals(workspace_id: int, since: datetime) -> List[Tuple[str, int]]:
+    """Number of blocked requests per domain since the given time, most blocked domain first"""
+    since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    with get_session(is_read_only=True) as session:
+        totals = (
+            session.query(BlockedHit.domain, func.sum(BlockedHit.count).label("total"))
+            .filter(BlockedHit.workspace_id == workspace_id, BlockedHit.time_bucket >= since)
+            .group_by(BlockedHit.domain)
+            .order_by(func.sum(BlockedHit.count).desc(), BlockedHit.domain)
+            .all()
+        )
+    return [(domain, int(total)) for domain, total in totals]
+
+
+def get_statistics_start_times() -> Dict[str, datetime]:
+    """Start times of the periods which can be selected in the statistics view"""
+    now = datetime.now().astimezone()
+    start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "Today": start_of_today,
+        "Last 7 days": start_of_today - timedelta(days=6),
+        "Last 30 days": start_of_today - timedelta(days=29),
+    }
@@ -1,5 +1,18 @@
+from typing import Dict, List
+
 from PySide6.QtCore import QSettings
-from qfluentwidgets import BoolValidator, ConfigItem, QConfig, RangeConfigItem, RangeValidator, Theme, qconfig
+from qfluentwidgets import (
+    BoolValidator,
+    ConfigItem,
+    EnumSerializer,
+    OptionsConfigItem,
+    OptionsValidator,
+    QConfig,
+    RangeConfigItem,
+    RangeValidator,
+    Theme,
+    qconfig,
+)
 
 from configPaths import settings_file_path
 from constants import (
@@ -12,8 +25,10 @@ from constants import (
     DEFAULT_WORK_DURATION,
     DEFAULT_WORK_INTERVALS,
     ORGANIZATION_NAME,
+    SuspendPolicy,
 )
 from models.dbTables import Workspace
+from models.startupSnapshot import get_startup_snapshot
 from prefabs.config.configItemSQL import ConfigItemSQL, RangeConfigItemSQL
 from prefabs.config.qconfigSQL import QConfigSQL, qconfig_custom
 from utils.detectWindowsVersion import isWin11
@@ -65,6 +80,13 @@ class AppSettings(QConfig):
     )
     mica_enabled = ConfigItem("MainWindow", "MicaEnabled", isWin11(), BoolValidator())
     should_minimize_to_tray = ConfigItem("MainWindow", "ShouldMinimizeToTray", False, BoolValidator())
+    suspend_policy = OptionsConfigItem(
+        "AppSettings",
+        "SuspendPolicy",
+        SuspendPolicy.PAUSE,
+        OptionsValidator(SuspendPolicy),
+        EnumSerializer(SuspendPolicy),
+    )
 
 
 workspace_specific_settings = WorkspaceSettings()
@@ -79,15 +101,64 @@ def load_workspace_settings() -> None:
     # to json file which stores settings and we are using db to store settings
 
 
+def get_workspace_settings_values() -> Dict[str, object]:
+    """Returns the values of the workspace settings keyed by the name of the column they are stored in"""
+    return {item.db_column.name: item.value for item in _workspace_setting_items()}
+
+
+def load_workspace_settings_from_snapshot() -> bool:
+    """
+    Loads the workspace settings from the startup snapshot instead of the database, returns False if there is no
+    snapshot. load_workspace_settings() has to be called after the first frame to pick up changes in the database.
+    """
+    startup_snapshot = get_startup_snapshot()
+    if startup_snapshot is None:
+        return False
+
+    for item in _workspace_setting_items():
+        if item.db_column.name in startup_snapshot.workspace_settings:
+            item.value = startup_snapshot.workspace_settings[item.db_column.name]
+    return True
+
+
+def _workspace_setting_items() -> List[ConfigItemSQL]:
+    return [item for item in vars(WorkspaceSettings).values() if isinstance(item, ConfigItemSQL)]
+
+
 def load_app_settings() -> None:
     qconfig.load(settings_file_path, app_settings)
 
 
-# A hacky way to apply the theme patch
-# Only works if called from here, has something to do with module level functions calls
-# which are called in mainWindow.py when config.py is imported
-# position of apply_qconfig_theme_patch(), load_app_settings() and load_workspace_settings() is key here
-apply_qconfig_theme_patch()
+_has_initialized_app_settings = False
+_has_initialized_workspace_settings = False
+
+
+def initialize_app_settings() -> None:
+    """
+    Patches the theme of qconfig and loads the settings global to the app from the settings file. Called once at
+    startup before the main window is built, as the theme and mica settings are needed to build it. Doesn't touch the
+    database, so it can run while the database is being bootstrapped.
+    """
+    global _has_initialized_app_settings
+    if _has_initialized_app_settings:
+        return
+    _has_initialized_app_settings = True
+
+    # patched before any widget asks qconfig for the theme
+    apply_qconfig_theme_patch()
+    load_app_settings()
+
+
+def initialize_workspace_settings() -> None:
+    """
+    Loads the settings of the current workspace from the startup snapshot, or from the database if there is none.
+    Called once at startup after the database is ready, later changes of the current workspace are loaded with
+    load_workspace_settings().
+    """
+    global _has_initialized_workspace_settings
+    if _has_initialized_workspace_settings:
+        return
+    _has_initialized_workspace_settings = True
 
-load_app_settings()
-load_workspace_settings()
+    if not load_workspace_settings_from_snapshot():
+        load_workspace_settings()
@@ -0,0 +1,70 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, QPersistentModelIndex, QTimer
+
+
+class DataChangedCoalescer(QObject):
+    """
+    Collects the rows of a tree model whose data changed in one turn of the event loop and emits dataChanged at the end
+    of it, once for every row however often it changed and once for every range of adjacent changed rows. Ranges don't
+    span rows which didn't change, as QTreeView measures every row of a range again.
+
+    Rows are kept as persistent indexes, so rows inserted, moved or removed before the end of the turn are accounted
+    for. The data of a row is read by the view after it has been changed anyway, so emitting later shows the same.
+    """
+
+    def __init__(self, model: QAbstractItemModel) -> None:
+        super().__init__(model)
+        self.model = model
+        # by the internal pointer of the index, so that a row which changes on every tick is only kept once
+        self._changed_indexes: Dict[object, Tuple[QPersistentModelIndex, Optional[Set[int]]]] = {}
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def add(self, index: QModelIndex, roles: Optional[List[int]] = None) -> None:
+        """Like emitting dataChanged for index alone, no roles means that any role may have changed"""
+        key = index.internalPointer()
+        persistent_index, changed_roles = self._changed_indexes.get(key, (QPersistentModelIndex(index), set()))
+        if roles and changed_roles is not None:
+            changed_roles.update(roles)
+        else:
+            changed_roles = None
+        self._changed_indexes[key] = (persistent_index, changed_roles)
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        self._flush_timer.stop()
+        changed_indexes = self._changed_indexes
+        self._changed_indexes = {}
+
+        # changed rows and their roles by parent
+        changed_rows: Dict[object, Tuple[QModelIndex, Dict[int, Optional[Set[int]]]]] = {}
+        for persistent_index, roles in changed_indexes.values():
+            if not persistent_index.isValid():  # removed meanwhile
+                continue
+            parent = persistent_index.parent()
+            key = parent.internalPointer() if parent.isValid() else None
+            changed_rows.setdefault(key, (parent, {}))[1][persistent_index.row()] = roles
+
+        for parent, roles_by_row in changed_rows.values():
+            rows = sorted(roles_by_row)
+            first_row = rows[0]
+            range_roles = roles_by_row[first_row]
+            for previous_row, row in zip(rows, rows[1:] + [None]):
+                if row == previous_row + 1:
+                    roles = roles_by_row[row]
+                    range_roles = range_roles | roles if range_roles is not None and roles is not None else None
+                    continue
+                self.model.dataChanged.emit(
+                    self.model.index(first_row, 0, parent),
+                    self.model.index(previous_row, 0, parent),
+                    sorted(range_roles) if range_roles is not None else [],
+                )
+                if row is not None:
+                    first_row = row
+                    range_roles = roles_by_row[row]
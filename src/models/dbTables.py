@@ -3,7 +3,20 @@ from enum import Enum
 from pathlib import Path
 from sqlite3 import Connection as SQLiteConnection
 
-from sqlalchemy import URL, Boolean, Column, DateTime, Engine, ForeignKey, Integer, String, create_engine, event
+from sqlalchemy import (
+    URL,
+    Boolean,
+    Column,
+    DateTime,
+    Engine,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    create_engine,
+    event,
+)
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.pool.base import _ConnectionRecord
@@ -84,6 +97,25 @@ class Task(Base):
     is_expanded = Column(Boolean, default=False, nullable=True)
 
     workspace = relationship("Workspace", back_populates="tasks")
+    work_intervals = relationship("WorkInterval", back_populates="task", cascade="all, delete-orphan")
+
+
+class WorkInterval(Base):
+    """
+    A stretch of time in which the timer ran in a work duration with the task as the current task, see
+    models/workIntervalRecorder.py. A row is inserted with ended_at unset when the stretch starts and finished when it
+    ends. elapsed_time of the task and its parent task is a rollup of these rows and the time set by hand in the edit
+    task time dialog, and is written in the same transaction which finishes a row.
+    """
+
+    __tablename__ = "work_intervals"
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+    started_at = Column(DateTime, nullable=False)  # in UTC
+    ended_at = Column(DateTime, nullable=True)  # in UTC, unset while the stretch is going on
+
+    task = relationship("Task", back_populates="work_intervals")
 
 
 class Workspace(Base):
@@ -115,6 +147,8 @@ class Workspace(Base):
 
     tasks = relationship("Task", back_populates="workspace", cascade="all, delete-orphan")
 
+    blocked_hits = relationship("BlockedHit", back_populates="workspace", cascade="all, delete-orphan")
+
 
 class CurrentWorkspace(Base):
     """
@@ -130,6 +164,8 @@ class CurrentWorkspace(Base):
 
 class BlocklistURL(Base):
     __tablename__ = URLListType.BLOCKLIST.value
+    # for looking up urls of a workspace while saving the difference between the old and new list of urls
+    __table_args__ = (Index(f"ix_{URLListType.BLOCKLIST.value}_workspace_id_url", "workspace_id", "url"),)
     id = Column(Integer, primary_key=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
     url = Column(String, nullable=False)
@@ -139,6 +175,8 @@ class BlocklistURL(Base):
 
 class BlocklistExceptionURL(Base):
     __tablename__ = URLListType.BLOCKLIST_EXCEPTION.value
+    # for looking up urls of a workspace while saving the difference between the old and new list of urls
+    __table_args__ = (Index(f"ix_{URLListType.BLOCKLIST_EXCEPTION.value}_workspace_id_url", "workspace_id", "url"),)
     id = Column(Integer, primary_key=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
     url = Column(String, nullable=False)
@@ -148,6 +186,8 @@ class BlocklistExceptionURL(Base):
 
 class AllowlistURL(Base):
     __tablename__ = URLListType.ALLOWLIST.value
+    # for looking up urls of a workspace while saving the difference between the old and new list of urls
+    __table_args__ = (Index(f"ix_{URLListType.ALLOWLIST.value}_workspace_id_url", "workspace_id", "url"),)
     id = Column(Integer, primary_key=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
     url = Column(String, nullable=False)
@@ -157,8 +197,28 @@ class AllowlistURL(Base):
 
 class AllowlistExceptionURL(Base):
     __tablename__ = URLListType.ALLOWLIST_EXCEPTION.value
+    # for looking up urls of a workspace while saving the difference between the old and new list of urls
+    __table_args__ = (Index(f"ix_{URLListType.ALLOWLIST_EXCEPTION.value}_workspace_id_url", "workspace_id", "url"),)
     id = Column(Integer, primary_key=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
     url = Column(String, nullable=False)
 
     workspace = relationship("Workspace", back_populates="allowlist_exception_urls")
+
+
+class BlockedHit(Base):
+    """
+    Number of requests to a domain blocked by the website blocker, aggregated per minute. Requests blocked in the same
+    minute increase count of the same row instead of adding new rows.
+    """
+
+    __tablename__ = "blocked_hits"
+    __table_args__ = (UniqueConstraint("workspace_id", "domain", "time_bucket", name="uq_blocked_hits_bucket"),)
+
+    id = Column(Integer, primary_key=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id"), nullable=False)
+    domain = Column(String, nullable=False)
+    time_bucket = Column(DateTime, nullable=False)  # start of the minute in UTC
+    count = Column(Integer, default=0, nullable=False)
+
+    workspace = relationship("Workspace", back_populates="blocked_hits")
@@ -0,0 +1,222 @@
+import os
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+from PySide6.QtCore import QByteArray, QDataStream, QFile, QIODevice, QSaveFile
+
+from configPaths import settings_dir
+from constants import STARTUP_SNAPSHOT_FILE_NAME, STARTUP_SNAPSHOT_FORMAT_VERSION
+from models.dbTables import TaskType
+from models.workspaceLookup import WorkspaceLookup
+from utils.getAppVersion import get_app_version
+
+SNAPSHOT_MAGIC = 0x4B4E5453
+
+
+class TaskRecord(NamedTuple):
+    task_id: int
+    task_name: str
+    task_position: int
+    elapsed_time: int
+    target_time: int
+    is_expanded: bool
+
+
+# root tasks in the order they are shown, each with its subtasks in the order they are shown
+TaskTree = List[Tuple[TaskRecord, List[TaskRecord]]]
+
+
+class StartupSnapshot:
+    """
+    Copy of what the main window shows right after startup, written when the app quits and read at the next start so
+    that the first frame can be drawn without waiting for the database. Whatever is taken from the snapshot is checked
+    against the database after the first frame and only the differences are applied.
+
+    The snapshot file is deleted as soon as it is read, so a snapshot is only ever used if the previous session quit
+    cleanly and the database can't have been changed without it being written again.
+    """
+
+    def __init__(
+        self, workspace_id: int, workspace_settings: Dict[str, object], task_trees: Dict[TaskType, TaskTree]
+    ) -> None:
+        self.workspace_id = workspace_id
+        self.workspace_settings = workspace_settings
+        self.task_trees = task_trees
+
+    def takeTaskTree(self, task_type: TaskType) -> Optional[TaskTree]:
+        """Returns the task tree of task_type only the first time it is asked for, later models use the database"""
+        return self.task_trees.pop(task_type, None)
+
+
+_startup_snapshot: Optional[StartupSnapshot] = None
+_has_read_startup_snapshot = False
+
+
+def get_snapshot_path() -> str:
+    return os.path.join(settings_dir, STARTUP_SNAPSHOT_FILE_NAME)
+
+
+def get_startup_snapshot() -> Optional[StartupSnapshot]:
+    """Reads and deletes the snapshot file on the first call, returns the same snapshot on later calls"""
+    global _startup_snapshot, _has_read_startup_snapshot
+
+    if not _has_read_startup_snapshot:
+        _has_read_startup_snapshot = True
+        _startup_snapshot = read_startup_snapshot(get_snapshot_path())
+        if os.path.exists(get_snapshot_path()):
+            os.remove(get_snapshot_path())
+
+        if (
+            _startup_snapshot is not None
+            and _startup_snapshot.workspace_id != WorkspaceLookup.get_current_workspace_id()
+        ):
+            logger.debug("Startup snapshot is of another workspace, ignoring it")
+            _startup_snapshot = None
+
+    return _startup_snapshot
+
+
+# every task is stored as these many int64 values, its id, position, elapsed time, target time, whether it is expanded
+# and the number of subtasks which follow it
+_VALUES_PER_TASK = 6
+
+
+def _write_task_tree(stream: QDataStream, task_tree: TaskTree) -> None:
+    # names and numbers are written as one list each so that reading them doesn't take a call per value, numbers are
+    # in the byte order of the machine as the snapshot never leaves it
+    task_names: List[str] = []
+    task_values = array("q")
+    for root_record, child_records in task_tree:
+        for record, child_count in [(root_record, len(child_records))] + [(child, 0) for child in child_records]:
+            task_names.append(record.task_name)
+            task_values.extend(
+                (
+                    record.task_id,
+                    record.task_position,
+                    record.elapsed_time,
+                    record.target_time,
+                    record.is_expanded,
+                    child_count,
+                )
+            )
+
+    stream.writeQStringList(task_names)
+    stream << QByteArray(task_values.tobytes())
+
+
+def _read_task_tree(stream: QDataStream) -> Optional[TaskTree]:
+    task_names = stream.readQStringList()
+    task_values_data = QByteArray()
+    stream >> task_values_data
+    task_values = array("q", task_values_data.data())
+    if len(task_values) != len(task_names) * _VALUES_PER_TASK:
+        return None
+
+    records = list(
+        map(
+            TaskRecord,
+            task_values[0::_VALUES_PER_TASK],
+            task_names,
+            task_values[1::_VALUES_PER_TASK],
+            task_values[2::_VALUES_PER_TASK],
+            task_values[3::_VALUES_PER_TASK],
+            map(bool, task_values[4::_VALUES_PER_TASK]),
+        )
+    )
+    child_counts = task_values[5::_VALUES_PER_TASK]
+
+    task_tree: TaskTree = []
+    i = 0
+    while i < len(records):
+        child_count = child_counts[i]
+        if child_count < 0 or i + child_count >= len(records):
+            return None
+        task_tree.append((records[i], records[i + 1 : i + 1 + child_count]))
+        i += 1 + child_count
+    return task_tree
+
+
+def write_startup_snapshot(
+    path: str, workspace_id: int, workspace_settings: Dict[str, object], task_trees: Dict[TaskType, TaskTree]
+) -> bool:
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.OpenModeFlag.WriteOnly)
+
+    stream.writeUInt32(SNAPSHOT_MAGIC)
+    stream.writeUInt16(STARTUP_SNAPSHOT_FORMAT_VERSION)
+    stream.writeQString(get_app_version())
+    stream.writeInt64(workspace_id)
+
+    stream.writeUInt32(len(workspace_settings))
+    for name, value in workspace_settings.items():
+        stream.writeQString(name)
+        stream.writeQVariant(value)
+
+    stream.writeUInt32(len(task_trees))
+    for task_type, task_tree in task_trees.items():
+        stream.writeQString(task_type.name)
+        _write_task_tree(stream, task_tree)
+
+    # QSaveFile only replaces the old file once everything is written, so a snapshot is never half written
+    snapshot_file = QSaveFile(path)
+    if not snapshot_file.open(QIODevice.OpenModeFlag.WriteOnly):
+        logger.error(f"Could not open {path} to write startup snapshot: {snapshot_file.errorString()}")
+        return False
+    snapshot_file.write(data)
+    if not snapshot_file.commit():
+        logger.error(f"Could not write startup snapshot to {path}: {snapshot_file.errorString()}")
+        return False
+
+    logger.debug(f"Wrote startup snapshot of {data.size()} bytes")
+    return True
+
+
+def read_startup_snapshot(path: str) -> Optional[StartupSnapshot]:
+    snapshot_file = QFile(path)
+    if not snapshot_file.exists():
+        return None
+    if not snapshot_file.open(QIODevice.OpenModeFlag.ReadOnly):
+        logger.warning(f"Could not open startup snapshot {path}: {snapshot_file.errorString()}")
+        return None
+    try:
+        return _read_startup_snapshot(QDataStream(snapshot_file))
+    finally:
+        snapshot_file.close()
+
+
+def _read_startup_snapshot(stream: QDataStream) -> Optional[StartupSnapshot]:
+    if stream.readUInt32() != SNAPSHOT_MAGIC or stream.readUInt16() != STARTUP_SNAPSHOT_FORMAT_VERSION:
+        logger.debug("Startup snapshot has an unknown format, ignoring it")
+        return None
+    if stream.readQString() != get_app_version():
+        logger.debug("Startup snapshot was written by another version of the app, ignoring it")
+        return None
+    workspace_id = stream.readInt64()
+
+    workspace_settings: Dict[str, object] = {}
+    for _ in range(stream.readUInt32()):
+        if stream.status() != QDataStream.Status.Ok:
+            break
+        name = stream.readQString()
+        workspace_settings[name] = stream.readQVariant()
+
+    task_trees: Dict[TaskType, TaskTree] = {}
+    for _ in range(stream.readUInt32()):
+        if stream.status() != QDataStream.Status.Ok:
+            break
+        task_type_name = stream.readQString()
+        task_tree = _read_task_tree(stream)
+        if task_tree is None:
+            logger.warning("Startup snapshot is corrupted, ignoring it")
+            return None
+        if task_type_name in TaskType.__members__:
+            task_trees[TaskType[task_type_name]] = task_tree
+
+    # reads past the end of a truncated file set the status instead of raising
+    if stream.status() != QDataStream.Status.Ok:
+        logger.warning("Startup snapshot is corrupted, ignoring it")
+        return None
+
+    logger.debug(f"Read startup snapshot of workspace {workspace_id}")
+    return StartupSnapshot(workspace_id, workspace_settings, task_trees)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from loguru import logger
 from PySide6.QtCore import (
@@ -9,16 +9,19 @@ from PySide6.QtCore import (
     QMimeData,
     QModelIndex,
     Qt,
+    QThread,
     Signal,
 )
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QWidget
 from qfluentwidgets import FluentIcon
-from sqlalchemy import update
+from sqlalchemy import select, update
 
 from constants import InvalidTaskDrop
 from models.config import AppSettings
+from models.dataChangedCoalescer import DataChangedCoalescer
 from models.dbTables import Task, TaskType
+from models.startupSnapshot import TaskRecord, TaskTree, get_startup_snapshot
 from models.workspaceLookup import WorkspaceLookup
 from utils.db_utils import get_session
 
@@ -27,6 +30,12 @@ class TaskNode:
     """
     Node class representing a task in a tree structure.
     A task can have subtasks, but subtasks cannot have their own subtasks.
+
+    The elapsed and target time of a task with subtasks are the sums of those of its subtasks. They are kept as running
+    totals which are changed by the difference whenever a subtask is added, removed or its time is set, so that a tick
+    of the timer costs the same however many subtasks the task has. The time of a subtask has to be set with
+    set_elapsed_time() and set_target_time(), and subtasks have to be added and removed with insert_child() and
+    take_child() for the totals to stay right.
     """
 
     def __init__(
@@ -56,14 +65,45 @@ class TaskNode:
 
     def add_child(self, child: "TaskNode") -> None:
         if child not in self.children:
-            self.children.append(child)
-            child.parent_node = self
+            self.insert_child(len(self.children), child)
+
+    def insert_child(self, position: int, child: "TaskNode") -> None:
+        """
+        Also inserts a subtask which is already at another position, which is how a subtask is moved within its
+        parent, the old position is removed with take_child() afterward
+        """
+        if not self.children:
+            # the time of a task with subtasks is only the sum of theirs
+            self.elapsed_time = 0
+            self.target_time = 0
+        self.children.insert(position, child)
+        child.parent_node = self
+        self.elapsed_time += child.elapsed_time
+        self.target_time += child.target_time
 
     def remove_child(self, child: "TaskNode") -> None:
         if child in self.children:
-            self.children.remove(child)
+            self.take_child(self.children.index(child))
             child.parent_node = None
 
+    def take_child(self, position: int) -> "TaskNode":
+        child = self.children.pop(position)
+        # the last subtask leaves its time to the task, which is the time the task already has
+        if self.children:
+            self.elapsed_time -= child.elapsed_time
+            self.target_time -= child.target_time
+        return child
+
+    def set_elapsed_time(self, elapsed_time: int) -> None:
+        if self.parent_node is not None:
+            self.parent_node.elapsed_time += elapsed_time - self.elapsed_time
+        self.elapsed_time = elapsed_time
+
+    def set_target_time(self, target_time: int) -> None:
+        if self.parent_node is not None:
+            self.parent_node.target_time += target_time - self.target_time
+        self.target_time = target_time
+
     def child_count(self) -> int:
         return len(self.children)
 
@@ -90,6 +130,72 @@ class TaskNode:
         self.is_expanded = expanded
 
 
+def _task_record(node: TaskNode) -> TaskRecord:
+    return TaskRecord(
+        task_id=node.task_id,
+        task_name=node.task_name,
+        task_position=node.task_position,
+        elapsed_time=node.elapsed_time,
+        target_time=node.target_time,
+        is_expanded=node.is_expanded,
+    )
+
+
+def load_task_tree(task_type: TaskType, workspace_id: Optional[int]) -> TaskTree:
+    """Loads the tasks of task_type in a workspace with a single query, safe to call from any thread"""
+    with get_session(is_read_only=True) as session:
+        rows = session.execute(
+            select(
+                Task.id,
+                Task.task_name,
+                Task.task_position,
+                Task.elapsed_time,
+                Task.target_time,
+                Task.is_expanded,
+                Task.is_parent_task,
+                Task.parent_task_id,
+            )
+            .where(Task.task_type == task_type)
+            .where(Task.workspace_id == workspace_id)
+            .order_by(Task.task_position)
+        ).all()
+
+    task_tree: TaskTree = []
+    child_records_by_parent_id: Dict[int, List[TaskRecord]] = {}
+    for row in rows:
+        if row.is_parent_task:
+            child_records: List[TaskRecord] = []
+            task_tree.append(
+                (
+                    TaskRecord(
+                        row.id, row.task_name, row.task_position, row.elapsed_time, row.target_time, row.is_expanded
+                    ),
+                    child_records,
+                )
+            )
+            child_records_by_parent_id[row.id] = child_records
+
+    for row in rows:
+        if not row.is_parent_task and row.parent_task_id in child_records_by_parent_id:
+            child_records_by_parent_id[row.parent_task_id].append(
+                TaskRecord(row.id, row.task_name, row.task_position, row.elapsed_time, row.target_time, False)
+            )
+
+    return task_tree
+
+
+class TaskTreeLoaderWorker(QThread):
+    taskTreeLoaded = Signal(object)  # TaskTree
+
+    def __init__(self, task_type: TaskType, workspace_id: Optional[int]) -> None:
+        super().__init__()
+        self.task_type = task_type
+        self.workspace_id = workspace_id
+
+    def run(self) -> None:
+        self.taskTreeLoaded.emit(load_task_tree(self.task_type, self.workspace_id))
+
+
 class TaskListModel(QAbstractItemModel):
     IDRole: Qt.ItemDataRole = Qt.ItemDataRole.UserRole + 1
     IconRole: Qt.ItemDataRole = Qt.ItemDataRole.UserRole + 3
@@ -109,7 +215,19 @@ class TaskListModel(QAbstractItemModel):
         self.current_task_id: Optional[int] = None
         self.root_nodes: List[TaskNode] = []  # List of root task nodes
         self._dragInProgress: bool = False  # Track if we're in a drag operation
-        self.load_data()
+        # incremented whenever tasks are changed, to know whether tasks loaded in the background are still current
+        self._revision: int = 0
+        self._task_tree_loader: Optional[TaskTreeLoaderWorker] = None
+        self._task_tree_loader_revision: int = 0
+        # dataChanged is emitted through it, once per turn of the event loop
+        self._data_changed = DataChangedCoalescer(self)
+
+        startup_snapshot = get_startup_snapshot()
+        task_tree = startup_snapshot.takeTaskTree(task_type) if startup_snapshot is not None else None
+        if task_tree is not None:
+            self._set_task_tree(task_tree)
+        else:
+            self.load_data()
 
     def setCurrentTaskID(self, id: int) -> None:
         self.current_task_id = id
@@ -119,57 +237,110 @@ class TaskListModel(QAbstractItemModel):
         return self.current_task_id
 
     def load_data(self) -> None:
-        current_workspace_id = WorkspaceLookup.get_current_workspace_id()
+        task_tree = load_task_tree(self.task_type, WorkspaceLookup.get_current_workspace_id())
+        self.beginResetModel()
+        self._set_task_tree(task_tree)
+        self.endResetModel()
+
+    def _set_task_tree(self, task_tree: TaskTree) -> None:
+        self._revision += 1
+        icon = FluentIcon.PLAY if self.task_type == TaskType.TODO else FluentIcon.MENU
         self.root_nodes = []
 
-        with get_session(is_read_only=True) as session:
-            tasks = (
-                session.query(Task)
-                .filter(Task.task_type == self.task_type)
-                .filter(Task.workspace_id == current_workspace_id)
-                .filter(Task.is_parent_task)
-                .order_by(Task.task_position)
-                .all()
+        for root_record, child_records in task_tree:
+            root_node = TaskNode(
+                task_id=root_record.task_id,
+                task_name=root_record.task_name,
+                task_position=root_record.task_position,
+                elapsed_time=root_record.elapsed_time,
+                target_time=root_record.target_time,
+                icon=icon,
+                is_expanded=root_record.is_expanded,
             )
-
-            # Create root nodes (main tasks)
-            for task in tasks:
-                node = TaskNode(
-                    task_id=task.id,
-                    task_name=task.task_name,
-                    task_position=task.task_position,
-                    elapsed_time=task.elapsed_time,
-                    target_time=task.target_time,
-                    icon=FluentIcon.PLAY if self.task_type == TaskType.TODO else FluentIcon.MENU,
-                    is_expanded=task.is_expanded,
-                )
-                self.root_nodes.append(node)
-
-            subtasks = (
-                session.query(Task)
-                .filter(Task.task_type == self.task_type)
-                .filter(Task.workspace_id == current_workspace_id)
-                .filter(~Task.is_parent_task)
-                .order_by(Task.task_position)
-                .all()
-            )
-
-            # create leaf nodes (subtasks)
-            for subtask in subtasks:
-                node = TaskNode(
-                    task_id=subtask.id,
-                    task_name=subtask.task_name,
-                    task_position=subtask.task_position,
-                    elapsed_time=subtask.elapsed_time,
-                    target_time=subtask.target_time,
-                    icon=FluentIcon.PLAY if self.task_type == TaskType.TODO else FluentIcon.MENU,
+            for child_record in child_records:
+                TaskNode(
+                    task_id=child_record.task_id,
+                    task_name=child_record.task_name,
+                    task_position=child_record.task_position,
+                    elapsed_time=child_record.elapsed_time,
+                    target_time=child_record.target_time,
+                    icon=icon,
+                    parent=root_node,
                     is_expanded=False,
                 )
-                parent_node = next((n for n in self.root_nodes if n.task_id == subtask.parent_task_id), None)
-                if parent_node:
-                    parent_node.add_child(node)
+            self.root_nodes.append(root_node)
 
-        self.layoutChanged.emit()
+    def task_tree(self) -> TaskTree:
+        """Returns the tasks of the model in the form they are stored in the startup snapshot"""
+        return [
+            (_task_record(root_node), [_task_record(child_node) for child_node in root_node.children])
+            for root_node in self.root_nodes
+        ]
+
+    def reconcile_with_db(self) -> None:
+        """
+        Loads the tasks from the database in a background thread and applies the differences to the model, used when
+        the model was filled from the startup snapshot
+        """
+        if self._task_tree_loader is not None and self._task_tree_loader.isRunning():
+            return
+
+        self._task_tree_loader = TaskTreeLoaderWorker(self.task_type, WorkspaceLookup.get_current_workspace_id())
+        self._task_tree_loader_revision = self._revision
+        self._task_tree_loader.taskTreeLoaded.connect(self._onTaskTreeLoaded)
+        self._task_tree_loader.start()
+
+    def _onTaskTreeLoaded(self, task_tree: TaskTree) -> None:
+        self.apply_task_tree(task_tree, self._task_tree_loader_revision)
+
+    def apply_task_tree(self, task_tree: TaskTree, revision: Optional[int] = None) -> None:
+        """
+        Makes the model show task_tree while changing as little as possible, so that the list isn't reset when
+        nothing or only a few values differ.
+
+        If revision is given and the model has been changed since then, task_tree is older than the model and it is
+        ignored, any change made to the model has been saved to the database anyway.
+        """
+        if revision is not None and revision != self._revision:
+            logger.debug(f"Tasks of {self.task_type} changed while loading them from the database, not applying them")
+            return
+
+        # whether a task is expanded is saved to the database only along with other changes, so the model has the
+        # latest value
+        expanded_task_ids = {root_node.task_id for root_node in self.root_nodes if root_node.is_expanded}
+        task_tree = [
+            (root_record._replace(is_expanded=root_record.task_id in expanded_task_ids), child_records)
+            for root_record, child_records in task_tree
+        ]
+
+        current_task_tree = self.task_tree()
+        if task_tree == current_task_tree:
+            logger.debug(f"Tasks of {self.task_type} are the same as in the database")
+            return
+
+        def task_ids(tree: TaskTree) -> List[List[int]]:
+            return [[root.task_id] + [child.task_id for child in children] for root, children in tree]
+
+        if task_ids(task_tree) != task_ids(current_task_tree):
+            logger.debug(f"Tasks of {self.task_type} were added, removed or moved in the database, resetting model")
+            self.beginResetModel()
+            self._set_task_tree(task_tree)
+            self.endResetModel()
+            return
+
+        changed_count = 0
+        for root_node, (root_record, child_records) in zip(self.root_nodes, task_tree):
+            for node, record in zip([root_node] + root_node.children, [root_record] + child_records):
+                if _task_record(node) != record:
+                    node.task_name = record.task_name
+                    node.task_position = record.task_position
+                    # the time of a task with subtasks follows from theirs
+                    if node.is_leaf():
+                        node.set_elapsed_time(record.elapsed_time)
+                        node.set_target_time(record.target_time)
+                    self._data_changed.add(self.getIndexByNode(node))
+                    changed_count += 1
+        logger.debug(f"Updated {changed_count} tasks of {self.task_type} from the database")
 
     def get_node(self, index: QModelIndex) -> Optional[TaskNode]:
         """Get the node associated with a given index"""
@@ -266,34 +437,42 @@ class TaskListModel(QAbstractItemModel):
         if node is None:
             return False
 
+        if role in (Qt.ItemDataRole.DisplayRole, self.ElapsedTimeRole, self.TargetTimeRole):
+            self._revision += 1
+
         if role == Qt.ItemDataRole.DisplayRole:
             task_name = value.strip()
             if task_name:
                 node.task_name = task_name
                 if update_db:
                     self.update_db()
-                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+                self._data_changed.add(index, [Qt.ItemDataRole.DisplayRole])
                 return True
         elif role == self.ElapsedTimeRole:
-            node.elapsed_time = value
+            # the time of the parent task changes with it, both are saved in the same transaction
+            node.set_elapsed_time(value)
             if update_db:
                 self.update_db()
-            self.dataChanged.emit(index, index, [self.ElapsedTimeRole])
+            self._data_changed.add(index, [self.ElapsedTimeRole])
+            if index.parent().isValid():
+                self._data_changed.add(index.parent(), [self.ElapsedTimeRole])
             return True
         elif role == self.TargetTimeRole:
-            node.target_time = value
+            node.set_target_time(value)
             if update_db:
                 self.update_db()
-            self.dataChanged.emit(index, index, [self.TargetTimeRole])
+            self._data_changed.add(index, [self.TargetTimeRole])
+            if index.parent().isValid():
+                self._data_changed.add(index.parent(), [self.TargetTimeRole])
             return True
         elif role == self.IconRole:
             node.icon = value
-            self.dataChanged.emit(index, index, [self.IconRole])
+            self._data_changed.add(index, [self.IconRole])
             return True
         elif role == self.IsExpandedRole:
+            # set by TaskList when it expands or collapses the task and only saved for the next start, nothing is drawn
+            # differently, so no dataChanged, which would make the view measure the rows again
             node.is_expanded = value
-            self.dataChanged.emit(index, index, [self.IsExpandedRole])
-            self.layoutChanged.emit()
 
         return False
 
@@ -353,6 +532,7 @@ class TaskListModel(QAbstractItemModel):
     def dropMimeData(self, data: QMimeData, action: Qt.DropAction, row: int, column: int, parent: QModelIndex) -> bool:
         # Clear drag in progress flag since we're handling the drop
         self._dragInProgress = False
+        self._revision += 1
         logger.debug(f"row: {row}, column: {column}, parent: {parent}, action: {action}")
 
         if not data.hasFormat("application/x-qabstractitemmodeldatalist"):
@@ -453,13 +633,18 @@ class TaskListModel(QAbstractItemModel):
                     .all()
                 )
 
-                # create child nodes
+                # create child nodes, the time of the task is the sum of theirs
                 for subtask in subtasks:
+                    subtask_elapsed_time = subtask.elapsed_time
+                    if self.task_type == TaskType.TODO and self.current_task_id == subtask.id:
+                        existing_node = self.getTaskNodeById(subtask.id)
+                        if existing_node:
+                            subtask_elapsed_time = existing_node.elapsed_time
                     _child_node = TaskNode(
                         task_id=subtask.id,
                         task_name=subtask.task_name,
                         task_position=subtask.task_position,
-                        elapsed_time=subtask.elapsed_time,
+                        elapsed_time=subtask_elapsed_time,
                         target_time=subtask.target_time,
                         icon=FluentIcon.PLAY if self.task_type == TaskType.TODO else FluentIcon.MENU,
                         parent=node,  # Set the new parent node
@@ -503,9 +688,6 @@ class TaskListModel(QAbstractItemModel):
 
         self.update_db()
 
-        # emit layoutChanged to notify the view of the changes
-        self.layoutChanged.emit()
-
         logger.debug(f"Task type: {self.task_type}")
         logger.debug(f"Root nodes after drop: {[node.task_id for node in self.root_nodes]}")
 
@@ -588,11 +770,10 @@ class TaskListModel(QAbstractItemModel):
                 logger.debug(f"Child dropped at same position: {original_pos}")
                 return False
 
-        # insert child task at new position
+        # insert child task at new position, its old position is removed by removeRows()
         self.beginInsertRows(parent, drop_position, drop_position + len(drop_nodes) - 1)
-        droppedOnParentNode.children = (
-            droppedOnParentNode.children[:drop_position] + drop_nodes + droppedOnParentNode.children[drop_position:]
-        )
+        for i, drop_node in enumerate(drop_nodes):
+            droppedOnParentNode.insert_child(drop_position + i, drop_node)
         self.endInsertRows()
 
         self.update_db()
@@ -652,8 +833,17 @@ class TaskListModel(QAbstractItemModel):
         """
         Used to insert a new task in the list
         """
+        self._revision += 1
         self.beginInsertRows(parent, row, row)
 
+        # the first subtask of a task takes over its time, the time of a task with subtasks is the sum of theirs. The
+        # time of the task stays the same, so only the subtask has to be saved
+        elapsed_time = 0
+        target_time = 0
+        if parent.isValid() and self.get_node(parent).is_leaf():
+            elapsed_time = self.get_node(parent).elapsed_time
+            target_time = self.get_node(parent).target_time
+
         with get_session() as session:
             if parent.isValid():  # add subtask
                 task = Task(
@@ -661,6 +851,8 @@ class TaskListModel(QAbstractItemModel):
                     task_name=task_name,
                     task_type=task_type,
                     task_position=row,
+                    elapsed_time=elapsed_time,
+                    target_time=target_time,
                     is_parent_task=False,
                     parent_task_id=self.get_node(parent).task_id,
                     is_expanded=False,
@@ -683,8 +875,8 @@ class TaskListModel(QAbstractItemModel):
                 task_id=new_id,
                 task_name=task_name,
                 task_position=row,
-                elapsed_time=0,
-                target_time=0,
+                elapsed_time=elapsed_time,
+                target_time=target_time,
                 icon=FluentIcon.PLAY if self.task_type == TaskType.TODO else FluentIcon.MENU,
                 parent=parent_node,
                 is_expanded=False,
@@ -704,10 +896,9 @@ class TaskListModel(QAbstractItemModel):
             logger.debug(f"Creating new task node: {newRootNode.task_id}")
             self.root_nodes.insert(row, newRootNode)
 
-        self.taskAddedSignal.emit(new_id)
-
         self.endInsertRows()
-        self.layoutChanged.emit()
+
+        self.taskAddedSignal.emit(new_id)
         return True
 
     def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
@@ -723,6 +914,8 @@ class TaskListModel(QAbstractItemModel):
             logger.debug(f"Ignoring removeRows during drag operation for rows {row} to {row + count - 1}")
             return True
 
+        self._revision += 1
+
         if parent.isValid():
             # Removing subtasks
             parent_node = self.get_node(parent)
@@ -730,8 +923,10 @@ class TaskListModel(QAbstractItemModel):
                 self.beginRemoveRows(parent, row, row + count - 1)
                 for i in range(count):
                     if row < len(parent_node.children):
-                        parent_node.children.pop(row)
+                        parent_node.take_child(row)
                 self.endRemoveRows()
+                # without the time of the removed subtasks
+                self._data_changed.add(parent, [self.ElapsedTimeRole, self.TargetTimeRole])
 
             # update task positions
             for i, node in enumerate(parent_node.children):
@@ -752,7 +947,6 @@ class TaskListModel(QAbstractItemModel):
                 node.task_position = i
 
         self.update_db()
-        self.layoutChanged.emit()
         return True
 
     def finishDrag(self) -> None:
@@ -768,10 +962,15 @@ class TaskListModel(QAbstractItemModel):
         Delete tasks
         """
         logger.debug(f"Deleting parent/child task at row: {row}")
+        self._revision += 1
 
         taskIDs: Optional[List[int]] = []  # stores task IDs to be deleted, multiple IDs as when parent task is
         # deleted, all its child tasks need to be deleted as well
 
+        # the time of the parent task without the deleted subtask, saved in the same transaction as the deletion. The
+        # model is updated by removeRows()
+        parent_task_times: Optional[Dict[str, int]] = None
+
         # if to be deleted task is a subtask
         if parent.isValid():
             parent_node = self.get_node(parent)
@@ -779,27 +978,12 @@ class TaskListModel(QAbstractItemModel):
                 child_node = parent_node.children[row]
                 taskIDs.append(child_node.task_id)
 
-                # and it is the only child of the parent task, then set the parent's time equal to this last child's
-                # time'
-                if len(parent_node.children) == 1:
-                    childTargetTime = child_node.target_time
-                    childElapsedTime = child_node.elapsed_time
-                    parent_index = self.getIndexByNode(parent_node)
-                    self.setData(parent_index, childTargetTime, self.TargetTimeRole)
-                    self.setData(parent_index, childElapsedTime, self.ElapsedTimeRole)
-                    self.update_db()
-                # else set the parent's time as sum of all its children except the to be deleted child
-                else:
-                    elapsedTime = 0
-                    targetTime = 0
-                    for child in parent_node.children:
-                        if child != child_node:
-                            elapsedTime += child.elapsed_time
-                            targetTime += child.target_time
-                    parent_index = self.getIndexByNode(parent_node)
-                    self.setData(parent_index, targetTime, self.TargetTimeRole)
-                    self.setData(parent_index, elapsedTime, self.ElapsedTimeRole)
-                    self.update_db()
+                # the last subtask leaves its time to the parent task, which already has it
+                if len(parent_node.children) > 1:
+                    parent_task_times = {
+                        "elapsed_time": parent_node.elapsed_time - child_node.elapsed_time,
+                        "target_time": parent_node.target_time - child_node.target_time,
+                    }
         else:
             # Deleting root task
             if row < len(self.root_nodes):
@@ -820,13 +1004,16 @@ class TaskListModel(QAbstractItemModel):
             task = session.query(Task).get(last_id)
             if task:
                 session.delete(task)
+            if parent_task_times is not None:
+                session.execute(
+                    update(Task).where(Task.id == self.get_node(parent).task_id).values(**parent_task_times)
+                )
 
         logger.debug(f"Deleting tasks with ID: {taskIDs}")
         self.removeRows(row, 1, parent)
 
         for taskID in taskIDs:
             self.taskDeletedSignal.emit(taskID)
-        self.layoutChanged.emit()
         return True
 
     def getTaskNameById(self, task_id: int) -> Optional[str]:
@@ -0,0 +1,139 @@
+from typing import Dict, Optional
+
+from loguru import logger
+from PySide6.QtCore import QModelIndex, QObject
+
+from constants import TimerState
+from models.taskListModel import TaskListModel
+from models.timer import PomodoroTimer
+from models.timerJournal import TimerCheckpoint, TimerJournal, now_ms
+from models.workIntervalRecorder import WorkIntervalRecorder
+
+
+class TaskTimeTracker(QObject):
+    """
+    Adds the time the pomodoro timer runs in work durations to the current task of the todo list, saves it as work
+    intervals (see models/workIntervalRecorder.py) and checkpoints it into the timer journal on every tick (see
+    models/timerJournal.py). Works with the timer and the model alone, so that it can be run without the main window.
+    """
+
+    def __init__(
+        self,
+        pomodoro_timer_obj: PomodoroTimer,
+        todo_model: TaskListModel,
+        timer_journal: TimerJournal,
+        workspace_id: Optional[int],
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.pomodoro_timer_obj = pomodoro_timer_obj
+        self.todo_model = todo_model
+        self.timer_journal = timer_journal
+        # kept here instead of being looked up in the database for every checkpoint, set when the workspace changes
+        self.current_workspace_id = workspace_id
+        # saves the time worked on tasks when the timer starts and stops running instead of every few seconds
+        self.work_interval_recorder = WorkIntervalRecorder()
+
+        self.pomodoro_timer_obj.timeElapsedSignal.connect(self.updateTaskTime)
+        # after updateTaskTime so that the checkpoint includes the time of the tick
+        self.pomodoro_timer_obj.timeElapsedSignal.connect(lambda _timer_state, _elapsed_time: self.checkpointTimer())
+        self.pomodoro_timer_obj.sessionStartedSignal.connect(self.syncWorkInterval)
+        self.pomodoro_timer_obj.sessionStoppedSignal.connect(self.syncWorkInterval)
+        self.pomodoro_timer_obj.timerStateChangedSignal.connect(
+            lambda _timer_state, _is_skipped: self.syncWorkInterval()
+        )
+        self.pomodoro_timer_obj.durationSkippedSignal.connect(self.syncWorkInterval)
+        self.pomodoro_timer_obj.sessionPausedSignal.connect(self.syncWorkInterval)
+        self.todo_model.currentTaskChangedSignal.connect(lambda _task_id: self.syncWorkInterval())
+
+    def updateTaskTime(self, timer_state: TimerState, elapsed_time: int) -> None:
+        """
+        Adds the time the timer ran in a work duration to the current task, connected to timeElapsedSignal. Only the
+        model is updated, the database is updated when the work interval ends, see syncWorkInterval()
+        """
+        if timer_state != TimerState.WORK or self.todo_model.currentTaskID() is None:
+            return
+
+        self.work_interval_recorder.addElapsedTime(elapsed_time)
+
+        # the time of the parent task is updated along with it, see TaskNode
+        model = self.todo_model
+        currentTaskIndex: QModelIndex = model.currentTaskIndex()
+        elapsedTime = model.data(currentTaskIndex, TaskListModel.ElapsedTimeRole) + elapsed_time
+        model.setData(currentTaskIndex, elapsedTime, TaskListModel.ElapsedTimeRole, update_db=False)
+
+    def syncWorkInterval(self) -> None:
+        """
+        Starts or ends the work interval of the current task, so that one is open exactly while the timer runs in a
+        work duration with a current task. Called whenever the timer starts, stops or changes state and whenever the
+        current task changes
+        """
+        current_task_id = self.todo_model.currentTaskID()
+        is_working = (
+            current_task_id is not None
+            and self.pomodoro_timer_obj.getTimerState() == TimerState.WORK
+            and self.pomodoro_timer_obj.pomodoro_timer.isActive()
+        )
+
+        recorder = self.work_interval_recorder
+        if recorder.isRecording() and (not is_working or recorder.task_id != current_task_id):
+            self.endWorkInterval()
+        if is_working and not recorder.isRecording():
+            recorder.startInterval(current_task_id)
+
+        self.checkpointTimer()
+
+    def getRecordedTaskElapsedTimes(self) -> Dict[int, int]:
+        """
+        Returns the elapsed time of the task of the open work interval and of its parent, whose time is the sum of the
+        time of its subtasks, by task id. Missing if the task has been deleted or moved to the completed list
+        meanwhile, which saves the time itself
+        """
+        task_elapsed_times = {}
+        if not self.work_interval_recorder.isRecording():
+            return task_elapsed_times
+
+        node = self.todo_model.getTaskNodeById(self.work_interval_recorder.task_id)
+        while node is not None and node.task_id is not None:
+            task_elapsed_times[node.task_id] = node.elapsed_time
+            node = node.parent_node
+        return task_elapsed_times
+
+    def endWorkInterval(self) -> None:
+        recorder = self.work_interval_recorder
+        if not recorder.isRecording():
+            return
+
+        try:
+            recorder.endInterval(self.getRecordedTaskElapsedTimes())
+        except Exception as e:
+            logger.error(f"Could not save work interval: {e}")
+
+    def checkpointTimer(self) -> None:
+        """
+        Writes the state of the timer and the time of the open work interval to the timer journal, called on every
+        tick and whenever syncWorkInterval() is. Only copies a few bytes into memory, see models/timerJournal.py
+        """
+        recorder = self.work_interval_recorder
+        self.timer_journal.write(
+            TimerCheckpoint(
+                written_at=now_ms(),
+                is_clean_exit=False,
+                timer_state=self.pomodoro_timer_obj.getTimerState(),
+                is_running=self.pomodoro_timer_obj.isTicking(),
+                session_progress=self.pomodoro_timer_obj.getSessionProgress(),
+                sessions_completed=self.pomodoro_timer_obj.getSessionsCompleted(),
+                remaining_time=self.pomodoro_timer_obj.getExactRemainingTime(),
+                workspace_id=self.current_workspace_id,
+                current_task_id=self.todo_model.currentTaskID(),
+                interval_id=recorder.interval_id,
+                interval_elapsed_time=recorder.elapsed_time,
+                task_elapsed_times=self.getRecordedTaskElapsedTimes(),
+            )
+        )
+
+    def close(self) -> None:
+        """Saves the open work interval and marks the timer journal as written by a clean exit"""
+        self.endWorkInterval()
+        # everything has been saved, so the timer journal has nothing to recover at the next start
+        self.timer_journal.close()
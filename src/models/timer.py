@@ -1,13 +1,40 @@
+import time
+from typing import Callable, Optional
+
 from loguru import logger
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 
 from configValues import ConfigValues
-from constants import TimerState
+from constants import SUSPEND_DETECTION_THRESHOLD, TIMER_EARLY_WAKEUP_TOLERANCE, SuspendPolicy, TimerState
+
+
+def monotonic_ms() -> int:
+    return time.monotonic_ns() // 1_000_000
+
+
+def wall_clock_ms() -> int:
+    """
+    Clock which keeps counting while the computer is suspended, which the monotonic clock doesn't do on Linux and
+    macOS. CLOCK_BOOTTIME is used where there is one as setting the system time doesn't change it
+    """
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        return time.clock_gettime_ns(time.CLOCK_BOOTTIME) // 1_000_000
+    return time.time_ns() // 1_000_000
 
 
 class PomodoroTimer(QObject):  # Inherit from QObject to support signals
     """
     Core functionality of the Pomodoro Timer
+
+    While a duration runs, the time it ends at is kept as a deadline on a monotonic clock and the remaining time is
+    worked out from the clock on every tick, so late ticks don't add up. Each tick is scheduled for the next whole
+    second before the deadline, and a duration which is started automatically after another one starts at the deadline
+    of the previous one instead of at the tick which noticed it ended.
+
+    If the computer is suspended while a duration runs, the next tick notices it either as a gap between the monotonic
+    and the wall clock, if the monotonic clock doesn't count suspended time, or as a tick which wakes up far too late,
+    if it does. The time is then left out, counted or the session stopped according to ConfigValues.SUSPEND_POLICY,
+    and counted time is reported by a single timeElapsedSignal instead of a tick for every second missed.
     """
 
     # emitted every time the timer state changes, regardless of whether it is due to skipping the duration or not
@@ -22,12 +49,32 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
     # corresponding autostart setting is set to false
     sessionStartedSignal: Signal = Signal()
     durationSkippedSignal: Signal = Signal()
+    # emitted with the timer state and the time in ms the timer ran in it since it was last emitted, on every tick and
+    # when the timer is paused, skipped or stopped. Adds up to the exact time the timer ran
+    timeElapsedSignal: Signal = Signal(TimerState, int)
+    # emitted with about how long the computer was suspended in ms and the policy which was applied, after it has been
+    # applied. Not emitted if the duration ended before the computer was suspended
+    suspendDetectedSignal: Signal = Signal(int, SuspendPolicy)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        clock: Optional[Callable[[], int]] = None,
+        wall_clock: Optional[Callable[[], int]] = None,
+        timer_factory: Callable[[], QTimer] = QTimer,
+    ) -> None:
+        """
+        clock, wall_clock and timer_factory are only passed to run the timer on simulated time, in which case the
+        timers made by timer_factory have to fire according to clock
+        """
         super().__init__()
+        self.clock: Callable[[], int] = clock or monotonic_ms  # in milliseconds, has to be monotonic
+        # in milliseconds, only compared with clock to notice time clock didn't count while the computer was suspended
+        self.wall_clock: Callable[[], int] = wall_clock or wall_clock_ms
         self.previous_timer_state: TimerState = TimerState.NOTHING
         self.timer_state: TimerState = TimerState.NOTHING
-        self.pomodoro_timer: QTimer = QTimer()
+        self.pomodoro_timer: QTimer = timer_factory()
+        self.pomodoro_timer.setSingleShot(True)
+        self.pomodoro_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.session_progress: float = 0  # would be incremented by 0.5 after every work ended signal is emitted
         # would also be incremented by 0.5 after every break ended signal is emitted
         # starts out at 0 which means that the timer state is NOTHING
@@ -38,6 +85,13 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
         self.remaining_time: int = 0  # will change according to BREAK_DURATION, WORK_DURATION, LONG_BREAK_DURATION
         self.timer_resolution: int = 1000  # in milliseconds
 
+        self._deadline: Optional[int] = None  # clock time at which the running duration ends, None if not running
+        self._last_elapsed_time: Optional[int] = None  # clock time up to which timeElapsedSignal has been emitted
+        # deadline of the duration which just ended, the next duration starts from it if it is started automatically
+        self._duration_ended_at: Optional[int] = None
+        self._next_tick_at: int = 0  # clock time the next tick is scheduled for
+        self._wall_clock_offset: int = 0  # wall_clock minus clock when the next tick was scheduled
+
         # self.pomodoro_timer.timeout.connect(self.sessionEnded)
         self.pomodoro_timer.timeout.connect(self.decreaseRemainingTime)
 
@@ -89,7 +143,7 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
         """
         if self.remaining_time > 0 and not self.pomodoro_timer.isActive():  # if timer is paused
             logger.info("Resuming timer")
-            self.pomodoro_timer.start(self.timer_resolution)
+            self._startTicking(self.clock())
         else:  # if timer is not paused then set timer duration and start timer
             if self.getTimerState() == TimerState.NOTHING:
                 logger.info("In Nothing State")
@@ -107,13 +161,15 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
                 logger.info("Starting long break session")
 
     def startDuration(self) -> None:
-        self.pomodoro_timer.start(self.timer_resolution)
+        if self._deadline is None:
+            start_time = self._duration_ended_at if self._duration_ended_at is not None else self.clock()
+            self._startTicking(start_time)
         self.sessionStartedSignal.emit()
 
     def pauseDuration(self) -> None:
         self.previous_timer_state = self.timer_state
         logger.info("Timer is paused now")
-        self.pomodoro_timer.stop()
+        self.stopTicking()
         self.sessionPausedSignal.emit()
 
     def durationEnded(self, isSkipped: bool = False) -> None:
@@ -163,6 +219,7 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
             raise NotImplementedError("Skipping duration when timer is not doing anything isn't implemented currently")
         else:
             logger.info("Skipping duration when timer is doing something")
+            self.stopTicking()
             self.remaining_time = 0
             self.durationEnded(isSkipped=True)
 
@@ -174,18 +231,117 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
         """
         self.remaining_time = duration
 
+    def _startTicking(self, start_time: int) -> None:
+        """Runs the remaining time of the duration from start_time on"""
+        self._deadline = start_time + self.remaining_time
+        self._last_elapsed_time = start_time
+        remaining_time = self._deadline - self.clock()
+        if remaining_time < self.remaining_time:  # started from the deadline of the previous duration
+            # 0 if it is over already, which happens when time the computer was suspended for is counted
+            self.remaining_time = max(self._roundUpToTick(remaining_time), 0)
+        self._scheduleNextTick(remaining_time)
+
+    def stopTicking(self) -> None:
+        """
+        Stops the timer where it is. The remaining time is kept to the millisecond, so that resuming with setDuration()
+        doesn't lose the part of a second which had passed since the last tick
+        """
+        self.pomodoro_timer.stop()
+        if self._deadline is None:
+            return
+
+        now = min(self.clock(), self._deadline)
+        self._emitTimeElapsed(now)
+        # kept above 0 as a remaining time of 0 means the duration has to be set again before it can be resumed
+        self.remaining_time = max(self._deadline - now, 1)
+        self._deadline = None
+        self._last_elapsed_time = None
+
+    def _scheduleNextTick(self, remaining_time: int) -> None:
+        """Wakes up when the remaining time reaches the next multiple of timer_resolution"""
+        next_tick_remaining_time = (
+            (remaining_time - TIMER_EARLY_WAKEUP_TOLERANCE - 1) // self.timer_resolution
+        ) * self.timer_resolution
+        interval = max(remaining_time - max(next_tick_remaining_time, 0), 0)
+        now = self.clock()
+        self._next_tick_at = now + interval
+        self._wall_clock_offset = self.wall_clock() - now
+        self.pomodoro_timer.start(interval)
+
+    def _emitTimeElapsed(self, until: int) -> None:
+        elapsed_time = until - self._last_elapsed_time
+        self._last_elapsed_time = until
+        if elapsed_time > 0:
+            self.timeElapsedSignal.emit(self.timer_state, elapsed_time)
+
     def decreaseRemainingTime(self) -> None:
         """
-        For decreasing the remaining time by timer_resolution
+        Works out the remaining time from the deadline, connected to the timeout of pomodoro_timer
         """
+        if self._deadline is None:
+            return
 
-        self.remaining_time -= self.timer_resolution
+        now = self.clock()
+        if self._handleSuspension(now):
+            return
+        remaining_time = self._deadline - now
 
-        if self.remaining_time < 0:
-            self.durationEnded()
+        if remaining_time <= TIMER_EARLY_WAKEUP_TOLERANCE:
+            self._emitTimeElapsed(self._deadline)
+            self._duration_ended_at = self._deadline
+            self._deadline = None
+            self._last_elapsed_time = None
+            self.remaining_time = 0
+            try:
+                self.durationEnded()
+            finally:
+                self._duration_ended_at = None
             return
 
-        self.pomodoro_timer.start(self.timer_resolution)
+        self._emitTimeElapsed(now)
+        self.remaining_time = self._roundUpToTick(remaining_time)
+        self._scheduleNextTick(remaining_time)
+
+    def _handleSuspension(self, now: int) -> bool:
+        """
+        Applies ConfigValues.SUSPEND_POLICY if the computer was suspended since the last tick was scheduled, returns
+        True if the timer has been paused or stopped and the tick is done
+        """
+        uncounted_time = self.wall_clock() - now - self._wall_clock_offset
+        late_time = now - self._next_tick_at
+        if uncounted_time >= SUSPEND_DETECTION_THRESHOLD:
+            suspended_time = uncounted_time
+        elif late_time >= SUSPEND_DETECTION_THRESHOLD:
+            suspended_time = late_time
+            # left out like it is by a clock which doesn't count suspended time, so that both cases are handled alike
+            self._deadline += late_time
+            self._last_elapsed_time += late_time
+        else:
+            return False
+
+        if self._deadline - now <= TIMER_EARLY_WAKEUP_TOLERANCE:
+            logger.info(f"Computer was suspended for {suspended_time} ms after the duration had ended")
+            return False
+
+        policy = ConfigValues.SUSPEND_POLICY
+        logger.info(f"Computer was suspended for {suspended_time} ms while the timer ran, applying {policy.name}")
+        if policy == SuspendPolicy.CREDIT:
+            # the rest of the tick counts the suspended time, it may end this duration and the ones started after it
+            self._deadline -= suspended_time
+            self._last_elapsed_time -= suspended_time
+            self.suspendDetectedSignal.emit(suspended_time, policy)
+            return False
+
+        if policy == SuspendPolicy.STOP:
+            self.stopSession()
+        else:
+            self.pauseDuration()
+        self.suspendDetectedSignal.emit(suspended_time, policy)
+        return True
+
+    def _roundUpToTick(self, remaining_time: int) -> int:
+        """Rounds up to whole ticks, like a countdown is shown"""
+        return -((TIMER_EARLY_WAKEUP_TOLERANCE - remaining_time) // self.timer_resolution) * self.timer_resolution
 
     def getRemainingTime(self) -> int:
         """
@@ -193,11 +349,45 @@ class PomodoroTimer(QObject):  # Inherit from QObject to support signals
         """
         return self.remaining_time
 
+    def isTicking(self) -> bool:
+        """
+        Whether a duration is running, unlike pomodoro_timer.isActive() this is also true while a tick is handled
+        """
+        return self._deadline is not None
+
+    def getExactRemainingTime(self) -> int:
+        """
+        Returns the remaining time to the millisecond as of the last time timeElapsedSignal was emitted, while the
+        timer runs getRemainingTime() is rounded up to a whole tick
+        """
+        if self._deadline is None:
+            return self.remaining_time
+        return self._deadline - self._last_elapsed_time
+
+    def restoreSession(
+        self, timer_state: TimerState, session_progress: float, sessions_completed: int, remaining_time: int
+    ) -> None:
+        """
+        Puts the timer back into a session which the previous run of the app didn't finish, paused with remaining_time
+        left, see models/timerJournal.py. Resuming works like resuming a paused timer
+        """
+        logger.info(f"Restoring {timer_state.name} with {remaining_time} ms remaining")
+        self.stopTicking()
+        self.previous_timer_state = self.timer_state
+        self.timer_state = timer_state
+        self.session_progress = session_progress
+        self.sessions_completed = sessions_completed
+        # above 0 so that it is resumed instead of started over, like a paused timer
+        self.remaining_time = max(remaining_time, 1)
+        if self.previous_timer_state != self.timer_state:
+            self.timerStateChangedSignal.emit(self.timer_state, False)
+        self.sessionPausedSignal.emit()
+
     def stopSession(self) -> None:
         logger.info("Stopping Pomodoro Session")
         self.previous_timer_state = self.timer_state
         self.sessions_completed = 0
-        self.pomodoro_timer.stop()
+        self.stopTicking()
         self.remaining_time = 0
         self.session_progress = 0
         self.timer_state = TimerState.NOTHING
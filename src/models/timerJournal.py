@@ -0,0 +1,252 @@
+import mmap
+import os
+import struct
+import time
+import zlib
+from datetime import timedelta
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import update
+
+from configPaths import settings_dir
+from constants import TIMER_JOURNAL_FILE_NAME, TIMER_JOURNAL_FORMAT_VERSION, TimerState
+from models.dbTables import Task, WorkInterval
+from utils.db_utils import get_session
+
+JOURNAL_MAGIC = 0x4B4E544A
+
+# stored as numbers of their own instead of the position in TimerState, so that the format doesn't depend on it
+_TIMER_STATE_CODES: Dict[TimerState, int] = {
+    TimerState.NOTHING: 0,
+    TimerState.WORK: 1,
+    TimerState.BREAK: 2,
+    TimerState.LONG_BREAK: 3,
+}
+_TIMER_STATES: Dict[int, TimerState] = {code: timer_state for timer_state, code in _TIMER_STATE_CODES.items()}
+
+# a work interval is of a task which is either a root task or a subtask, so at most the task and its parent task have
+# elapsed times which aren't saved yet
+_MAX_TASK_ELAPSED_TIMES = 2
+
+_NO_ID = -1
+
+# magic, format version, sequence number, written at, is clean exit, timer state, is running, session progress in
+# halves, sessions completed, remaining time, workspace id, current task id, interval id, interval elapsed time, task
+# id and elapsed time pairs, and the CRC-32 of everything before it
+_RECORD = struct.Struct("<IHQq?B?HIqqqqq" + "qq" * _MAX_TASK_ELAPSED_TIMES + "I")
+
+
+class TimerCheckpoint(NamedTuple):
+    written_at: int  # in ms since the epoch, on the wall clock
+    is_clean_exit: bool
+    timer_state: TimerState
+    is_running: bool
+    session_progress: float
+    sessions_completed: int
+    remaining_time: int  # in ms, to the millisecond
+    workspace_id: Optional[int]
+    current_task_id: Optional[int]
+    # the open work interval, None with an interval_elapsed_time of 0 if there isn't one
+    interval_id: Optional[int]
+    interval_elapsed_time: int
+    # elapsed time of the task of the open work interval and of its parent task by task id, the time worked since the
+    # interval was opened is included but not saved to the database yet
+    task_elapsed_times: Dict[int, int]
+
+
+def _to_id(value: int) -> Optional[int]:
+    return None if value == _NO_ID else value
+
+
+def _pack(sequence: int, checkpoint: TimerCheckpoint) -> bytes:
+    task_elapsed_times: List[int] = []
+    for task_id, elapsed_time in list(checkpoint.task_elapsed_times.items())[:_MAX_TASK_ELAPSED_TIMES]:
+        task_elapsed_times.extend((task_id, elapsed_time))
+    task_elapsed_times.extend((_NO_ID, 0) * (_MAX_TASK_ELAPSED_TIMES - len(task_elapsed_times) // 2))
+
+    data = _RECORD.pack(
+        JOURNAL_MAGIC,
+        TIMER_JOURNAL_FORMAT_VERSION,
+        sequence,
+        checkpoint.written_at,
+        checkpoint.is_clean_exit,
+        _TIMER_STATE_CODES[checkpoint.timer_state],
+        checkpoint.is_running,
+        int(checkpoint.session_progress * 2),
+        checkpoint.sessions_completed,
+        checkpoint.remaining_time,
+        _NO_ID if checkpoint.workspace_id is None else checkpoint.workspace_id,
+        _NO_ID if checkpoint.current_task_id is None else checkpoint.current_task_id,
+        _NO_ID if checkpoint.interval_id is None else checkpoint.interval_id,
+        checkpoint.interval_elapsed_time,
+        *task_elapsed_times,
+        0,
+    )
+    return data[:-4] + struct.pack("<I", zlib.crc32(data[:-4]))
+
+
+def _unpack(data: bytes) -> Optional[Tuple[int, TimerCheckpoint]]:
+    """Returns the sequence number and the checkpoint of a record, None if it is empty, torn or of another format"""
+    if len(data) != _RECORD.size or zlib.crc32(data[:-4]) != struct.unpack("<I", data[-4:])[0]:
+        return None
+    values = _RECORD.unpack(data)
+    if values[0] != JOURNAL_MAGIC or values[1] != TIMER_JOURNAL_FORMAT_VERSION or values[5] not in _TIMER_STATES:
+        return None
+
+    task_values = values[14:-1]
+    task_elapsed_times = {
+        task_values[i]: task_values[i + 1] for i in range(0, len(task_values), 2) if task_values[i] != _NO_ID
+    }
+    checkpoint = TimerCheckpoint(
+        written_at=values[3],
+        is_clean_exit=values[4],
+        timer_state=_TIMER_STATES[values[5]],
+        is_running=values[6],
+        session_progress=values[7] / 2,
+        sessions_completed=values[8],
+        remaining_time=values[9],
+        workspace_id=_to_id(values[10]),
+        current_task_id=_to_id(values[11]),
+        interval_id=_to_id(values[12]),
+        interval_elapsed_time=values[13],
+        task_elapsed_times=task_elapsed_times,
+    )
+    return values[2], checkpoint
+
+
+def _read_slots(data: bytes) -> Optional[Tuple[int, TimerCheckpoint]]:
+    """Returns the sequence number and checkpoint of the newest intact slot"""
+    records = [_unpack(data[slot * _RECORD.size : (slot + 1) * _RECORD.size]) for slot in range(2)]
+    records = [record for record in records if record is not None]
+    return max(records, key=lambda record: record[0]) if records else None
+
+
+class TimerJournal:
+    """
+    Keeps the last checkpoint of the timer in a small memory mapped file, so that a session and the time worked on a
+    task can be recovered if the app is killed or crashes before the work interval is saved, see
+    models/workIntervalRecorder.py.
+
+    The file holds two slots which are written in turns, each with a sequence number and a checksum. A checkpoint is
+    only copied into the mapped memory, so writing one costs no system call and no database transaction and is done on
+    every tick. If the process dies while a slot is half written, its checksum doesn't match and the other slot, one
+    checkpoint older, is used. The mapped pages belong to the OS, so what is written survives the process being killed,
+    but not necessarily a power loss, after which at worst the checkpoint of an earlier tick is read.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._sequence = 0
+        self._last_checkpoint: Optional[TimerCheckpoint] = None
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+
+        try:
+            self._file = open(path, "a+b")
+            if os.fstat(self._file.fileno()).st_size != 2 * _RECORD.size:
+                self._file.truncate(0)
+                self._file.truncate(2 * _RECORD.size)
+            self._map = mmap.mmap(self._file.fileno(), 2 * _RECORD.size)
+        except OSError as e:
+            logger.error(f"Could not open timer journal {path}, a crash will lose the time since the last save: {e}")
+            self.close()
+            return
+
+        # continues after the newest checkpoint, so that it is overwritten last. It is also marked as written by a
+        # clean exit when this run exits cleanly, even if no checkpoint is written in between
+        newest_record = _read_slots(self._map[:])
+        if newest_record is not None:
+            self._sequence, self._last_checkpoint = newest_record
+
+    def write(self, checkpoint: TimerCheckpoint) -> None:
+        if self._map is None:
+            return
+        self._sequence += 1
+        offset = (self._sequence % 2) * _RECORD.size
+        self._map[offset : offset + _RECORD.size] = _pack(self._sequence, checkpoint)
+        self._last_checkpoint = checkpoint
+
+    def close(self) -> None:
+        """Marks the last checkpoint as written by a clean exit, so that it isn't recovered at the next start"""
+        if self._map is not None:
+            if self._last_checkpoint is not None:
+                self.write(self._last_checkpoint._replace(is_clean_exit=True, written_at=now_ms()))
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def get_timer_journal_path() -> str:
+    return os.path.join(settings_dir, TIMER_JOURNAL_FILE_NAME)
+
+
+def read_timer_journal(path: str) -> Optional[TimerCheckpoint]:
+    try:
+        with open(path, "rb") as journal_file:
+            data = journal_file.read(2 * _RECORD.size)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read timer journal {path}: {e}")
+        return None
+
+    newest_record = _read_slots(data)
+    return newest_record[1] if newest_record is not None else None
+
+
+_unfinished_checkpoint: Optional[TimerCheckpoint] = None
+_has_read_timer_journal = False
+
+
+def get_unfinished_checkpoint() -> Optional[TimerCheckpoint]:
+    """
+    Returns the last checkpoint of the previous run if it didn't exit cleanly, read on the first call before the
+    journal is opened for writing, the same checkpoint is returned on later calls
+    """
+    global _unfinished_checkpoint, _has_read_timer_journal
+
+    if not _has_read_timer_journal:
+        _has_read_timer_journal = True
+        checkpoint = read_timer_journal(get_timer_journal_path())
+        if checkpoint is not None and not checkpoint.is_clean_exit:
+            _unfinished_checkpoint = checkpoint
+
+    return _unfinished_checkpoint
+
+
+def recover_tracked_time(checkpoint: TimerCheckpoint) -> None:
+    """
+    Saves the time of the work interval which was open when the previous run ended without saving it, the interval is
+    ended at the time of the checkpoint. Elapsed times are only ever increased, so recovering the same checkpoint twice
+    changes nothing
+    """
+    if not checkpoint.task_elapsed_times:
+        return
+
+    with get_session() as session:
+        if checkpoint.interval_id is not None:
+            work_interval = session.get(WorkInterval, checkpoint.interval_id)
+            if work_interval is not None and work_interval.ended_at is None:
+                work_interval.ended_at = work_interval.started_at + timedelta(
+                    milliseconds=checkpoint.interval_elapsed_time
+                )
+        for task_id, elapsed_time in checkpoint.task_elapsed_times.items():
+            # a task which has been deleted meanwhile isn't updated
+            session.execute(
+                update(Task)
+                .where(Task.id == task_id, Task.elapsed_time < elapsed_time)
+                .values(elapsed_time=elapsed_time)
+            )
+
+    logger.info(
+        f"Recovered {checkpoint.interval_elapsed_time} ms of work interval {checkpoint.interval_id} which wasn't saved "
+        f"before the app exited"
+    )
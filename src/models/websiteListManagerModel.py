@@ -1,9 +1,9 @@
 from typing import List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
-import validators
 from loguru import logger
 from PySide6.QtCore import QObject
+from sqlalchemy import bindparam, delete, insert
 from sqlalchemy.orm import Session
 
 from constants import URLListType, WebsiteBlockType
@@ -104,7 +104,12 @@ class WebsiteListManager(QObject):
         """
         This method updates the target list of urls with the new set of urls. It assumes that all urls are valid.
         Use validate_urls() to check if the urls are valid before calling this method.
+
+        Only the difference between the old and the new set is written, in a single transaction, and the in-memory set
+        is updated in place instead of being loaded from the database again.
         """
+        current_workspace_id = WorkspaceLookup.get_current_workspace_id()
+
         with get_session() as session:
             current_urls = set()
             target_class = None
@@ -126,12 +131,14 @@ class WebsiteListManager(QObject):
             urls_to_remove = current_urls - target_list_urls  # removed url = url not in new set but in old set
 
             if urls_to_remove:
-                self.remove_urls(session, urls_to_remove, target_class)
+                self.remove_urls(session, current_workspace_id, urls_to_remove, target_class)
 
             if urls_to_add:
-                self.add_urls(session, urls_to_add, target_class)
+                self.add_urls(session, current_workspace_id, urls_to_add, target_class)
 
-        self.load_data(target_list)
+        # updating in place after the transaction is committed, as get_urls() hands out the set itself
+        current_urls -= urls_to_remove
+        current_urls |= urls_to_add
 
     # helper function for validate_url()
     def add_default_scheme(self, url: str) -> str:
@@ -141,6 +148,8 @@ class WebsiteListManager(QObject):
         return url
 
     def validate_urls(self, urls: List[str]) -> Tuple[bool, Optional[List[int]]]:
+        import validators
+
         invalid_urls_line_numbers = list()
         for n, url in enumerate(urls, start=1):
             # logger.debug(f"{n} {url} empty?={not url}")
@@ -163,22 +172,27 @@ class WebsiteListManager(QObject):
     def add_urls(
         self,
         session: Session,
+        workspace_id: int,
         urls: Set[str],
         target_class: Union[AllowlistURL, AllowlistExceptionURL, BlocklistURL, BlocklistExceptionURL],
     ) -> None:
-        for url in urls:
-            session.add(target_class(workspace_id=WorkspaceLookup.get_current_workspace_id(), url=url))
+        # a list of parameters makes this a single executemany() instead of a flush of one ORM object per url
+        session.execute(insert(target_class), [{"workspace_id": workspace_id, "url": url} for url in urls])
 
     # helper function for update_target_list_urls()
     def remove_urls(
         self,
         session: Session,
+        workspace_id: int,
         urls: Set[str],
         target_class: Union[AllowlistURL, AllowlistExceptionURL, BlocklistURL, BlocklistExceptionURL],
     ) -> None:
-        session.query(target_class).filter(
-            target_class.url.in_(urls), target_class.workspace_id == WorkspaceLookup.get_current_workspace_id()
-        ).delete(synchronize_session=False)
+        # executed on the table instead of the ORM class, as ORM enabled deletes don't accept a list of parameters
+        table = target_class.__table__
+        session.execute(
+            delete(table).where(table.c.workspace_id == workspace_id, table.c.url == bindparam("removed_url")),
+            [{"removed_url": url} for url in urls],
+        )
 
     def get_urls(self, target_list: URLListType) -> Set[str]:
         if target_list == URLListType.BLOCKLIST:
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from loguru import logger
+from sqlalchemy import update
+
+from models.dbTables import Task, WorkInterval
+from utils.db_utils import get_session
+
+
+def utc_now() -> datetime:
+    """Naive UTC datetime like the ones stored in work_intervals"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class WorkIntervalRecorder:
+    """
+    Records the time worked on tasks as rows of work_intervals. A row is inserted when the timer starts running in a
+    work duration with a current task, and finished together with the elapsed time of the task when it stops doing so,
+    which is when it is paused, skipped, stopped, the work duration ends or the current task changes. In between, the
+    time is only added up in memory, so an hour of work costs a few writes instead of one every few seconds.
+
+    The length of an interval is the time reported by the timer, which runs on a monotonic clock, ended_at is worked
+    out from it instead of being read from the wall clock so that the row agrees with the time added to the task.
+    """
+
+    def __init__(self) -> None:
+        self.task_id: Optional[int] = None
+        self.interval_id: Optional[int] = None
+        self.started_at: Optional[datetime] = None
+        self.elapsed_time: int = 0  # in ms, time added to the open interval so far
+
+    def isRecording(self) -> bool:
+        return self.task_id is not None
+
+    def startInterval(self, task_id: int) -> None:
+        if self.isRecording():
+            logger.warning(f"Starting a work interval for task {task_id} while one for {self.task_id} is open")
+            return
+
+        self.task_id = task_id
+        self.started_at = utc_now()
+        self.elapsed_time = 0
+        try:
+            with get_session() as session:
+                work_interval = WorkInterval(task_id=task_id, started_at=self.started_at)
+                session.add(work_interval)
+                session.flush()
+                self.interval_id = work_interval.id
+        except Exception as e:
+            # the time is still added to the task when the interval ends
+            logger.error(f"Could not start work interval for task {task_id}: {e}")
+            self.interval_id = None
+        logger.debug(f"Started work interval {self.interval_id} for task {task_id}")
+
+    def addElapsedTime(self, elapsed_time: int) -> None:
+        if self.isRecording():
+            self.elapsed_time += elapsed_time
+
+    def endInterval(self, task_elapsed_times: Dict[int, int]) -> None:
+        """
+        Finishes the open interval and writes task_elapsed_times, the elapsed time of the task and its parent task by
+        task id, in the same transaction. Tasks which have been deleted meanwhile are left out by the caller.
+        """
+        if not self.isRecording():
+            return
+
+        task_id, interval_id, elapsed_time = self.task_id, self.interval_id, self.elapsed_time
+        ended_at = self.started_at + timedelta(milliseconds=elapsed_time)
+        self.task_id = None
+        self.interval_id = None
+        self.started_at = None
+        self.elapsed_time = 0
+
+        with get_session() as session:
+            if interval_id is not None:
+                session.execute(update(WorkInterval).where(WorkInterval.id == interval_id).values(ended_at=ended_at))
+            if task_elapsed_times:
+                session.execute(
+                    update(Task),
+                    [
+                        {"id": elapsed_task_id, "elapsed_time": task_elapsed_time}
+                        for elapsed_task_id, task_elapsed_time in task_elapsed_times.items()
+                    ],
+                )
+        logger.debug(f"Ended work interval {interval_id} of task {task_id} after {elapsed_time} ms")
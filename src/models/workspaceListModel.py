@@ -84,24 +84,23 @@ class WorkspaceListModel(QAbstractListModel):
         if self.selection_model:
             selected_index = self.selection_model.currentIndex()
             if selected_index.isValid():
-                selected_workspace = self.workspaces[selected_index.row()]
+                self.set_current_workspace(self.workspaces[selected_index.row()]["id"])
 
-                with get_session() as session:
-                    previous_selected_workspace = session.query(CurrentWorkspace).first()
-                    previous_selected_workspace_id = (
-                        previous_selected_workspace.current_workspace_id if previous_selected_workspace else None
-                    )
-                    # make sure that only one record exists in current_workspace table
-                    session.query(CurrentWorkspace).delete()
-                    current_workspace = CurrentWorkspace(current_workspace_id=selected_workspace["id"])
-                    session.add(current_workspace)
-
-                self.load_data()
+    def set_current_workspace(self, workspace_id: int) -> None:
+        with get_session() as session:
+            previous_selected_workspace = session.query(CurrentWorkspace).first()
+            previous_selected_workspace_id = (
+                previous_selected_workspace.current_workspace_id if previous_selected_workspace else None
+            )
+            # make sure that only one record exists in current_workspace table
+            session.query(CurrentWorkspace).delete()
+            current_workspace = CurrentWorkspace(current_workspace_id=workspace_id)
+            session.add(current_workspace)
 
-                current_workspace_id = session.query(CurrentWorkspace).first().current_workspace_id
+        self.load_data()
 
-                if previous_selected_workspace_id != current_workspace_id:
-                    self.current_workspace_changed.emit()
+        if previous_selected_workspace_id != workspace_id:
+            self.current_workspace_changed.emit()
 
     def get_current_workspace_id(self) -> Optional[int]:
         with get_session(is_read_only=True) as session:
@@ -69,15 +69,21 @@ class BottomBar(Ui_BottomBarWidget, QWidget):
     def updateBottomBarTaskLabel(
         self, topLeft: QModelIndex, bottomRight: QModelIndex, roles: list[Qt.ItemDataRole]
     ) -> None:
-        # if task name has been updated and only one index is updated (topLeft == bottomRight)
-        if Qt.ItemDataRole.DisplayRole in roles and topLeft == bottomRight:
-            triggeredTaskID = self.task_interface.todoTasksList.model().data(topLeft, TaskListModel.IDRole)
-            # and if the current task ID is the same as the triggered task ID
-            if self.parent.get_current_task_id() == triggeredTaskID:
-                # then update the bottom bar task label
-                self.taskLabel.setText(
-                    f"Current Task: {self.task_interface.todoTasksList.model().getTaskNameById(triggeredTaskID)}"
-                )
+        # if task name may have been updated, no roles means any role. Changes to adjacent rows are reported as one
+        # range, see DataChangedCoalescer
+        if roles and Qt.ItemDataRole.DisplayRole not in roles:
+            return
+
+        model: TaskListModel = self.task_interface.todoTasksList.model()
+        current_task_index = model.getIndexByTaskId(self.parent.get_current_task_id())
+        # and if the current task is in the updated range
+        if (
+            current_task_index.isValid()
+            and current_task_index.parent() == topLeft.parent()
+            and topLeft.row() <= current_task_index.row() <= bottomRight.row()
+        ):
+            # then update the bottom bar task label
+            self.taskLabel.setText(f"Current Task: {model.data(current_task_index, Qt.ItemDataRole.DisplayRole)}")
 
     def setupShortcuts(self) -> None:
         # Don't use these shortcuts anywhere else as these are global shortcuts and these will shadow over the
@@ -0,0 +1,42 @@
+from typing import Callable, Optional
+
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QShowEvent
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+
+class LazyInterface(QWidget):
+    """
+    Stands in for a sub-interface in the stacked widget of the main window, so that sub-interfaces which are expensive
+    to build and which most sessions never open aren't built at startup.
+
+    The sub-interface is built by factory when this widget is shown for the first time or when widget() is called,
+    whichever happens first. interfaceBuilt is emitted right after, signals of the sub-interface should be connected
+    in a slot connected to it.
+    """
+
+    interfaceBuilt = Signal()
+
+    def __init__(self, factory: Callable[[], QWidget], parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.factory = factory
+        self._widget: Optional[QWidget] = None
+
+        self.vBoxLayout = QVBoxLayout(self)
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+
+    def isBuilt(self) -> bool:
+        return self._widget is not None
+
+    def widget(self) -> QWidget:
+        """Returns the sub-interface, building it if it hasn't been built yet"""
+        if self._widget is None:
+            self._widget = self.factory()
+            self.vBoxLayout.addWidget(self._widget)
+            self.setFocusProxy(self._widget)
+            self.interfaceBuilt.emit()
+        return self._widget
+
+    def showEvent(self, event: QShowEvent) -> None:
+        self.widget()
+        super().showEvent(event)
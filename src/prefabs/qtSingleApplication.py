@@ -1,21 +1,31 @@
-from typing import Optional
+from typing import Dict, Optional
 
-from PySide6.QtCore import QStringConverter, Qt, QTextStream, Signal
+from loguru import logger
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtNetwork import QLocalServer, QLocalSocket
 from PySide6.QtWidgets import QApplication, QWidget
 
+from constants import SINGLE_INSTANCE_TIMEOUT
+from utils.socketMessage import decode_message, encode_message
+
 
 # from: https://stackoverflow.com/a/79574637
 class QtSingleApplication(QApplication):
-    messageReceived = Signal(str)
+    """
+    QApplication which finds out whether another instance with the same uid is running. The first instance listens on
+    a local socket named after the uid, later instances connect to it and can send messages to it with sendMessage().
+    A later instance sends ACTIVATE_COMMAND along with its arguments to bring the window of the first instance up,
+    other messages are commands of the control CLI, see utils/controlServer.py.
+    """
+
+    ACTIVATE_COMMAND = "activate"
+
+    messageReceived = Signal(QLocalSocket, dict)  # socket the message was received on, to reply on it
 
     _uid: str
     _activationWindow: Optional[QWidget]
     _activateOnMessage: bool
     _outSocket: Optional[QLocalSocket]
-    _outStream: Optional[QTextStream]
-    _inSocket: Optional[QLocalSocket]
-    _inStream: Optional[QTextStream]
     _server: Optional[QLocalServer]
     _isRunning: bool
 
@@ -24,25 +34,35 @@ class QtSingleApplication(QApplication):
         self._uid = uid
         self._activationWindow = None
         self._activateOnMessage = False
+        self._server = None
 
-        # Is there another instance running?
-        self._outSocket = QLocalSocket()
+        # Is there another instance running? Connecting to a local socket either succeeds or fails right away, unless
+        # the other instance is too busy to accept the connection, so the timeout is short
+        self._outSocket = QLocalSocket(self)
         self._outSocket.connectToServer(self._uid)
-        self._isRunning = self._outSocket.waitForConnected()
-
-        if self._isRunning:
-            # Yes, there is.
-            self._outStream = QTextStream(self._outSocket)
-            self._outStream.setEncoding(QStringConverter.Encoding.Utf8)
-        else:
-            # No, there isn't.
+        self._isRunning = self._outSocket.waitForConnected(SINGLE_INSTANCE_TIMEOUT)
+
+        if not self._isRunning and self._outSocket.error() == QLocalSocket.LocalSocketError.SocketTimeoutError:
+            # something is listening, it just isn't answering. Starting a second instance would be worse than not
+            # starting at all
+            logger.warning(f"Another instance didn't answer within {SINGLE_INSTANCE_TIMEOUT}ms, assuming it is running")
+            self._isRunning = True
+
+        if not self._isRunning:
             self._outSocket = None
-            self._outStream = None
-            self._inSocket = None
-            self._inStream = None
-            self._server = QLocalServer()
-            self._server.listen(self._uid)
-            self._server.newConnection.connect(self._onNewConnection)
+            self._listen()
+
+    def _listen(self) -> None:
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._onNewConnection)
+        if self._server.listen(self._uid):
+            return
+
+        # an instance which crashed leaves its socket file behind on Unix, nobody answered on it above so it is stale
+        logger.debug(f"Could not listen on {self._uid} ({self._server.errorString()}), removing stale server")
+        QLocalServer.removeServer(self._uid)
+        if not self._server.listen(self._uid):
+            logger.error(f"Could not listen on {self._uid}: {self._server.errorString()}")
 
     def isRunning(self) -> bool:
         return self._isRunning
@@ -60,35 +80,37 @@ class QtSingleApplication(QApplication):
     def activateWindow(self) -> None:
         if not self._activationWindow:
             return
+        self._activationWindow.show()
         self._activationWindow.setWindowState(self._activationWindow.windowState() & ~Qt.WindowState.WindowMinimized)
         self._activationWindow.raise_()
         self._activationWindow.activateWindow()
 
-    def sendMessage(self, msg: str) -> bool:
-        if not self._outStream:
+    def sendMessage(self, message: Dict[str, object]) -> bool:
+        """Sends message to the running instance, returns whether it was written to the socket in time"""
+        if self._outSocket is None or self._outSocket.state() != QLocalSocket.LocalSocketState.ConnectedState:
             return False
-        self._outStream << msg << "\n"  # pyright: ignore[reportUnusedExpression]
-        self._outStream.flush()
-        if self._outSocket is not None:
-            return self._outSocket.waitForBytesWritten()
-        return False
+        self._outSocket.write(encode_message(message))
+        self._outSocket.flush()
+        return self._outSocket.bytesToWrite() == 0 or self._outSocket.waitForBytesWritten(SINGLE_INSTANCE_TIMEOUT)
 
     def _onNewConnection(self) -> None:
-        if self._inSocket:
-            self._inSocket.readyRead.disconnect(self._onReadyRead)
-        self._inSocket = self._server.nextPendingConnection()
-        if not self._inSocket:
-            return
-        self._inStream = QTextStream(self._inSocket)
-        self._inStream.setEncoding(QStringConverter.Encoding.Utf8)
-        self._inSocket.readyRead.connect(self._onReadyRead)
-        if self._activateOnMessage:
-            self.activateWindow()
-
-    def _onReadyRead(self) -> None:
-        while True:
-            if self._inStream is not None:
-                msg = self._inStream.readLine()
-                if not msg:
-                    break
-                self.messageReceived.emit(msg)
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self._onReadyRead(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            # the message may have been received along with the connection
+            if socket.canReadLine():
+                self._onReadyRead(socket)
+
+    def _onReadyRead(self, socket: QLocalSocket) -> None:
+        while socket.canReadLine():
+            message = decode_message(bytes(socket.readLine().data()))
+            if message is None:
+                logger.warning("Ignoring message from another instance which isn't a JSON object")
+                continue
+
+            if message.get("command") == self.ACTIVATE_COMMAND:
+                logger.info(f"Another instance was started with arguments {message.get('arguments', [])}")
+                if self._activateOnMessage:
+                    self.activateWindow()
+            self.messageReceived.emit(socket, message)
@@ -8,9 +8,10 @@ from PySide6.QtWidgets import QMenu, QSystemTrayIcon
 from qfluentwidgets import FluentIcon, Theme, qconfig
 
 from configValues import ConfigValues
-from constants import TimerState
+from constants import APPLICATION_NAME, TimerState
 from prefabs.customFluentIcon import CustomFluentIcon
 from utils.detectWindowsVersion import isWin10OrEarlier
+from utils.iconAtlas import getIcon
 from views.subinterfaces.pomodoroView import PomodoroView
 
 if TYPE_CHECKING:
@@ -22,6 +23,11 @@ class SystemTray(QSystemTrayIcon):
         super().__init__(parent)
         self.parent = parent
         self.tray_menu = QMenu()
+        # tracked with the signals instead of tray_menu.isVisible(), which is still false during aboutToShow and stays
+        # false when the desktop shows the menu natively, like the tray menus on Linux
+        self.is_tray_menu_open = False
+        self.tray_menu.aboutToShow.connect(lambda: setattr(self, "is_tray_menu_open", True))
+        self.tray_menu.aboutToHide.connect(lambda: setattr(self, "is_tray_menu_open", False))
 
         self.tray_white_icon = QIcon(":/logosPrefix/logos/logo-monochrome-white.svg")
         self.tray_black_icon = QIcon(":/logosPrefix/logos/logo-monochrome-black.svg")
@@ -36,7 +42,7 @@ class SystemTray(QSystemTrayIcon):
 
         self.tray_menu_timer_status_action = self.tray_menu.addAction("Timer not running")
         self.tray_menu_timer_status_action.setIcon(
-            FluentIcon.STOP_WATCH.icon(Theme.DARK if is_os_dark_mode else Theme.LIGHT)
+            getIcon(FluentIcon.STOP_WATCH, Theme.DARK if is_os_dark_mode else Theme.LIGHT)
         )
         self.tray_menu_timer_status_action.setEnabled(False)  # Make it non-clickable
 
@@ -46,20 +52,24 @@ class SystemTray(QSystemTrayIcon):
         # context menu of Windows 10 system tray icon is always in light mode for qt apps.
         self.tray_menu_start_action = self.tray_menu.addAction("Start")
         dark_mode_condition: bool = is_os_dark_mode and not isWin10OrEarlier()
-        self.tray_menu_start_action.setIcon(FluentIcon.PLAY.icon(Theme.DARK if dark_mode_condition else Theme.LIGHT))
+        self.tray_menu_start_action.setIcon(
+            getIcon(FluentIcon.PLAY, Theme.DARK if dark_mode_condition else Theme.LIGHT)
+        )
 
         self.tray_menu_pause_resume_action = self.tray_menu.addAction("Pause/Resume")
         self.tray_menu_pause_resume_action.setIcon(
-            CustomFluentIcon.PLAY_PAUSE.icon(Theme.DARK if dark_mode_condition else Theme.LIGHT)
+            getIcon(CustomFluentIcon.PLAY_PAUSE, Theme.DARK if dark_mode_condition else Theme.LIGHT)
         )
         self.tray_menu_pause_resume_action.setEnabled(False)
 
         self.tray_menu_stop_action = self.tray_menu.addAction("Stop")
-        self.tray_menu_stop_action.setIcon(FluentIcon.CLOSE.icon(Theme.DARK if dark_mode_condition else Theme.LIGHT))
+        self.tray_menu_stop_action.setIcon(
+            getIcon(FluentIcon.CLOSE, Theme.DARK if dark_mode_condition else Theme.LIGHT)
+        )
 
         self.tray_menu_skip_action = self.tray_menu.addAction("Skip")
         self.tray_menu_skip_action.setIcon(
-            FluentIcon.CHEVRON_RIGHT.icon(Theme.DARK if dark_mode_condition else Theme.LIGHT)
+            getIcon(FluentIcon.CHEVRON_RIGHT, Theme.DARK if dark_mode_condition else Theme.LIGHT)
         )
 
         self.tray_menu.addSeparator()
@@ -67,7 +77,7 @@ class SystemTray(QSystemTrayIcon):
         # not adding tray_menu_show_hide_action here, it will be done in onShouldMinimizeToSystemTraySettingChanged
         self.tray_menu_show_hide_action = QAction("Show/Hide")
         self.tray_menu_show_hide_action.setIcon(
-            FluentIcon.VIEW.icon(Theme.DARK if dark_mode_condition else Theme.LIGHT)
+            getIcon(FluentIcon.VIEW, Theme.DARK if dark_mode_condition else Theme.LIGHT)
         )
         self.tray_menu_after_show_hide_separator = QAction()
         self.tray_menu_after_show_hide_separator.setSeparator(True)
@@ -75,7 +85,7 @@ class SystemTray(QSystemTrayIcon):
         self.tray_menu_quit_action = self.tray_menu.addAction("Quit")
         self.tray_menu_quit_action.setShortcut("Ctrl+Q")
         self.tray_menu_quit_action.setIcon(
-            CustomFluentIcon.EXIT.icon(Theme.DARK if dark_mode_condition else Theme.LIGHT)
+            getIcon(CustomFluentIcon.EXIT, Theme.DARK if dark_mode_condition else Theme.LIGHT)
         )
 
         # onShouldMinimizeToSystemTraySettingChanged() adds self.tray_menu_show_hide_action to the tray menu and
@@ -119,22 +129,21 @@ class SystemTray(QSystemTrayIcon):
         if isWin10OrEarlier():
             return
 
-        if qconfig.theme == Theme.DARK:
-            self.tray_menu_timer_status_action.setIcon(FluentIcon.STOP_WATCH.icon(Theme.DARK))
-            self.tray_menu_start_action.setIcon(FluentIcon.PLAY.icon(Theme.DARK))
-            self.tray_menu_pause_resume_action.setIcon(CustomFluentIcon.PLAY_PAUSE.icon(Theme.DARK))
-            self.tray_menu_stop_action.setIcon(FluentIcon.CLOSE.icon(Theme.DARK))
-            self.tray_menu_skip_action.setIcon(FluentIcon.CHEVRON_RIGHT.icon(Theme.DARK))
-            self.tray_menu_show_hide_action.setIcon(FluentIcon.VIEW.icon(Theme.DARK))
-            self.tray_menu_quit_action.setIcon(CustomFluentIcon.EXIT.icon(Theme.DARK))
+        # the icons of both themes are kept in the icon atlas, so switching back and forth doesn't render them again
+        theme = Theme.DARK if qconfig.theme == Theme.DARK else Theme.LIGHT
+        self.tray_menu_timer_status_action.setIcon(getIcon(FluentIcon.STOP_WATCH, theme))
+        self.tray_menu_start_action.setIcon(getIcon(FluentIcon.PLAY, theme))
+        self.tray_menu_pause_resume_action.setIcon(getIcon(CustomFluentIcon.PLAY_PAUSE, theme))
+        self.tray_menu_stop_action.setIcon(getIcon(FluentIcon.CLOSE, theme))
+        self.tray_menu_skip_action.setIcon(getIcon(FluentIcon.CHEVRON_RIGHT, theme))
+        self.tray_menu_show_hide_action.setIcon(getIcon(FluentIcon.VIEW, theme))
+        self.tray_menu_quit_action.setIcon(getIcon(CustomFluentIcon.EXIT, theme))
+
+    def updateBlockedHitCount(self, count: int) -> None:
+        if count:
+            self.setToolTip(f"{APPLICATION_NAME}\n{count} requests blocked in this work session")
         else:
-            self.tray_menu_timer_status_action.setIcon(FluentIcon.STOP_WATCH.icon(Theme.LIGHT))
-            self.tray_menu_start_action.setIcon(FluentIcon.PLAY.icon(Theme.LIGHT))
-            self.tray_menu_pause_resume_action.setIcon(CustomFluentIcon.PLAY_PAUSE.icon(Theme.LIGHT))
-            self.tray_menu_stop_action.setIcon(FluentIcon.CLOSE.icon(Theme.LIGHT))
-            self.tray_menu_skip_action.setIcon(FluentIcon.CHEVRON_RIGHT.icon(Theme.LIGHT))
-            self.tray_menu_show_hide_action.setIcon(FluentIcon.VIEW.icon(Theme.LIGHT))
-            self.tray_menu_quit_action.setIcon(CustomFluentIcon.EXIT.icon(Theme.LIGHT))
+            self.setToolTip(APPLICATION_NAME)
 
     def updateSystemTrayActions(self, timerState: TimerState) -> None:
         if timerState in [TimerState.WORK, TimerState.BREAK, TimerState.LONG_BREAK]:
@@ -154,6 +154,13 @@ class TaskList(TreeView):
         # connecting here because the below methods need the model to be set first
         model.taskMovedSignal.connect(self._restoreExpansionStateOfATask)
         model.taskAddedSignal.connect(self._restoreExpansionStateOfATask)
+        # the model is reset when tasks loaded from the startup snapshot turn out to differ from the database
+        model.modelReset.connect(self._restoreExpansionStateOfAllTasks)
+
+        # so that the delegate drops the rows it cached when their time changes or the tasks are loaded again
+        delegate: TaskListItemDelegate = self.itemDelegate()
+        model.dataChanged.connect(delegate.onModelDataChanged)
+        model.modelReset.connect(delegate.clearRowRenders)
 
     def _restoreExpansionStateOfAllTasks(self) -> None:
         model: TaskListModel = self.model()
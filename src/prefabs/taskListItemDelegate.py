@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
-from PySide6.QtCore import QEvent, QModelIndex, QPoint, QRect, QSize, Qt, Signal
-from PySide6.QtGui import QColor, QFontMetrics, QPainter
+from PySide6.QtCore import QEvent, QModelIndex, QPoint, QPointF, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QPainter, QStaticText
 from PySide6.QtWidgets import (
     QApplication,
     QStyle,
@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 from qfluentwidgets import (
     FluentIcon,
+    FluentIconBase,
     LineEdit,
     TreeItemDelegate,
     drawIcon,
@@ -22,9 +23,34 @@ from qfluentwidgets.common.color import autoFallbackThemeColor
 
 from models.config import app_settings
 from models.taskListModel import TaskListModel, TaskNode
+from utils.iconAtlas import getIconPixmap
 from utils.timeConversion import convert_ms_to_hh_mm_ss
 
 
+class _RowRender:
+    """What TaskListItemDelegate needs to paint a row which only changes when its key changes"""
+
+    def __init__(
+        self,
+        key: Tuple,
+        is_current_task: bool,
+        is_dark: bool,
+        time_text: QStaticText,
+        time_text_width: int,
+        text_color: QColor,
+        highlight_color: QColor,
+        background_color: QColor,
+    ) -> None:
+        self.key = key
+        self.is_current_task = is_current_task
+        self.is_dark = is_dark
+        self.time_text = time_text
+        self.time_text_width = time_text_width
+        self.text_color = text_color
+        self.highlight_color = highlight_color
+        self.background_color = background_color
+
+
 class TaskListItemDelegate(TreeItemDelegate):
     """List item delegate"""
 
@@ -41,6 +67,12 @@ class TaskListItemDelegate(TreeItemDelegate):
         self._button_states = {}  # task_id -> bool (checked state)
         # Track which button is currently being hovered
         self._hovered_button_task_id = None
+        # task_id -> what is needed to paint its row, rebuilt when the key of the row doesn't match anymore. Entries
+        # are also dropped when the model says that the time of a task changed so that they don't pile up
+        self._row_renders: Dict[int, _RowRender] = {}
+
+        # emitted by the settings of the app and not by qconfig once they are loaded into it
+        app_settings.themeColorChanged.connect(self.clearRowRenders)
 
     def _get_pomodoro_interface(self) -> Optional[QWidget]:
         # find the parent widget with the name "pomodoro_interface"
@@ -92,18 +124,67 @@ class TaskListItemDelegate(TreeItemDelegate):
         button_y = option.rect.top() + (option.rect.height() - self.button_size) // 2
         return QRect(button_x, button_y, self.button_size, self.button_size)
 
-    def _getTimeTextRect(self, option: QStyleOptionViewItem, index: QModelIndex) -> QRect:
-        """Get the rectangle where the time text is drawn"""
-        font_metrics = QFontMetrics(option.font)
+    def clearRowRenders(self) -> None:
+        self._row_renders.clear()
+
+    def onModelDataChanged(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: List[int]) -> None:
+        """Drops the cached rows whose elapsed or target time changed"""
+        if roles and TaskListModel.ElapsedTimeRole not in roles and TaskListModel.TargetTimeRole not in roles:
+            return
+
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._row_renders.pop(top_left.model().index(row, 0, parent).data(TaskListModel.IDRole), None)
 
+    def _getRowRender(self, option: QStyleOptionViewItem, index: QModelIndex, is_dark: bool) -> _RowRender:
+        task_id = index.data(TaskListModel.IDRole)
         elapsed_time_ms = index.data(TaskListModel.ElapsedTimeRole)
         target_time_ms = index.data(TaskListModel.TargetTimeRole)
+        is_current_task = task_id is not None and self.parent().model().currentTaskID() == task_id
+        font_key = option.font.key()
+
+        # the time text only shows whole seconds
+        key = (elapsed_time_ms // 1000, target_time_ms // 1000, is_current_task, is_dark, font_key)
+        row_render = self._row_renders.get(task_id)
+        if row_render is not None and row_render.key == key:
+            return row_render
 
         ehh, emm, ess = convert_ms_to_hh_mm_ss(elapsed_time_ms)
         thh, tmm, tss = convert_ms_to_hh_mm_ss(target_time_ms)
 
-        time_text = f"{ehh:02d}:{emm:02d}:{ess:02d} / {thh:02d}:{tmm:02d}:{tss:02d}"
-        time_text_width = font_metrics.horizontalAdvance(time_text)
+        time_text = QStaticText(f"{ehh:02d}:{emm:02d}:{ess:02d} / {thh:02d}:{tmm:02d}:{tss:02d}")
+        time_text.setTextFormat(Qt.TextFormat.PlainText)
+        time_text.prepare(font=option.font)
+
+        # the theme color is copied as its alpha is changed below. The current task and checked buttons are highlighted
+        # with it
+        highlight_color = QColor(app_settings.get(app_settings.themeColor))
+        alpha_boost = 45 if is_dark else 30
+        highlight_color.setAlpha(17 + alpha_boost)  # increasing alpha to make it more visible
+        # 17 because the alpha of a selected row is 17
+
+        if is_current_task:
+            background_color = highlight_color
+        else:
+            c = 255 if is_dark else 0
+            background_color = QColor(c, c, c, 0)
+
+        row_render = _RowRender(
+            key,
+            is_current_task,
+            is_dark,
+            time_text,
+            int(time_text.size().width() + 0.5),  # rounded like QFontMetrics.horizontalAdvance()
+            QColor(Qt.GlobalColor.white if is_dark else Qt.GlobalColor.black),
+            highlight_color,
+            background_color,
+        )
+        self._row_renders[task_id] = row_render
+        return row_render
+
+    def _getTimeTextRect(self, option: QStyleOptionViewItem, index: QModelIndex) -> QRect:
+        """Get the rectangle where the time text is drawn"""
+        time_text_width = self._getRowRender(option, index, isDarkTheme()).time_text_width
         time_text_x = option.rect.right() - time_text_width - 10
 
         return QRect(time_text_x, option.rect.top(), time_text_width, option.rect.height())
@@ -129,15 +210,16 @@ class TaskListItemDelegate(TreeItemDelegate):
 
         return QRect(arrow_x, arrow_y, arrow_width, arrow_height)
 
-    def _paintButton(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+    def _paintButton(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex, row_render: _RowRender
+    ) -> None:
         """Paint the button manually"""
         task_id = index.data(TaskListModel.IDRole)
         if task_id is None:
             return
 
         # check if this is the current task to sync state with main buttons
-        model = self.parent().model()
-        is_current_task = model.currentTaskID() == task_id
+        is_current_task = row_render.is_current_task
 
         # For current task, sync state with pomodoro interface
         if is_current_task:
@@ -169,10 +251,9 @@ class TaskListItemDelegate(TreeItemDelegate):
             painter.setPen(Qt.PenStyle.NoPen)
 
             if is_checked:
-                theme_color = app_settings.get(app_settings.themeColor)
-                painter.setBrush(theme_color)
+                painter.setBrush(row_render.highlight_color)
             else:
-                if isDarkTheme():
+                if row_render.is_dark:
                     painter.setBrush(QColor(255, 255, 255, int(255 * 0.09)))  # colour from button.qss in
                     # pyqt-fluent-widgets repo
                 else:
@@ -200,7 +281,11 @@ class TaskListItemDelegate(TreeItemDelegate):
         # translating +1 across y axis because experimentally found that it centers the icon on the background
         icon_rect.translate(QPoint(1, 1))
 
-        drawIcon(icon, painter, icon_rect)
+        if isinstance(icon, FluentIconBase):
+            # rendered from the SVG once for all the rows instead of on every paint of every row
+            painter.drawPixmap(icon_rect, getIconPixmap(icon, icon_rect.size(), painter.device().devicePixelRatio()))
+        else:
+            drawIcon(icon, painter, icon_rect)
         painter.restore()
 
     def editorEvent(
@@ -294,7 +379,7 @@ class TaskListItemDelegate(TreeItemDelegate):
         # hack to stop the timer so that when another item in this delegate is clicked while timer is running, the
         # duration isn't restarted. Its similar to pausing and resuming but the pause in this case has almost no
         # downtime
-        self._pomodoro_interface.pomodoro_timer_obj.pomodoro_timer.stop()
+        self._pomodoro_interface.pomodoro_timer_obj.stopTicking()
         self._pomodoro_interface.pauseResumeButtonClicked()
 
         icon = FluentIcon.PAUSE if checked else FluentIcon.PLAY
@@ -321,6 +406,9 @@ class TaskListItemDelegate(TreeItemDelegate):
             self.parent().viewport().update()
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        is_dark = isDarkTheme()
+        row_render = self._getRowRender(option, index, is_dark)
+
         ## pasted from TreeItemDelegate.paint()
         painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
 
@@ -333,7 +421,7 @@ class TaskListItemDelegate(TreeItemDelegate):
 
             # draw background
             h = option.rect.height() - 4
-            c = 255 if isDarkTheme() else 0
+            c = 255 if is_dark else 0
             painter.setBrush(QColor(c, c, c, 9))
             painter.drawRoundedRect(4, option.rect.y() + 2, self.parent().width() - 8, h, 4, 4)
 
@@ -345,12 +433,12 @@ class TaskListItemDelegate(TreeItemDelegate):
             painter.restore()
         ## pasted till above line
 
-        self._paintBackground(painter, option, index)
+        self._paintBackground(painter, option, row_render)
 
         # Paint the button manually
-        self._paintButton(painter, option, index)
+        self._paintButton(painter, option, index, row_render)
 
-        time_text_width: int = self._paintTimeText(painter, option, index)
+        time_text_width: int = self._paintTimeText(painter, option, row_render)
 
         # Adjust option.rect to account for button and time text
         button_width = self.button_size + 2 * self.button_margin
@@ -359,46 +447,30 @@ class TaskListItemDelegate(TreeItemDelegate):
 
         QStyledItemDelegate.paint(self, painter, adjusted_option, index)
 
-    def _paintBackground(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
-        isDark = isDarkTheme()
-        c = 255 if isDark else 0
-        alpha = 0
-
-        if index.data(Qt.ItemDataRole.BackgroundRole):
-            theme_color: QColor = index.data(Qt.ItemDataRole.BackgroundRole)
-            alpha_boost = 45 if isDark else 30
-            theme_color.setAlpha(
-                alpha + alpha_boost if alpha != 0 else 17 + alpha_boost
-            )  # increasing alpha to make it more visible
-            # 17 because the alpha of a selected row is 17
-            painter.setBrush(theme_color)
-        else:
-            painter.setBrush(QColor(c, c, c, alpha))
-
+    def _paintBackground(self, painter: QPainter, option: QStyleOptionViewItem, row_render: _RowRender) -> None:
+        painter.setBrush(row_render.background_color)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(option.rect, 5, 5)
 
-    def _paintTimeText(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> int:
+    def _paintTimeText(self, painter: QPainter, option: QStyleOptionViewItem, row_render: _RowRender) -> int:
         """
         will draw time text and return the width of the text
         """
-        isDark = isDarkTheme()
         # draw time elapsed and target time
-        painter.setPen(Qt.GlobalColor.white if isDark else Qt.GlobalColor.black)
-
-        time_text_rect = self._getTimeTextRect(option, index)
-
-        elapsed_time_ms = index.data(TaskListModel.ElapsedTimeRole)
-        target_time_ms = index.data(TaskListModel.TargetTimeRole)
-
-        ehh, emm, ess = convert_ms_to_hh_mm_ss(elapsed_time_ms)
-        thh, tmm, tss = convert_ms_to_hh_mm_ss(target_time_ms)
-
-        time_text = f"{ehh:02d}:{emm:02d}:{ess:02d} / {thh:02d}:{tmm:02d}:{tss:02d}"
-
-        painter.drawText(time_text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, time_text)
-
-        return time_text_rect.width()
+        painter.setPen(row_render.text_color)
+
+        # right aligned and vertically centered in the rect from _getTimeTextRect(), by the fractional width of the
+        # text like QPainter.drawText() does
+        time_text_size = row_render.time_text.size()
+        painter.drawStaticText(
+            QPointF(
+                option.rect.right() - 10 - time_text_size.width(),
+                option.rect.top() + (option.rect.height() - time_text_size.height()) / 2,
+            ),
+            row_render.time_text,
+        )
+
+        return row_render.time_text_width
 
     def updateEditorGeometry(self, editor: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> None:
         rect = option.rect
@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING
 
 from qfluentwidgets import FluentIcon
 
-from configValues import ConfigValues
 from constants import InterfaceType, NavPanelButtonPosition
 from models.config import app_settings
 from prefabs.transientPopupTeachingTip import TransientPopupTeachingTip
@@ -28,6 +27,7 @@ class PomodoroInterfaceTutorial(InterfaceTutorial):
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.BACK_BUTTON, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.TASK_INTERFACE, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WEBSITE_BLOCKER_INTERFACE, False)
+        setNavButtonEnabled(self.main_window, NavPanelButtonPosition.STATISTICS_INTERFACE, False)
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WORKSPACE_MANAGER_DIALOG, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.SETTINGS_INTERFACE, False)
@@ -53,12 +53,12 @@ class PomodoroInterfaceTutorial(InterfaceTutorial):
     def _last_step(self) -> None:
         # this is the last step
         app_settings.set(app_settings.has_completed_pomodoro_view_tutorial, True)
-        ConfigValues.HAS_COMPLETED_POMODORO_VIEW_TUTORIAL = True
         self.main_window.isSafeToShowTutorial = True  # allow other tutorials to show
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.BACK_BUTTON, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.TASK_INTERFACE, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WEBSITE_BLOCKER_INTERFACE, True)
+        setNavButtonEnabled(self.main_window, NavPanelButtonPosition.STATISTICS_INTERFACE, True)
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WORKSPACE_MANAGER_DIALOG, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.SETTINGS_INTERFACE, True)
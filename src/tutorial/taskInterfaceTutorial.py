@@ -6,7 +6,6 @@ from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import QStyleOptionViewItem, QWidget
 from qfluentwidgets import FluentIcon, TeachingTipTailPosition
 
-from configValues import ConfigValues
 from constants import InterfaceType, NavPanelButtonPosition
 from models.config import app_settings
 from models.taskListModel import TaskListModel
@@ -60,6 +59,7 @@ class TaskInterfaceTutorial(InterfaceTutorial):
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.BACK_BUTTON, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.POMODORO_INTERFACE, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WEBSITE_BLOCKER_INTERFACE, False)
+        setNavButtonEnabled(self.main_window, NavPanelButtonPosition.STATISTICS_INTERFACE, False)
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WORKSPACE_MANAGER_DIALOG, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.SETTINGS_INTERFACE, False)
@@ -595,12 +595,12 @@ class TaskInterfaceTutorial(InterfaceTutorial):
             if add_task_dialog.taskEdit.text().strip() != "":
                 add_task_dialog.yesButton.setDisabled(False)
 
-        ConfigValues.HAS_COMPLETED_TASK_VIEW_TUTORIAL = True
         self.main_window.isSafeToShowTutorial = True  # allow other tutorials to show
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.BACK_BUTTON, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.POMODORO_INTERFACE, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WEBSITE_BLOCKER_INTERFACE, True)
+        setNavButtonEnabled(self.main_window, NavPanelButtonPosition.STATISTICS_INTERFACE, True)
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WORKSPACE_MANAGER_DIALOG, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.SETTINGS_INTERFACE, True)
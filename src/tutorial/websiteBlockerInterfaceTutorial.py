@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING
 
 from qfluentwidgets import FluentIcon, TeachingTipTailPosition
 
-from configValues import ConfigValues
 from constants import InterfaceType, NavPanelButtonPosition, WebsiteBlockType
 from models.config import app_settings
 from prefabs.transientPopupTeachingTip import TransientPopupTeachingTip
@@ -30,6 +29,7 @@ class WebsiteBlockerInterfaceTutorial(InterfaceTutorial):
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.BACK_BUTTON, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.TASK_INTERFACE, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.POMODORO_INTERFACE, False)
+        setNavButtonEnabled(self.main_window, NavPanelButtonPosition.STATISTICS_INTERFACE, False)
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WORKSPACE_MANAGER_DIALOG, False)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.SETTINGS_INTERFACE, False)
@@ -37,7 +37,7 @@ class WebsiteBlockerInterfaceTutorial(InterfaceTutorial):
 
     def _select_website_block_type_step(self) -> None:
         self._select_website_block_type_step_tip = TransientPopupTeachingTip.create(
-            target=self.main_window.website_blocker_interface.blockTypeComboBox,
+            target=self.main_window.website_blocker_interface.widget().blockTypeComboBox,
             title="You can select the type of website block",
             content='"Blocklist" will block the websites you add to the list\n'
             '"Allowlist" will only allow the websites you add to the list and block all others',
@@ -55,12 +55,12 @@ class WebsiteBlockerInterfaceTutorial(InterfaceTutorial):
 
     def _enter_websites_step(self) -> None:
         current_website_block_type: WebsiteBlockType = (
-            self.main_window.website_blocker_interface.model.get_website_block_type()
+            self.main_window.website_blocker_interface.widget().model.get_website_block_type()
         )
         active_code_editor = (
-            self.main_window.website_blocker_interface.blockListTextEdit
+            self.main_window.website_blocker_interface.widget().blockListTextEdit
             if current_website_block_type == WebsiteBlockType.BLOCKLIST
-            else self.main_window.website_blocker_interface.allowListTextEdit
+            else self.main_window.website_blocker_interface.widget().allowListTextEdit
         )
 
         action = "block" if current_website_block_type == WebsiteBlockType.BLOCKLIST else "allow"
@@ -82,7 +82,7 @@ class WebsiteBlockerInterfaceTutorial(InterfaceTutorial):
 
     def _save_websites_step(self) -> None:
         self._save_websites_step_tip = TransientPopupTeachingTip.create(
-            target=self.main_window.website_blocker_interface.saveButton,
+            target=self.main_window.website_blocker_interface.widget().saveButton,
             title="Always save your changes after editing the list",
             content="",
             mainWindow=self.main_window,
@@ -100,12 +100,12 @@ class WebsiteBlockerInterfaceTutorial(InterfaceTutorial):
     def _last_step(self) -> None:
         # this is the last step
         app_settings.set(app_settings.has_completed_website_blocker_view_tutorial, True)
-        ConfigValues.HAS_COMPLETED_WEBSITE_BLOCKER_VIEW_TUTORIAL = True
         self.main_window.isSafeToShowTutorial = True
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.BACK_BUTTON, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.TASK_INTERFACE, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.POMODORO_INTERFACE, True)
+        setNavButtonEnabled(self.main_window, NavPanelButtonPosition.STATISTICS_INTERFACE, True)
 
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.WORKSPACE_MANAGER_DIALOG, True)
         setNavButtonEnabled(self.main_window, NavPanelButtonPosition.SETTINGS_INTERFACE, True)
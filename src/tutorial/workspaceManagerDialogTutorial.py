@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING
 
 from qfluentwidgets import FluentIcon
 
-from configValues import ConfigValues
 from constants import InterfaceType
 from models.config import app_settings
 from prefabs.transientPopupTeachingTip import TransientPopupTeachingTip
@@ -42,5 +41,4 @@ class WorkspaceManagerDialogTutorial(InterfaceTutorial):
 
     def _last_step(self) -> None:
         app_settings.set(app_settings.has_completed_workspace_manager_dialog_tutorial, True)
-        ConfigValues.HAS_COMPLETED_WORKSPACE_MANAGER_DIALOG_TUTORIAL = True
         self.main_window.isSafeToShowTutorial = True
@@ -1,12 +1,8 @@
 import json
-import ssl
-from http.client import HTTPSConnection
 from urllib.parse import urlparse
 
-import certifi
 from loguru import logger
 from PySide6.QtCore import QObject, QThread, Signal
-from semver import Version
 
 from constants import UPDATE_CHECK_URL, UpdateCheckResult
 from utils.getAppVersion import get_app_version
@@ -62,6 +58,12 @@ class UpdateChecker(QObject):
     @staticmethod
     def checkForUpdates() -> UpdateCheckResult:
         """Check for updates by comparing the current app version with the remote version."""
+        import ssl
+        from http.client import HTTPSConnection
+
+        import certifi
+        from semver import Version
+
         current_app_version = get_app_version()
         logger.debug(f"App version: {current_app_version}")
 
@@ -1,7 +1,6 @@
 import subprocess
 import sys
 
-import psutil
 from loguru import logger
 from PySide6.QtWidgets import QApplication, QMessageBox
 
@@ -18,8 +17,10 @@ def check_init_service() -> bool:
                 logger.info("Detected systemd init service in Flatpak sandbox, proceeding with application launch.")
                 return True
         else:
-            init_process = psutil.Process(1)
-            if "systemd" in init_process.name().lower():
+            # same as psutil.Process(1).name(), read directly so that psutil isn't imported at startup
+            with open("/proc/1/comm", "r", encoding="utf-8") as f:
+                init_process_name = f.read()
+            if "systemd" in init_process_name.lower():
                 logger.info("Detected systemd init service, proceeding with application launch.")
                 return True
             else:
@@ -0,0 +1,176 @@
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from loguru import logger
+from PySide6.QtCore import QObject
+from PySide6.QtNetwork import QLocalSocket
+
+from configValues import ConfigValues
+from constants import TimerState
+from models.workspaceLookup import WorkspaceLookup
+from prefabs.qtSingleApplication import QtSingleApplication
+from utils.socketMessage import encode_message
+
+if TYPE_CHECKING:
+    from mainWindow import MainWindow
+
+
+class ControlCommandError(Exception):
+    """Raised by a command handler, the message is sent back to the client as the error"""
+
+
+class ControlServer(QObject):
+    """
+    Lets other processes drive the timer through the local socket of QtSingleApplication, see controlCli.py for the
+    client.
+
+    Every request is a JSON object on its own line with a "command" and optionally an "id" which is copied into the
+    reply. A reply is {"ok": true, "result": ...} or {"ok": false, "error": "..."}. After "subscribe", the socket also
+    gets {"event": "tick" or "state_changed", "status": {...}} every time the timer ticks or changes state, until it
+    sends "unsubscribe" or disconnects.
+
+    Commands act through the same buttons as the system tray menu, so the UI stays in sync with them.
+    """
+
+    def __init__(self, app: QtSingleApplication, main_window: "MainWindow") -> None:
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.pomodoro_interface = main_window.pomodoro_interface
+        self.pomodoro_timer_obj = main_window.pomodoro_interface.pomodoro_timer_obj
+        self.subscribers: List[QLocalSocket] = []
+        # kept here instead of being looked up in the database for every status, which is sent on every tick
+        self.current_workspace_id: Optional[int] = WorkspaceLookup.get_current_workspace_id()
+        main_window.workplace_list_model.current_workspace_changed.connect(self.onCurrentWorkspaceChanged)
+
+        # every handler gets the request and the socket it was received on
+        self.handlers: Dict[str, Callable[[Dict[str, object], QLocalSocket], object]] = {
+            "status": lambda _message, _socket: self.getStatus(),
+            "start": self.start,
+            "pause": self.pause,
+            "skip": self.skip,
+            "stop": self.stop,
+            "current_task": lambda _message, _socket: self.getCurrentTask(),
+            "switch_workspace": self.switchWorkspace,
+            "subscribe": self.subscribe,
+            "unsubscribe": self.unsubscribe,
+        }
+
+        app.messageReceived.connect(self.onMessageReceived)
+
+        self.pomodoro_timer_obj.pomodoro_timer.timeout.connect(lambda: self.publish("tick"))
+        self.pomodoro_timer_obj.timerStateChangedSignal.connect(lambda _timer_state, _: self.publish("state_changed"))
+        self.pomodoro_timer_obj.sessionStartedSignal.connect(lambda: self.publish("state_changed"))
+        self.pomodoro_timer_obj.sessionPausedSignal.connect(lambda: self.publish("state_changed"))
+        self.pomodoro_timer_obj.sessionStoppedSignal.connect(lambda: self.publish("state_changed"))
+
+    def onMessageReceived(self, socket: QLocalSocket, message: Dict[str, object]) -> None:
+        command = message.get("command")
+        if command == QtSingleApplication.ACTIVATE_COMMAND:
+            return  # handled by QtSingleApplication
+
+        try:
+            # any JSON value can be sent as the command, only strings can be looked up in the handlers
+            if not isinstance(command, str):
+                raise ControlCommandError(f"the command must be a string, got {command!r}")
+            handler = self.handlers.get(command)
+            if handler is None:
+                raise ControlCommandError(f"unknown command {command!r}, known commands are {list(self.handlers)}")
+            reply: Dict[str, object] = {"ok": True, "result": handler(message, socket)}
+        except ControlCommandError as e:
+            reply = {"ok": False, "error": str(e)}
+        if "id" in message:
+            reply["id"] = message["id"]
+
+        socket.write(encode_message(reply))
+        socket.flush()
+
+    def getStatus(self) -> Dict[str, object]:
+        timer_state = self.pomodoro_timer_obj.getTimerState()
+        durations = {
+            TimerState.WORK: ConfigValues.WORK_DURATION,
+            TimerState.BREAK: ConfigValues.BREAK_DURATION,
+            TimerState.LONG_BREAK: ConfigValues.LONG_BREAK_DURATION,
+        }
+        duration_ms = durations.get(timer_state, 0) * 60 * 1000
+        remaining_ms = self.pomodoro_timer_obj.getRemainingTime()
+        return {
+            "timer_state": timer_state.name,
+            "is_running": self.pomodoro_timer_obj.pomodoro_timer.isActive(),
+            # remaining time is 0 until the first tick of a duration
+            "remaining_ms": remaining_ms if remaining_ms > 0 else duration_ms,
+            "duration_ms": duration_ms,
+            "session_progress": self.pomodoro_timer_obj.getSessionProgress(),
+            "sessions_completed": self.pomodoro_timer_obj.getSessionsCompleted(),
+            "workspace_id": self.current_workspace_id,
+            "current_task": self.getCurrentTask(),
+        }
+
+    def onCurrentWorkspaceChanged(self) -> None:
+        self.current_workspace_id = WorkspaceLookup.get_current_workspace_id()
+
+    def getCurrentTask(self) -> Optional[Dict[str, object]]:
+        task_id = self.main_window.get_current_task_id()
+        if task_id is None:
+            return None
+        model = self.main_window.task_interface.todoTasksList.model()
+        return {"id": task_id, "name": model.getTaskNameById(task_id)}
+
+    def start(self, _message: Dict[str, object], _socket: QLocalSocket) -> Dict[str, object]:
+        if not self.pomodoro_interface.pauseResumeButton.isChecked():
+            self.pomodoro_interface.pauseResumeButton.click()
+        return self.getStatus()
+
+    def pause(self, _message: Dict[str, object], _socket: QLocalSocket) -> Dict[str, object]:
+        if self.pomodoro_interface.pauseResumeButton.isChecked():
+            self.pomodoro_interface.pauseResumeButton.click()
+        return self.getStatus()
+
+    def skip(self, _message: Dict[str, object], _socket: QLocalSocket) -> Dict[str, object]:
+        if not self.pomodoro_interface.skipButton.isEnabled():
+            raise ControlCommandError("only a running timer can be skipped")
+        self.pomodoro_interface.skipButton.click()
+        return self.getStatus()
+
+    def stop(self, _message: Dict[str, object], _socket: QLocalSocket) -> Dict[str, object]:
+        self.pomodoro_interface.stopButton.click()
+        return self.getStatus()
+
+    def switchWorkspace(self, message: Dict[str, object], _socket: QLocalSocket) -> Dict[str, object]:
+        if self.pomodoro_timer_obj.getTimerState() != TimerState.NOTHING:
+            # the workspace selector is disabled while the timer runs for the same reason
+            raise ControlCommandError("stop the timer before switching workspaces")
+
+        workspace_list_model = self.main_window.workplace_list_model
+        workspace_id = message.get("workspace_id")
+        if workspace_id is None and "workspace_name" in message:
+            workspace_id = next(
+                (
+                    workspace["id"]
+                    for workspace in workspace_list_model.workspaces
+                    if workspace["workspace_name"] == message["workspace_name"]
+                ),
+                None,
+            )
+        if workspace_list_model.get_workspace_name_by_id(workspace_id) is None:
+            raise ControlCommandError("no workspace with that id or name, pass workspace_id or workspace_name")
+
+        logger.info(f"Switching to workspace {workspace_id} on request of the control socket")
+        workspace_list_model.set_current_workspace(workspace_id)
+        return self.getStatus()
+
+    def subscribe(self, _message: Dict[str, object], socket: QLocalSocket) -> Dict[str, object]:
+        if socket not in self.subscribers:
+            self.subscribers.append(socket)
+            socket.disconnected.connect(lambda: self.subscribers.remove(socket) if socket in self.subscribers else None)
+        return self.getStatus()
+
+    def unsubscribe(self, _message: Dict[str, object], socket: QLocalSocket) -> None:
+        if socket in self.subscribers:
+            self.subscribers.remove(socket)
+
+    def publish(self, event: str) -> None:
+        if not self.subscribers:
+            return
+        data = encode_message({"event": event, "status": self.getStatus()})
+        for socket in self.subscribers:
+            socket.write(data)
+            socket.flush()
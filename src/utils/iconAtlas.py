@@ -0,0 +1,46 @@
+from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtGui import QIcon, QPainter, QPixmap, QPixmapCache
+from PySide6.QtWidgets import QApplication, QStyle
+from qfluentwidgets import FluentIconBase, Theme
+
+
+def getIconPixmap(icon: FluentIconBase, size: QSize, device_pixel_ratio: float, theme: Theme = Theme.AUTO) -> QPixmap:
+    """
+    Returns the icon rendered at size in device independent pixels. It is rendered from its SVG once and then kept in
+    QPixmapCache, which all the users of an icon share, until the cache evicts it. Draw it with QPainter.drawPixmap()
+    and set the opacity of the painter for the hovered and disabled states.
+    """
+    # the path of the SVG file depends on the color of the icon, so Theme.AUTO gets the icon of the current theme
+    path = icon.path(theme)
+    key = f"iconAtlas:{path}:{size.width()}x{size.height()}@{device_pixel_ratio}"
+
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(size * device_pixel_ratio)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
+    icon.render(painter, QRectF(0, 0, size.width(), size.height()), theme)
+    painter.end()
+
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def getIcon(icon: FluentIconBase, theme: Theme) -> QIcon:
+    """
+    Returns a QIcon of the icon at the size of the icons in menus, made of pixmaps from getIconPixmap() for the device
+    pixel ratio of the app and 1. Unlike FluentIconBase.icon() the SVG isn't rendered again for every QIcon of the same
+    icon and theme.
+    """
+    metric = QApplication.style().pixelMetric(QStyle.PixelMetric.PM_SmallIconSize)
+    size = QSize(metric, metric)
+
+    qicon = QIcon()
+    for device_pixel_ratio in {1.0, QApplication.instance().devicePixelRatio()}:
+        qicon.addPixmap(getIconPixmap(icon, size, device_pixel_ratio, theme))
+    return qicon
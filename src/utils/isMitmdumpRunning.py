@@ -1,7 +1,3 @@
-import ssl
-import urllib.request
-
-import certifi
 from loguru import logger
 from PySide6.QtCore import QThread, Signal
 
@@ -26,6 +22,11 @@ class isMitmdumpRunningWorker(QThread):
             self.checkCompleted.emit(False)
 
     def isMitmdumpRunning(self) -> bool:
+        import ssl
+        import urllib.request
+
+        import certifi
+
         proxy_url = f"http://127.0.0.1:{ConfigValues.PROXY_PORT}"
         proxy_handler = urllib.request.ProxyHandler({"http": proxy_url, "https": proxy_url})
         context = ssl.create_default_context(cafile=certifi.where())
@@ -0,0 +1,15 @@
+import json
+from typing import Dict, Optional
+
+
+def encode_message(message: Dict[str, object]) -> bytes:
+    """Messages between instances are JSON objects, one per line"""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> Optional[Dict[str, object]]:
+    try:
+        message = json.loads(line.decode("utf-8"))
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
@@ -0,0 +1,50 @@
+import threading
+from typing import Callable, Optional
+
+from loguru import logger
+
+
+class StartupOrchestrator:
+    """
+    Runs the database bootstrap (migrations, sample data and app version) in a background thread, so that font
+    registration, loading of the settings and construction of the window shell don't wait for it. It is started once
+    the single instance check has passed. Anything which reads the database has to call waitForDatabase() first.
+    """
+
+    def __init__(self, database_bootstrap: Callable[[], None]) -> None:
+        self.database_bootstrap = database_bootstrap
+        self._database_thread: Optional[threading.Thread] = None
+        self._database_error: Optional[BaseException] = None
+
+    def startDatabaseBootstrap(self) -> None:
+        # not a daemon thread, so that a migration isn't cut off halfway when the app exits early
+        self._database_thread = threading.Thread(target=self._runDatabaseBootstrap, name="DatabaseBootstrap")
+        self._database_thread.start()
+
+    def _runDatabaseBootstrap(self) -> None:
+        try:
+            self.database_bootstrap()
+        except BaseException as e:
+            # raised again in the thread which waits for the database, so that startup fails like it did when the
+            # bootstrap ran in the main thread
+            self._database_error = e
+
+    def isDatabaseReady(self) -> bool:
+        return self._database_thread is None or not self._database_thread.is_alive()
+
+    def waitForDatabase(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits up to timeout seconds (forever if None) for the database bootstrap to finish, returns whether it has
+        finished. Raises the exception the bootstrap failed with, if any.
+        """
+        if self._database_thread is not None:
+            self._database_thread.join(timeout)
+
+        if not self.isDatabaseReady():
+            return False
+
+        if self._database_error is not None:
+            error, self._database_error = self._database_error, None
+            logger.error(f"Database bootstrap failed: {error}")
+            raise error
+        return True
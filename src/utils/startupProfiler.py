@@ -0,0 +1,154 @@
+import time
+
+# taken before the other imports of this module, PySide6 among them, so that they are part of the imports phase
+MODULE_START_WALL_TIME = time.perf_counter()
+MODULE_START_CPU_TIME = time.process_time()
+
+import json  # noqa: E402
+import os  # noqa: E402
+import threading  # noqa: E402
+from contextlib import contextmanager  # noqa: E402
+from typing import Any, Dict, Iterator, List, Optional  # noqa: E402
+
+from loguru import logger  # noqa: E402
+from PySide6.QtCore import QEvent, QObject, QTimer  # noqa: E402
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+from constants import PROFILE_STARTUP_ENV_VAR  # noqa: E402
+
+
+class FirstPaintFilter(QObject):
+    """Notifies the profiler once, when the watched widget receives its first paint event"""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        super().__init__()
+        self.profiler = profiler
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            self.profiler.onFirstPaint()
+        return False
+
+
+class StartupProfiler:
+    """
+    Measures wall and CPU time of the phases of startup, from the start of the process to the first frame painted by
+    the main window. Does nothing unless the KONCENTRO_PROFILE_STARTUP environment variable is set. If its value is a
+    path (anything other than "1"), the report is also written to it as JSON.
+
+    CPU times are of the whole process, so phases which overlap with work done in other threads include that work too.
+    """
+
+    def __init__(self) -> None:
+        env_value = os.environ.get(PROFILE_STARTUP_ENV_VAR, "")
+        self.enabled: bool = bool(env_value)
+        self.report_path: str = env_value if env_value != "1" else ""
+
+        self.start_wall_time = MODULE_START_WALL_TIME
+        self.start_cpu_time = MODULE_START_CPU_TIME
+        self.phases: List[Dict[str, Any]] = []
+        self.first_paint_ms: Optional[float] = None
+        self._depth = threading.local()
+        self._paint_filter: Optional[FirstPaintFilter] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Records wall and CPU time spent inside the with block, phases can be nested"""
+        if not self.enabled:
+            yield
+            return
+
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield
+        finally:
+            self._depth.value = depth
+            self.phases.append(
+                {
+                    "name": name,
+                    "thread": threading.current_thread().name,
+                    "depth": depth,
+                    "start_ms": round((start_wall_time - self.start_wall_time) * 1000, 3),
+                    "wall_ms": round((time.perf_counter() - start_wall_time) * 1000, 3),
+                    "cpu_ms": round((time.process_time() - start_cpu_time) * 1000, 3),
+                }
+            )
+
+    def recordImports(self) -> None:
+        """Records the time since this module was imported as the imports phase, called right after the imports"""
+        if not self.enabled:
+            return
+        self.phases.append(
+            {
+                "name": "imports",
+                "thread": threading.current_thread().name,
+                "depth": 0,
+                "start_ms": 0.0,
+                "wall_ms": round((time.perf_counter() - self.start_wall_time) * 1000, 3),
+                "cpu_ms": round((time.process_time() - self.start_cpu_time) * 1000, 3),
+            }
+        )
+
+    def watchFirstPaint(self, widget: QWidget) -> None:
+        """The report is finished once widget has painted its first frame"""
+        if not self.enabled:
+            return
+        self._paint_filter = FirstPaintFilter(self)
+        widget.installEventFilter(self._paint_filter)
+
+    def onFirstPaint(self) -> None:
+        # the frame is on screen once the paint event and the flush of the backing store which follows it are done,
+        # which have both happened by the time the event loop runs the timer
+        QTimer.singleShot(0, self.finish)
+
+    def finish(self) -> None:
+        self.first_paint_ms = round((time.perf_counter() - self.start_wall_time) * 1000, 3)
+        report = self.getReport()
+
+        lines = [f"{'phase':<45} {'start':>9} {'wall':>9} {'cpu':>9}"]
+        for phase in report["phases"]:
+            name = "  " * phase["depth"] + phase["name"]
+            if phase["thread"] != "MainThread":
+                name += f" [{phase['thread']}]"
+            lines.append(f"{name:<45} {phase['start_ms']:>7.1f}ms {phase['wall_ms']:>7.1f}ms {phase['cpu_ms']:>7.1f}ms")
+        logger.info(
+            f"Startup profile:\n"
+            f"interpreter startup: {report['interpreter_startup_wall_ms']}ms wall, "
+            f"{report['interpreter_startup_cpu_ms']}ms cpu\n" + "\n".join(lines) + "\n"
+            f"first frame painted {report['first_paint_ms']}ms after __main__ started, "
+            f"{report['first_paint_since_process_start_ms']}ms after the process started"
+        )
+
+        if self.report_path:
+            try:
+                with open(self.report_path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=4)
+            except OSError as e:
+                logger.error(f"Could not write startup profile to {self.report_path}: {e}")
+
+    def getReport(self) -> Dict[str, Any]:
+        interpreter_startup_wall_ms = self.getInterpreterStartupWallTime()
+        return {
+            "interpreter_startup_wall_ms": interpreter_startup_wall_ms,
+            "interpreter_startup_cpu_ms": round(self.start_cpu_time * 1000, 3),
+            "phases": sorted(self.phases, key=lambda phase: (phase["start_ms"], phase["depth"])),
+            "first_paint_ms": self.first_paint_ms,
+            "first_paint_since_process_start_ms": (
+                round(interpreter_startup_wall_ms + self.first_paint_ms, 3) if self.first_paint_ms is not None else None
+            ),
+        }
+
+    def getInterpreterStartupWallTime(self) -> float:
+        """Wall time between the start of the process and the import of this module, imported first by __main__"""
+        import psutil
+
+        since_process_start = time.time() - psutil.Process().create_time()
+        since_profiler_start = time.perf_counter() - self.start_wall_time
+        return round((since_process_start - since_profiler_start) * 1000, 3)
+
+
+startup_profiler = StartupProfiler()
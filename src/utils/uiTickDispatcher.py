@@ -0,0 +1,47 @@
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QWidget
+
+
+class _Subscription:
+    def __init__(self, callback: Callable[[], None], is_visible: Callable[[], bool]) -> None:
+        self.callback = callback
+        self.is_visible = is_visible
+        self.is_stale = False
+
+
+def is_widget_shown(widget: QWidget) -> bool:
+    """True if the widget can be seen, a widget of a minimized window still counts as visible for Qt"""
+    return widget.isVisible() and not widget.window().isMinimized()
+
+
+class UITickDispatcher(QObject):
+    """
+    Refreshes the parts of the UI which show the timer on every tick, instead of every one of them being connected to
+    the timeout of the timer. Each part is refreshed only while its visibility predicate is true, so nothing is
+    redrawn while the window is hidden in the system tray or minimized. A part which missed ticks is marked stale and
+    refreshed by catchUp(), which has to be called whenever a part may have become visible.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.subscriptions: List[_Subscription] = []
+
+    def subscribe(self, callback: Callable[[], None], is_visible: Callable[[], bool]) -> None:
+        self.subscriptions.append(_Subscription(callback, is_visible))
+
+    def tick(self) -> None:
+        for subscription in self.subscriptions:
+            if subscription.is_visible():
+                subscription.is_stale = False
+                subscription.callback()
+            else:
+                subscription.is_stale = True
+
+    def catchUp(self) -> None:
+        """Refreshes the parts which missed ticks while they were hidden and are visible now"""
+        for subscription in self.subscriptions:
+            if subscription.is_stale and subscription.is_visible():
+                subscription.is_stale = False
+                subscription.callback()
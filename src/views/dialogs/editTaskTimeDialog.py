@@ -4,8 +4,6 @@ from PySide6.QtCore import QTime
 from PySide6.QtWidgets import QWidget
 from qfluentwidgets import MessageBoxBase, PickerColumnFormatter, SubtitleLabel, TimePicker
 
-from models.taskLookup import TaskLookup
-
 
 class TimeFormatter(PickerColumnFormatter):
     def __init__(self, text: str) -> None:
@@ -20,7 +18,7 @@ class TimeFormatter(PickerColumnFormatter):
 
 
 class EditTaskTimeDialog(MessageBoxBase):
-    def __init__(self, parent: Optional[QWidget], task_id: int) -> None:
+    def __init__(self, parent: Optional[QWidget], elapsed_time: int, target_time: int) -> None:
         super().__init__(parent=parent)
 
         self.elapsedTimeLabel: SubtitleLabel = SubtitleLabel("Elapsed Time", self)
@@ -36,9 +34,6 @@ class EditTaskTimeDialog(MessageBoxBase):
         self.estimateTimePicker.setColumnFormatter(1, TimeFormatter("m"))
         self.estimateTimePicker.setColumnFormatter(2, TimeFormatter("s"))
 
-        elapsed_time = TaskLookup.get_elapsed_time(task_id)
-        target_time = TaskLookup.get_target_time(task_id)
-
         # convert ms to QTime
         elapsed_time_qtime = self.convertMsToQTime(elapsed_time)
         target_time_qtime = self.convertMsToQTime(target_time)
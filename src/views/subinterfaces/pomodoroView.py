@@ -35,7 +35,6 @@ class PomodoroView(QWidget, Ui_PomodoroView):
 
         self.pomodoro_timer_obj = PomodoroTimer()
         self.pomodoro_timer_obj.timerStateChangedSignal.connect(self.initProgressRing)
-        self.pomodoro_timer_obj.pomodoro_timer.timeout.connect(self.updateProgressRing)
 
         self.stopButton.setToolTip(f"Stop ({controlKeyText}+R)")
         self.stopButton.installEventFilter(
@@ -1,11 +1,11 @@
 import os
 import platform
 
-from loguru import logger
 from PySide6.QtCore import Qt, QUrl, Signal
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import QWidget
 from qfluentwidgets import (
+    ComboBoxSettingCard,
     CustomColorSettingCard,
     FluentIcon,
     InfoBar,
@@ -21,7 +21,6 @@ from qfluentwidgets import (
     setThemeColor,
 )
 
-from configValues import ConfigValues
 from constants import APPLICATION_NAME, NEW_RELEASE_URL, UpdateCheckResult
 from models.config import app_settings, workspace_specific_settings
 from prefabs.customFluentIcon import CustomFluentIcon
@@ -52,7 +51,6 @@ class SettingsView(QWidget, Ui_SettingsView):
         self.initSettings()
         self.initLayout()
         self.initQss()
-        self.onValueChanged()
 
     def initSettings(self) -> None:
         # Pomodoro Settings
@@ -99,6 +97,14 @@ class SettingsView(QWidget, Ui_SettingsView):
             workspace_specific_settings.autostart_break,
             self.pomodoro_settings_group,
         )
+        self.suspend_policy_card = ComboBoxSettingCard(
+            app_settings.suspend_policy,
+            FluentIcon.POWER_BUTTON,
+            "When The Computer Sleeps",
+            "What the running timer does with the time the computer was asleep for",
+            texts=["Pause the timer", "Stop the session", "Count the time as elapsed"],
+            parent=self.pomodoro_settings_group,
+        )
 
         # Website Blocker Settings
         self.website_blocker_settings_group = SettingCardGroup("Website Blocker", self.scrollArea)
@@ -224,6 +230,7 @@ class SettingsView(QWidget, Ui_SettingsView):
         self.pomodoro_settings_group.addSettingCard(self.work_interval_card)
         self.pomodoro_settings_group.addSettingCard(self.autostart_work_card)
         self.pomodoro_settings_group.addSettingCard(self.autostart_break_card)
+        self.pomodoro_settings_group.addSettingCard(self.suspend_policy_card)
         self.work_interval_card.spinBox.setMinimumWidth(125)
         self.scrollAreaWidgetContents.layout().addWidget(self.pomodoro_settings_group)
 
@@ -274,81 +281,6 @@ class SettingsView(QWidget, Ui_SettingsView):
         for card in settingCards:
             setCustomStyleSheet(card, qss_light, qss_dark)
 
-    def onValueChanged(self) -> None:
-        workspace_specific_settings.work_duration.valueChanged.connect(self.updateWorkDuration)
-        workspace_specific_settings.break_duration.valueChanged.connect(self.updateBreakDuration)
-        workspace_specific_settings.long_break_duration.valueChanged.connect(self.updateLongBreakDuration)
-        workspace_specific_settings.work_intervals.valueChanged.connect(self.updateWorkIntervals)
-        workspace_specific_settings.autostart_work.valueChanged.connect(self.updateAutostartWork)
-        workspace_specific_settings.autostart_break.valueChanged.connect(self.updateAutostartBreak)
-        workspace_specific_settings.enable_website_blocker.valueChanged.connect(self.updateEnableWebsiteBlocker)
-
-        app_settings.proxy_port.valueChanged.connect(self.updateProxyPort)
-        app_settings.check_for_updates_on_start.valueChanged.connect(self.updateCheckForUpdatesOnStart)
-        app_settings.should_minimize_to_tray.valueChanged.connect(self.updateShouldMinimizeToTray)
-
-    def updateBreakDuration(self) -> None:
-        ConfigValues.BREAK_DURATION = workspace_specific_settings.get(workspace_specific_settings.break_duration)
-        logger.debug(
-            f"Updated Break Duration to: {workspace_specific_settings.get(workspace_specific_settings.break_duration)}"
-        )
-
-    def updateWorkDuration(self) -> None:
-        ConfigValues.WORK_DURATION = workspace_specific_settings.get(workspace_specific_settings.work_duration)
-        logger.debug(
-            f"Updated Work Duration to: {workspace_specific_settings.get(workspace_specific_settings.work_duration)}"
-        )
-
-    def updateLongBreakDuration(self) -> None:
-        ConfigValues.LONG_BREAK_DURATION = workspace_specific_settings.get(
-            workspace_specific_settings.long_break_duration
-        )
-        logger.debug(
-            f"Updated Long Break Duration to: "
-            f"{workspace_specific_settings.get(workspace_specific_settings.long_break_duration)}"
-        )
-
-    def updateWorkIntervals(self) -> None:
-        ConfigValues.WORK_INTERVALS = workspace_specific_settings.get(workspace_specific_settings.work_intervals)
-        logger.debug(
-            f"Updated Work Intervals to: {workspace_specific_settings.get(workspace_specific_settings.work_intervals)}"
-        )
-
-    def updateAutostartWork(self) -> None:
-        ConfigValues.AUTOSTART_WORK = workspace_specific_settings.get(workspace_specific_settings.autostart_work)
-        logger.debug(
-            f"Updated Autostart Work to: {workspace_specific_settings.get(workspace_specific_settings.autostart_work)}"
-        )
-
-    def updateAutostartBreak(self) -> None:
-        ConfigValues.AUTOSTART_BREAK = workspace_specific_settings.get(workspace_specific_settings.autostart_break)
-        logger.debug(
-            f"Updated Autostart Break to: "
-            f"{workspace_specific_settings.get(workspace_specific_settings.autostart_break)}"
-        )
-
-    def updateEnableWebsiteBlocker(self) -> None:
-        ConfigValues.ENABLE_WEBSITE_BLOCKER = workspace_specific_settings.get(
-            workspace_specific_settings.enable_website_blocker
-        )
-        logger.debug(
-            f"Enable Website Blocker: {
-                workspace_specific_settings.get(workspace_specific_settings.enable_website_blocker)
-            }"
-        )
-
-    def updateProxyPort(self) -> None:
-        ConfigValues.PROXY_PORT = app_settings.get(app_settings.proxy_port)
-        logger.debug(f"Proxy Port: {app_settings.get(app_settings.proxy_port)}")
-
-    def updateCheckForUpdatesOnStart(self) -> None:
-        ConfigValues.CHECK_FOR_UPDATES_ON_START = app_settings.get(app_settings.check_for_updates_on_start)
-        logger.debug(f"Check For Updates On Start: {app_settings.get(app_settings.check_for_updates_on_start)}")
-
-    def updateShouldMinimizeToTray(self) -> None:
-        ConfigValues.SHOULD_MINIMIZE_TO_TRAY = app_settings.get(app_settings.should_minimize_to_tray)
-        logger.debug(f"Should Minimize To Tray: {app_settings.get(app_settings.should_minimize_to_tray)}")
-
     def checkForUpdatesNow(self) -> None:
         """Check for updates using the UpdateChecker class"""
         # Show a small info message to let the user know we're checking for updates
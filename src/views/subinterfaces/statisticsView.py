@@ -0,0 +1,85 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QShowEvent
+from PySide6.QtWidgets import QAbstractItemView, QHBoxLayout, QHeaderView, QTableWidgetItem, QVBoxLayout, QWidget
+from qfluentwidgets import BodyLabel, ComboBox, TableWidget, TitleLabel
+
+from models.blockedHitsRecorder import BlockedHitsRecorder, get_blocked_hit_totals, get_statistics_start_times
+from models.workspaceLookup import WorkspaceLookup
+
+
+class StatisticsView(QWidget):
+    """
+    For statistics view of the app, shows which websites were blocked most often in the current workspace
+    """
+
+    def __init__(self, blocked_hits_recorder: BlockedHitsRecorder) -> None:
+        super().__init__()
+        self.blocked_hits_recorder = blocked_hits_recorder
+
+        self.initWidget()
+        self.connectSignalsToSlots()
+
+    def initWidget(self) -> None:
+        self.verticalLayout = QVBoxLayout(self)
+        self.verticalLayout.setSpacing(12)
+        self.verticalLayout.setContentsMargins(24, 24, 24, 24)
+
+        self.titleLabel = TitleLabel("Statistics", self)
+        self.verticalLayout.addWidget(self.titleLabel)
+
+        self.periodLayout = QHBoxLayout()
+        self.blockedWebsitesLabel = BodyLabel("Blocked websites", self)
+        self.periodComboBox = ComboBox(self)
+        self.periodComboBox.addItems(list(get_statistics_start_times().keys()))
+        self.periodLayout.addWidget(self.blockedWebsitesLabel)
+        self.periodLayout.addStretch()
+        self.periodLayout.addWidget(self.periodComboBox)
+        self.verticalLayout.addLayout(self.periodLayout)
+
+        self.blockedHitsTable = TableWidget(self)
+        self.blockedHitsTable.setColumnCount(2)
+        self.blockedHitsTable.setHorizontalHeaderLabels(["Website", "Blocked Requests"])
+        self.blockedHitsTable.verticalHeader().hide()
+        self.blockedHitsTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.blockedHitsTable.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.blockedHitsTable.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.blockedHitsTable.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.verticalLayout.addWidget(self.blockedHitsTable)
+
+        self.totalLabel = BodyLabel(self)
+        self.verticalLayout.addWidget(self.totalLabel)
+
+    def connectSignalsToSlots(self) -> None:
+        self.periodComboBox.currentIndexChanged.connect(self.refresh)
+        self.blocked_hits_recorder.hitsFlushed.connect(self.onHitsFlushed)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        # flushing so that hits blocked since the last periodic write are shown too. If there were any, the view is
+        # already refreshed through hitsFlushed
+        if not self.blocked_hits_recorder.flush():
+            self.refresh()
+        super().showEvent(event)
+
+    def onHitsFlushed(self) -> None:
+        # no point in querying the database when the view isn't visible, it is refreshed when shown
+        if self.isVisible():
+            self.refresh()
+
+    def onCurrentWorkspaceChanged(self) -> None:
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self) -> None:
+        workspace_id = WorkspaceLookup.get_current_workspace_id()
+        since = get_statistics_start_times()[self.periodComboBox.currentText()]
+        totals = get_blocked_hit_totals(workspace_id, since) if workspace_id is not None else []
+
+        self.blockedHitsTable.setRowCount(len(totals))
+        for row, (domain, count) in enumerate(totals):
+            count_item = QTableWidgetItem(str(count))
+            count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            self.blockedHitsTable.setItem(row, 0, QTableWidgetItem(domain))
+            self.blockedHitsTable.setItem(row, 1, count_item)
+
+        total_count = sum(count for _, count in totals)
+        self.totalLabel.setText(f"{total_count} requests to {len(totals)} websites were blocked")
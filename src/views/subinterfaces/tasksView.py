@@ -223,7 +223,6 @@ class TaskListView(Ui_TaskView, QWidget):
         self.subTaskDialogAboutToOpen.emit()
 
         selectedRootTask: bool = False
-        isFirstSubTask: bool = False
 
         # check if a parent task is selected
         if self.todoTasksList.selectionModel().hasSelection():
@@ -252,15 +251,11 @@ class TaskListView(Ui_TaskView, QWidget):
                 row = self.todoTasksList.model().rowCount(selectedTaskIndex)
                 # selected task is a parent(root) task
                 parentTaskIndex: QModelIndex = selectedTaskIndex
-                parentTaskNode: TaskNode = selectedTaskNode
             else:
                 parentTaskIndex: QModelIndex = selectedTaskIndex.parent()
-                parentTaskNode: TaskNode = parentTaskIndex.internalPointer()
                 row = self.todoTasksList.model().rowCount(parentTaskIndex)
 
-            if len(parentTaskNode.children) == 0:
-                isFirstSubTask = True
-
+            # the first subtask takes over the time of the parent task, see TaskListModel.insertRow()
             model.insertRow(
                 row,
                 parentTaskIndex,
@@ -268,21 +263,6 @@ class TaskListView(Ui_TaskView, QWidget):
                 task_type=TaskType.TODO,
             )
 
-            # if this is the first subtask of the parent task then make time of child task = time of parent task
-            if isFirstSubTask:
-                childTaskNode: TaskNode = parentTaskNode.children[0]
-                childTaskNode.elapsed_time = parentTaskNode.elapsed_time
-                childTaskNode.target_time = parentTaskNode.target_time
-
-            # set time of parent task as sum of all its subtask
-            parentTaskNode.elapsed_time = 0
-            parentTaskNode.target_time = 0
-            for childTask in parentTaskNode.children:
-                parentTaskNode.elapsed_time += childTask.elapsed_time
-                parentTaskNode.target_time += childTask.target_time
-
-            self.todoTasksList.model().update_db()
-
     def onInvalidDrop(self, dropType: InvalidTaskDrop) -> None:
         if dropType == InvalidTaskDrop.DROPPED_PARENT_TASK_AT_CHILD_LEVEL:
             InfoBar.warning(
@@ -353,7 +333,10 @@ class TaskListView(Ui_TaskView, QWidget):
             return
 
         task_id = row.data(TaskListModel.IDRole)
-        self.editTaskTimeDialog = EditTaskTimeDialog(self.window(), task_id)
+        # taken from the model instead of the database, which doesn't have the time of a work interval until it ends
+        self.editTaskTimeDialog = EditTaskTimeDialog(
+            self.window(), row.data(TaskListModel.ElapsedTimeRole), row.data(TaskListModel.TargetTimeRole)
+        )
 
         taskIndex: QModelIndex = task_list_model.getIndexByTaskId(task_id)
         isChildTask: bool = taskIndex.parent().isValid()
@@ -371,50 +354,13 @@ class TaskListView(Ui_TaskView, QWidget):
             return
 
         if self.editTaskTimeDialog.exec():
-            if isChildTask:
-                childElapsedTime = self.editTaskTimeDialog.getElapsedTime()
-                childEstimatedTime = self.editTaskTimeDialog.getTargetTime()
-
-                parentTaskIndex = task_list_model.parent(row)
-                parentTaskNode = task_list_model.get_node(parentTaskIndex)
-                children = parentTaskNode.children
-
-                parentElapsedTime = 0
-                parentEstimatedTime = 0
-                for child in children:
-                    if child.task_id != task_id:
-                        parentElapsedTime += child.elapsed_time
-                        parentEstimatedTime += child.target_time
-                    else:
-                        if childElapsedTime is not None:
-                            parentElapsedTime += childElapsedTime
-                        else:
-                            parentElapsedTime += child.elapsed_time
-
-                        if childEstimatedTime is not None:
-                            parentEstimatedTime += childEstimatedTime
-                        else:
-                            parentEstimatedTime += child.target_time
-
-                if childElapsedTime is not None:
-                    task_list_model.setData(row, childElapsedTime, TaskListModel.ElapsedTimeRole, update_db=True)
-                    task_list_model.setData(
-                        parentTaskIndex, parentElapsedTime, TaskListModel.ElapsedTimeRole, update_db=True
-                    )
-
-                if childEstimatedTime is not None:
-                    task_list_model.setData(row, childEstimatedTime, TaskListModel.TargetTimeRole, update_db=True)
-                    task_list_model.setData(
-                        parentTaskIndex, parentEstimatedTime, TaskListModel.TargetTimeRole, update_db=True
-                    )
-
-            else:
-                elapsed_time = self.editTaskTimeDialog.getElapsedTime()
-                if elapsed_time is not None:
-                    task_list_model.setData(row, elapsed_time, TaskListModel.ElapsedTimeRole, update_db=True)
-                estimated_time = self.editTaskTimeDialog.getTargetTime()
-                if estimated_time is not None:
-                    task_list_model.setData(row, estimated_time, TaskListModel.TargetTimeRole, update_db=True)
+            # the time of the parent task of a subtask is updated along with it, see TaskNode
+            elapsed_time = self.editTaskTimeDialog.getElapsedTime()
+            if elapsed_time is not None:
+                task_list_model.setData(row, elapsed_time, TaskListModel.ElapsedTimeRole, update_db=True)
+            estimated_time = self.editTaskTimeDialog.getTargetTime()
+            if estimated_time is not None:
+                task_list_model.setData(row, estimated_time, TaskListModel.TargetTimeRole, update_db=True)
 
     def setupSelectionBehavior(self) -> None:
         """
@@ -449,12 +395,10 @@ class TaskListView(Ui_TaskView, QWidget):
             self.todoTasksList.selectionModel().selectionChanged.connect(self.onTodoTasksSelectionChanged)
 
     def onCurrentWorkspaceChanged(self) -> None:
+        # the task lists restore which tasks are expanded when their model is reset
         self.todoTasksList.model().load_data()
         self.completedTasksList.model().load_data()
 
-        self.todoTasksList._restoreExpansionStateOfAllTasks()
-        self.completedTasksList._restoreExpansionStateOfAllTasks()
-
     def autoSetCurrentTaskID(self) -> None:
         model: TaskListModel = self.todoTasksList.model()
 
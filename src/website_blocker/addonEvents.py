@@ -0,0 +1,154 @@
+# Don't add any 3rd party imports here, as this file is used by mitmdump directly through block.py
+
+"""Non-blocking stream of events from the mitmdump addon to the app."""
+
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import BinaryIO, Deque, Optional, Tuple, Union
+
+from website_blocker.constants import (
+    EVENT_STREAM_FLUSH_INTERVAL,
+    EVENT_STREAM_MAX_BUFFERED_EVENTS,
+    EVENT_STREAM_PROTOCOL_VERSION,
+    EVENT_STREAM_RECONNECT_INTERVAL,
+    EVENT_STREAM_WRITE_TIMEOUT,
+)
+
+# ("blocked", domain, unix timestamp) or ("decision", latency in nanoseconds)
+Event = Union[Tuple[str, str, float], Tuple[str, int]]
+
+
+def get_ruleset_version(block_type: str, addresses_str: str) -> str:
+    """Short fingerprint of the rules mitmdump runs with, computed the same way by the app and the addon."""
+    return hashlib.sha1(f"{block_type}\n{addresses_str}".encode()).hexdigest()[:12]
+
+
+class AddonEventStream:
+    """
+    Buffers events in memory and sends them in batches to the app from a daemon thread. Recording an event is a
+    single deque append, so the request hook never waits on the app. When the buffer is full the oldest events are
+    dropped, and when the app isn't listening batches are dropped until a reconnect succeeds.
+
+    Each batch is sent as one line of JSON.
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+        self.ruleset_version = ""
+        self.dropped_batches = 0
+
+        self._events: Deque[Event] = deque(maxlen=EVENT_STREAM_MAX_BUFFERED_EVENTS)
+        self._is_ruleset_announced = False
+        self._connection: Optional[Union[socket.socket, BinaryIO]] = None
+        self._next_connect_time = 0.0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="koncentro-event-stream", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Send the remaining events and stop the sender thread."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(EVENT_STREAM_WRITE_TIMEOUT * 2)
+        self._close()
+
+    def set_ruleset_version(self, version: str) -> None:
+        if version != self.ruleset_version:
+            self.ruleset_version = version
+            self._is_ruleset_announced = False
+
+    def record_blocked(self, domain: str) -> None:
+        self._events.append(("blocked", domain, time.time()))
+
+    def record_decision(self, latency_ns: int) -> None:
+        self._events.append(("decision", latency_ns))
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(EVENT_STREAM_FLUSH_INTERVAL):
+            self._flush()
+        self._flush()
+
+    def _flush(self) -> None:
+        blocked = []
+        decision_count = 0
+        decision_total_ns = 0
+        decision_max_ns = 0
+
+        # popleft() is atomic, so events appended by the request hook while draining are kept for the next batch
+        while True:
+            try:
+                event = self._events.popleft()
+            except IndexError:
+                break
+
+            if event[0] == "blocked":
+                blocked.append([event[1], event[2]])
+            else:
+                decision_count += 1
+                decision_total_ns += event[1]
+                decision_max_ns = max(decision_max_ns, event[1])
+
+        if not blocked and not decision_count and self._is_ruleset_announced:
+            return
+
+        batch = {
+            "protocol": EVENT_STREAM_PROTOCOL_VERSION,
+            "ruleset": self.ruleset_version,
+            "blocked": blocked,
+            "decisions": {"count": decision_count, "total_ns": decision_total_ns, "max_ns": decision_max_ns},
+        }
+
+        if self._send((json.dumps(batch, separators=(",", ":")) + "\n").encode()):
+            self._is_ruleset_announced = True
+        else:
+            self.dropped_batches += 1
+
+    def _send(self, data: bytes) -> bool:
+        if self._connection is None and not self._connect():
+            return False
+
+        try:
+            if isinstance(self._connection, socket.socket):
+                self._connection.sendall(data)
+            else:
+                self._connection.write(data)
+                self._connection.flush()
+            return True
+        except OSError:
+            self._close()
+            self._next_connect_time = time.monotonic() + EVENT_STREAM_RECONNECT_INTERVAL
+            return False
+
+    def _connect(self) -> bool:
+        if not self.socket_path or time.monotonic() < self._next_connect_time:
+            return False
+
+        try:
+            if os.name == "nt":
+                # QLocalServer listens on a named pipe on Windows
+                self._connection = open(self.socket_path, "wb", buffering=0)
+            else:
+                connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                connection.settimeout(EVENT_STREAM_WRITE_TIMEOUT)
+                connection.connect(self.socket_path)
+                self._connection = connection
+            return True
+        except OSError:
+            self._close()
+            self._next_connect_time = time.monotonic() + EVENT_STREAM_RECONNECT_INTERVAL
+            return False
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except OSError:
+                pass
+            self._connection = None
@@ -0,0 +1,127 @@
+# Don't add any 3rd party imports here, as this file is used by mitmdump directly through block.py
+
+"""Level-gated and rate-limited structured logging for the mitmdump addon."""
+
+import json
+import logging
+import logging.handlers
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+from website_blocker.constants import (
+    ADDON_LOG_FILE_BACKUP_COUNT,
+    ADDON_LOG_FILE_MAX_BYTES,
+    ADDON_LOG_RATE_LIMIT,
+    ADDON_LOG_RING_BUFFER_SIZE,
+    ADDON_LOGGER_NAME,
+)
+
+logger = logging.getLogger(ADDON_LOGGER_NAME)
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last formatted records in memory, older records are dropped"""
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self.lines: Deque[str] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.lines.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def get_lines(self) -> List[str]:
+        return list(self.lines)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most `rate` records with the same level and message template through per `interval` seconds. The number
+    of records suppressed in a window is attached to the first record let through after it, so floods stay visible
+    without being written out one by one.
+    """
+
+    def __init__(self, rate: int, interval: float = 1.0) -> None:
+        super().__init__()
+        self.rate = rate
+        self.interval = interval
+        # (level, message template) -> (start of window, records let through, records suppressed)
+        self._windows: Dict[Tuple[int, str], Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, str(record.msg))
+        now = time.monotonic()
+
+        with self._lock:
+            window_start, passed, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - window_start >= self.interval:
+                if suppressed:
+                    record.suppressed = suppressed
+                window_start, passed, suppressed = now, 0, 0
+
+            if passed >= self.rate:
+                self._windows[key] = (window_start, passed, suppressed + 1)
+                return False
+
+            self._windows[key] = (window_start, passed + 1, suppressed)
+            return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one line of JSON, fields passed as extra={"fields": {...}} become keys of it"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        data.update(getattr(record, "fields", {}))
+        if hasattr(record, "suppressed"):
+            data["suppressed"] = record.suppressed
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+ring_buffer = RingBufferHandler(ADDON_LOG_RING_BUFFER_SIZE)
+ring_buffer.setFormatter(JsonFormatter())
+
+
+def setup_addon_logging(level: str = "warning", log_file: str = "") -> None:
+    """
+    Records of at least `level` are kept in the ring buffer, and also written to `log_file` (rotated once it grows
+    past ADDON_LOG_FILE_MAX_BYTES) if it isn't empty. Can be called again when the options of the addon change.
+    """
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        if handler is not ring_buffer:
+            handler.close()
+    for log_filter in logger.filters[:]:
+        logger.removeFilter(log_filter)
+
+    level_number = logging.getLevelName(level.upper())  # returns a string for unknown level names
+    logger.setLevel(level_number if isinstance(level_number, int) else logging.WARNING)
+    # mitmproxy prints records which reach the root logger, which is what this is meant to replace
+    logger.propagate = False
+    logger.addFilter(RateLimitFilter(ADDON_LOG_RATE_LIMIT))
+    logger.addHandler(ring_buffer)
+
+    if log_file:
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=ADDON_LOG_FILE_MAX_BYTES,
+                backupCount=ADDON_LOG_FILE_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.error("Could not open addon log file", extra={"fields": {"path": log_file, "error": str(e)}})
+            return
+        file_handler.setFormatter(JsonFormatter())
+        logger.addHandler(file_handler)
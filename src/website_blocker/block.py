@@ -3,10 +3,13 @@
 
 """Block URLs according to rules."""
 
+import ipaddress
+import logging
 import os
 import sys
+import time
 import urllib.parse
-from typing import Set
+from typing import Optional, Set
 
 import mitmproxy.addonmanager
 
@@ -15,30 +18,90 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from mitmproxy import ctx, http
 
-from website_blocker.constants import BLOCK_HTML_MESSAGE, MITMDUMP_CHECK_URL, MITMDUMP_SHUTDOWN_URL
+from website_blocker.addonEvents import AddonEventStream, get_ruleset_version
+from website_blocker.addonLogging import logger, ring_buffer, setup_addon_logging
+from website_blocker.constants import (
+    BLOCK_HTML_MESSAGE,
+    MITMDUMP_CHECK_URL,
+    MITMDUMP_LOGS_URL,
+    MITMDUMP_SHUTDOWN_URL,
+)
+
+# sends blocked hits and decision latencies to the app, None if the app didn't pass events_socket
+event_stream: Optional[AddonEventStream] = None
 
 
 def load(loader: mitmproxy.addonmanager.Loader) -> None:
-    print(type(loader))
     loader.add_option("addresses_str", str, "", "Concatenated addresses.")
     loader.add_option("block_type", str, "", "Allowlist or blocklist.")
+    loader.add_option("events_socket", str, "", "Local socket on which the app listens for blocker events.")
+    loader.add_option("log_level", str, "warning", "Minimum level of records logged by the addon.")
+    loader.add_option("log_file", str, "", "File the addon logs to in addition to memory, rotated when it grows.")
+
+
+def configure(updated: Set[str]) -> None:
+    global event_stream
+
+    if "log_level" in updated or "log_file" in updated:
+        setup_addon_logging(ctx.options.log_level, ctx.options.log_file)
+        logger.info("Addon logging configured", extra={"fields": {"level": ctx.options.log_level}})
+
+    if "events_socket" in updated:
+        if event_stream is not None:
+            event_stream.stop()
+            event_stream = None
+        if ctx.options.events_socket:
+            event_stream = AddonEventStream(ctx.options.events_socket)
+            event_stream.start()
+
+    if event_stream is not None:
+        event_stream.set_ruleset_version(get_ruleset_version(ctx.options.block_type, ctx.options.addresses_str))
+
+
+def done() -> None:
+    global event_stream
+
+    if event_stream is not None:
+        event_stream.stop()
+        event_stream = None
+
+
+def is_loopback_client(flow: mitmproxy.http.HTTPFlow) -> bool:
+    try:
+        address = ipaddress.ip_address(flow.client_conn.peername[0])
+    except (TypeError, ValueError):
+        return False
+    # IPv4 clients of a dual stack listener show up as ::ffff:127.0.0.1
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_loopback
 
 
 def request(flow: mitmproxy.http.HTTPFlow) -> None:
-    print(type(flow))
     # https://docs.mitmproxy.org/stable/addons-examples/#shutdown
     if flow.request.pretty_url == MITMDUMP_SHUTDOWN_URL:
-        print("Shutting down mitmdump...")
+        logger.info("Shutting down mitmdump")
         # Send confirmation response before shutdown
         flow.response = http.Response.make(200, b"Shutting down mitmproxy...\n", {"Content-Type": "text/plain"})
         ctx.master.shutdown()
         return
 
     if flow.request.method == MITMDUMP_CHECK_URL:
-        print("Mitmdump is running, sending back confirmation response.")
+        logger.debug("Mitmdump is running, sending back confirmation response")
         flow.response = http.Response.make(200, b"Mitmdump is running.\n", {"Content-Type": "text/plain"})
         return
 
+    if flow.request.pretty_url == MITMDUMP_LOGS_URL:
+        # the records contain the domains which were requested and mitmdump also accepts clients from the network
+        if not is_loopback_client(flow):
+            flow.response = http.Response.make(403, b"Forbidden\n", {"Content-Type": "text/plain"})
+            return
+        logs = "\n".join(ring_buffer.get_lines()) + "\n"
+        flow.response = http.Response.make(200, logs.encode(), {"Content-Type": "application/x-ndjson"})
+        return
+
+    decision_start_time = time.perf_counter_ns()
+
     def strip_www(domain: str) -> str:
         return domain[4:] if domain.startswith("www.") else domain
 
@@ -60,7 +123,17 @@ def request(flow: mitmproxy.http.HTTPFlow) -> None:
 
     # Use direct string matching for exact domain match
     has_match: bool = url_domain in addresses
-    if (ctx.options.block_type == "allowlist" and not has_match) or (
+    is_blocked: bool = (ctx.options.block_type == "allowlist" and not has_match) or (
         ctx.options.block_type == "blocklist" and has_match
-    ):
+    )
+    if is_blocked:
         flow.response = http.Response.make(200, BLOCK_HTML_MESSAGE.encode(), {"Content-Type": "text/html"})
+
+    if event_stream is not None:
+        event_stream.record_decision(time.perf_counter_ns() - decision_start_time)
+        if is_blocked:
+            event_stream.record_blocked(url_domain)
+
+    # checking the level first so that the fields aren't built for every request when debug logging is off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request decided", extra={"fields": {"domain": url_domain, "blocked": is_blocked}})
@@ -0,0 +1,131 @@
+import json
+import os
+from functools import partial
+from typing import Dict, List, Optional
+
+from loguru import logger
+from PySide6.QtCore import QDir, QMetaObject, QObject, Qt, QThread, Signal, Slot
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from website_blocker.constants import EVENT_STREAM_PROTOCOL_VERSION, EVENT_STREAM_SERVER_NAME
+
+
+class BlockerEventReader(QObject):
+    """
+    Reads the batches of events sent by block.py (see website_blocker/addonEvents.py). Lives in its own thread so that
+    parsing never delays the UI, the parsed events are delivered to the main thread through queued signals.
+    """
+
+    blockedHitsReceived = Signal(list)  # list of [domain, unix timestamp]
+    # dict with count, total_ns and max_ns, emitted as object as nanosecond totals can overflow a 32-bit int
+    decisionStatsReceived = Signal(object)
+    rulesetVersionReceived = Signal(str)
+
+    def __init__(self, server_name: str) -> None:
+        super().__init__()
+        self.server_name = server_name
+        self.server: Optional[QLocalServer] = None
+        self.sockets: List[QLocalSocket] = []
+        self.ruleset_version = ""
+
+    @Slot()
+    def start(self) -> None:
+        self.server = QLocalServer(self)
+        # remove socket file which may have been left behind by a crashed instance
+        QLocalServer.removeServer(self.server_name)
+        if not self.server.listen(self.server_name):
+            logger.error(f"Could not listen for website blocker events: {self.server.errorString()}")
+            return
+        self.server.newConnection.connect(self._onNewConnection)
+        logger.debug(f"Listening for website blocker events on {self.server.fullServerName()}")
+
+    @Slot()
+    def stop(self) -> None:
+        for socket in self.sockets:
+            socket.abort()
+            socket.deleteLater()
+        self.sockets.clear()
+
+        if self.server is not None:
+            self.server.close()
+            self.server.deleteLater()
+            self.server = None
+
+    def _onNewConnection(self) -> None:
+        while self.server is not None and self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self.sockets.append(socket)
+            socket.readyRead.connect(partial(self._onReadyRead, socket))
+            socket.disconnected.connect(partial(self._onDisconnected, socket))
+
+    def _onDisconnected(self, socket: QLocalSocket) -> None:
+        # events sent right before mitmdump exited may still be unread
+        self._onReadyRead(socket)
+        if socket in self.sockets:
+            self.sockets.remove(socket)
+        socket.deleteLater()
+
+    def _onReadyRead(self, socket: QLocalSocket) -> None:
+        while socket.canReadLine():
+            line = bytes(socket.readLine().data()).decode("utf-8", errors="replace").strip()
+            if line:
+                self._handleBatch(line)
+
+    def _handleBatch(self, line: str) -> None:
+        try:
+            batch = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Received malformed website blocker event batch: {line[:100]}")
+            return
+
+        if not isinstance(batch, dict) or batch.get("protocol") != EVENT_STREAM_PROTOCOL_VERSION:
+            logger.warning("Received website blocker event batch with unsupported protocol version")
+            return
+
+        ruleset_version = batch.get("ruleset", "")
+        if ruleset_version != self.ruleset_version:
+            self.ruleset_version = ruleset_version
+            self.rulesetVersionReceived.emit(ruleset_version)
+
+        blocked_hits = batch.get("blocked", [])
+        if blocked_hits:
+            self.blockedHitsReceived.emit(blocked_hits)
+
+        decisions: Dict[str, int] = batch.get("decisions", {})
+        if decisions.get("count"):
+            self.decisionStatsReceived.emit(decisions)
+
+
+class BlockerEventServer(QObject):
+    """Owns the thread in which BlockerEventReader listens for events sent by block.py"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # pid is part of the name so that every process gets its own socket, also when instances run by different users
+        # share the temporary directory
+        server_name = f"{EVENT_STREAM_SERVER_NAME}-{os.getpid()}"
+        if os.name == "nt":
+            self.server_path = rf"\\.\pipe\{server_name}"
+        else:
+            # absolute path, so that QLocalServer and block.py agree on where the socket file is
+            self.server_path = os.path.join(QDir.tempPath(), server_name)
+
+        self.reader = BlockerEventReader(server_name if os.name == "nt" else self.server_path)
+        self.blockedHitsReceived = self.reader.blockedHitsReceived
+        self.decisionStatsReceived = self.reader.decisionStatsReceived
+        self.rulesetVersionReceived = self.reader.rulesetVersionReceived
+
+        self.thread = QThread()
+        self.thread.setObjectName("BlockerEventReaderThread")
+        self.reader.moveToThread(self.thread)
+        self.thread.started.connect(self.reader.start)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        if not self.thread.isRunning():
+            return
+        QMetaObject.invokeMethod(self.reader, "stop", Qt.ConnectionType.BlockingQueuedConnection)
+        self.thread.quit()
+        self.thread.wait(1000)
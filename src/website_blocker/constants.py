@@ -6,3 +6,20 @@ MITMDUMP_SHUTDOWN_URL = f"http://shutdown.{APPLICATION_NAME.lower()}.internal/"
 BLOCK_HTML_MESSAGE = f"<h1>Website blocked by {APPLICATION_NAME}!</h1>"
 
 MITMDUMP_CHECK_URL = f"http://check.{APPLICATION_NAME.lower()}.internal/"
+
+# for the stream of events sent by block.py to the app, see addonEvents.py
+EVENT_STREAM_SERVER_NAME = f"{APPLICATION_NAME.lower()}-blocker-events"
+EVENT_STREAM_PROTOCOL_VERSION = 1
+EVENT_STREAM_FLUSH_INTERVAL = 0.5  # in seconds
+EVENT_STREAM_RECONNECT_INTERVAL = 5  # in seconds
+EVENT_STREAM_WRITE_TIMEOUT = 1  # in seconds
+EVENT_STREAM_MAX_BUFFERED_EVENTS = 10000
+
+# for logging done by block.py, see addonLogging.py
+ADDON_LOGGER_NAME = f"{APPLICATION_NAME.lower()}.block"
+ADDON_LOG_RING_BUFFER_SIZE = 1000  # number of records kept in memory
+ADDON_LOG_RATE_LIMIT = 20  # records per second with the same message
+ADDON_LOG_FILE_MAX_BYTES = 1024 * 1024
+ADDON_LOG_FILE_BACKUP_COUNT = 3
+# responds with the records kept in memory, only to clients on the same machine
+MITMDUMP_LOGS_URL = f"http://logs.{APPLICATION_NAME.lower()}.internal/"
@@ -0,0 +1,205 @@
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Protocol
+
+from loguru import logger
+
+
+class ProxyBackend(Protocol):
+    """Subset of uniproxy.Uniproxy's interface used by ProxyStateManager"""
+
+    ip_address: str
+    port: int
+
+    def join(self) -> None: ...
+
+    def set_proxy(self) -> None: ...
+
+    def delete_proxy(self) -> None: ...
+
+    def get_proxy(self) -> Optional[Dict[str, Any]]: ...
+
+
+class ProxyState(NamedTuple):
+    enabled: bool
+    ip_address: str
+    port: int
+
+
+class ProxyStateManager:
+    """
+    Reads the system proxy configuration before applying a wanted state and only touches the system proxy when the
+    wanted state actually differs from it. Every change of the system proxy launches external commands (kwriteconfig,
+    gsettings, networksetup, ...), so set/unset pairs which cancel out, like the ones caused by restarting the blocker
+    during a work session, are skipped entirely.
+
+    The configuration is read again at the start of every sync() as the user or another tool may have changed it since
+    the last one. Reading it launches a few commands, far fewer than changing it.
+
+    request() records the wanted state and tells the caller whether it has to start a worker running sync(). Requests
+    made while a sync is in progress are picked up by that sync, so only the last wanted state is ever applied.
+    """
+
+    def __init__(self, proxy: ProxyBackend) -> None:
+        self.proxy = proxy
+        self._lock = threading.Lock()
+        self._cached_state: Optional[ProxyState] = None  # None means that the system proxy state isn't known
+        self._is_state_read: bool = False
+        self._wanted_enabled: Optional[bool] = None
+        self._force: bool = False
+        self._is_syncing: bool = False
+
+    def request(self, enabled: bool, force: bool = False) -> bool:
+        """
+        Record whether the proxy should be enabled. Returns True if the caller has to run sync() in a worker thread,
+        False if a sync which will apply this request is already running.
+
+        force applies the request even if the cached state says that nothing has to change
+        """
+        with self._lock:
+            self._wanted_enabled = enabled
+            self._force = self._force or force
+            if self._is_syncing:
+                return False
+            self._is_syncing = True
+            return True
+
+    def sync(self) -> None:
+        """Apply the difference between the wanted and the cached proxy state, to be called from a worker thread"""
+        try:
+            # read outside of the lock so that request() doesn't wait for the external commands
+            state = self._read_state()
+            with self._lock:
+                self._cached_state = state
+                self._is_state_read = True
+
+            while True:
+                with self._lock:
+                    if not self._is_state_read:
+                        self._cached_state = self._read_state()
+                        self._is_state_read = True
+
+                    wanted = self._wanted_state()
+                    current = self._cached_state
+                    force = self._force
+                    self._force = False
+
+                    if wanted is None or (not force and self._is_same_state(current, wanted)):
+                        self._is_syncing = False
+                        return
+
+                self._apply(current, wanted, force)
+
+                with self._lock:
+                    self._cached_state = wanted
+        except Exception:
+            with self._lock:
+                # the system proxy may be half configured now, so read it again before the next transition
+                self._is_state_read = False
+                self._cached_state = None
+                self._is_syncing = False
+            raise
+
+    def invalidate(self) -> None:
+        """Forget the cached state so that it is read from the system again before the next transition"""
+        with self._lock:
+            self._is_state_read = False
+            self._cached_state = None
+
+    def get_cached_state(self) -> Optional[ProxyState]:
+        with self._lock:
+            return self._cached_state
+
+    def _wanted_state(self) -> Optional[ProxyState]:
+        if self._wanted_enabled is None:
+            return None
+        return ProxyState(self._wanted_enabled, str(self.proxy.ip_address), int(self.proxy.port))
+
+    @staticmethod
+    def _is_same_state(current: Optional[ProxyState], wanted: ProxyState) -> bool:
+        if current is None:
+            return False
+        if not wanted.enabled:
+            # address of a disabled proxy doesn't matter
+            return not current.enabled
+        return current == wanted
+
+    def _apply(self, current: Optional[ProxyState], wanted: ProxyState, force: bool) -> None:
+        if not wanted.enabled:
+            logger.debug("Disabling system proxy.")
+            self.proxy.delete_proxy()
+        elif current is not None and current.enabled and not force:
+            # proxy is already enabled, only its address has changed
+            logger.debug(f"Changing system proxy address to {wanted.ip_address}:{wanted.port}.")
+            self.proxy.set_proxy()
+        else:
+            logger.debug(f"Enabling system proxy at {wanted.ip_address}:{wanted.port}.")
+            self.proxy.join()
+
+    def _read_state(self) -> Optional[ProxyState]:
+        try:
+            proxy_info = self.proxy.get_proxy()
+        except Exception as e:
+            logger.error(f"Could not read system proxy settings: {e}")
+            return None
+
+        if not proxy_info:
+            return None
+
+        http_proxy = proxy_info.get("http") or {}
+        try:
+            port = int(http_proxy.get("port") or 0)
+        except (TypeError, ValueError):
+            port = 0
+
+        state = ProxyState(bool(proxy_info.get("is_enable")), str(http_proxy.get("ip_address") or ""), port)
+        logger.debug(f"Read system proxy state: {state}")
+        return state
+
+
+class OfflineProxyBackend:
+    """
+    Stand-in for uniproxy.Uniproxy which never touches the system proxy. It counts how many external commands each
+    operation would have launched through uniproxy on a KDE session (which configures both KDE and GNOME), so that the
+    cost of blocker transitions can be measured without a desktop environment.
+    """
+
+    JOIN_COMMAND_COUNT = 18
+    SET_PROXY_COMMAND_COUNT = 12
+    DELETE_PROXY_COMMAND_COUNT = 15
+    GET_PROXY_COMMAND_COUNT = 4
+
+    def __init__(self, ip: str, port: int) -> None:
+        self.ip_address = ip
+        self.port = port
+        self.is_enabled: bool = False
+        self.proxy_ip_address: str = ""
+        self.proxy_port: int = 0
+        self.command_count: int = 0
+        self.operation_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def join(self) -> None:
+        self._run("join", self.JOIN_COMMAND_COUNT)
+        self.proxy_ip_address, self.proxy_port = self.ip_address, self.port
+        self.is_enabled = True
+
+    def set_proxy(self) -> None:
+        self._run("set_proxy", self.SET_PROXY_COMMAND_COUNT)
+        self.proxy_ip_address, self.proxy_port = self.ip_address, self.port
+
+    def delete_proxy(self) -> None:
+        self._run("delete_proxy", self.DELETE_PROXY_COMMAND_COUNT)
+        self.proxy_ip_address, self.proxy_port = "", 0
+        self.is_enabled = False
+
+    def get_proxy(self) -> Dict[str, Any]:
+        self._run("get_proxy", self.GET_PROXY_COMMAND_COUNT)
+        address = {"ip_address": self.proxy_ip_address, "port": str(self.proxy_port) if self.proxy_port else ""}
+        return {"is_enable": self.is_enabled, "http": dict(address), "https": dict(address), "ftp": dict(address)}
+
+    def _run(self, operation: str, command_count: int) -> None:
+        with self._lock:
+            self.command_count += command_count
+            self.operation_counts[operation] = self.operation_counts.get(operation, 0) + 1
+            total = self.command_count
+        logger.info(f"Offline proxy backend: {operation} costs {command_count} external commands, {total} in total")
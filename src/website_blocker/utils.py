@@ -5,14 +5,18 @@
 
 import os
 import signal
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import psutil
 from loguru import logger
 
+if TYPE_CHECKING:
+    import psutil
 
-def find_processes_by_name(name: str) -> List[psutil.Process]:
+
+def find_processes_by_name(name: str) -> List["psutil.Process"]:
     "Return a list of processes matching 'name'."
+    import psutil
+
     ls: List[psutil.Process] = []
     for p in psutil.process_iter(attrs=["name", "exe", "cmdline"]):
         if (
@@ -27,6 +31,8 @@ def find_processes_by_name(name: str) -> List[psutil.Process]:
 
 
 def kill_process() -> None:
+    import psutil
+
     logger.debug("Inside kill_process().")
     if os.name == "nt":
         processes: List[psutil.Process] = find_processes_by_name("mitmdump.exe") + find_processes_by_name(
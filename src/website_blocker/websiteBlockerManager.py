@@ -1,22 +1,25 @@
 import os
 import shutil
-import ssl
 import subprocess
 import sys
-import urllib.request
 from pathlib import Path
-from typing import Any, Callable, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-import certifi
 from loguru import logger
 from PySide6.QtCore import QObject, QThread, Signal
-from uniproxy import Uniproxy
 
 from configValues import ConfigValues
+from constants import OFFLINE_PROXY_ENV_VAR
 from utils.checkFlatpakSandbox import is_flatpak_sandbox
+from website_blocker.addonEvents import get_ruleset_version
+from website_blocker.blockerEventServer import BlockerEventServer
 from website_blocker.constants import MITMDUMP_SHUTDOWN_URL
+from website_blocker.proxyStateManager import OfflineProxyBackend, ProxyStateManager
 from website_blocker.utils import kill_process
 
+if TYPE_CHECKING:
+    from uniproxy import Uniproxy
+
 # Windows-specific constant for hiding console windows
 CREATE_NO_WINDOW = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
 
@@ -64,11 +67,45 @@ class ProxyWorker(QThread):
 
 
 class WebsiteBlockerManager(QObject):
-    def __init__(self) -> None:
+    def __init__(self, event_server: Optional[BlockerEventServer] = None) -> None:
+        """
+        event_server receives blocked hits and decision latencies from mitmdump, mitmdump isn't asked to send them if
+        it is None
+        """
         super().__init__()
-        self.proxy: Uniproxy = Uniproxy("127.0.0.1", ConfigValues.PROXY_PORT)
+        # both are created on first use, so that uniproxy isn't imported at startup
+        self._proxy: Optional["Uniproxy | OfflineProxyBackend"] = None
+        self._proxy_state_manager: Optional[ProxyStateManager] = None
         self.workers: List[QThread] = []  # Keep references to prevent garbage collection
 
+        self.event_server = event_server
+        self.expected_ruleset_version = ""
+        # latencies of the blocking decisions made by block.py since blocking was started, logged when it stops
+        self.decision_count = 0
+        self.decision_total_ns = 0
+        self.decision_max_ns = 0
+        if self.event_server is not None:
+            self.event_server.rulesetVersionReceived.connect(self._check_ruleset_version)
+            self.event_server.decisionStatsReceived.connect(self._add_decision_stats)
+
+    @property
+    def proxy(self) -> "Uniproxy | OfflineProxyBackend":
+        if self._proxy is None:
+            if os.environ.get(OFFLINE_PROXY_ENV_VAR):
+                logger.info("Offline proxy mode is on, system proxy settings won't be changed.")
+                self._proxy = OfflineProxyBackend("127.0.0.1", ConfigValues.PROXY_PORT)
+            else:
+                from uniproxy import Uniproxy
+
+                self._proxy = Uniproxy("127.0.0.1", ConfigValues.PROXY_PORT)
+        return self._proxy
+
+    @property
+    def proxy_state_manager(self) -> ProxyStateManager:
+        if self._proxy_state_manager is None:
+            self._proxy_state_manager = ProxyStateManager(self.proxy)
+        return self._proxy_state_manager
+
     def start_blocking(
         self,
         listening_port: int,
@@ -79,6 +116,8 @@ class WebsiteBlockerManager(QObject):
         """Function which starts blocking in a separate thread."""
         logger.debug("Inside WebsiteBlockerManager.start_blocking().")
 
+        self.expected_ruleset_version = get_ruleset_version(block_type, joined_addresses)
+
         def startMitmdumpAfterStop() -> None:
             self._shutdown_mitmdump()
             self._start_mitmdump(listening_port, joined_addresses, block_type, mitmdump_bin_path)
@@ -89,9 +128,7 @@ class WebsiteBlockerManager(QObject):
 
         self.stop_blocking(delete_proxy=False)
 
-        proxy_worker = ProxyWorker(self.proxy.join)
-        self.workers.append(proxy_worker)
-        proxy_worker.start()
+        self._request_proxy_state(enabled=True)
 
     def _start_mitmdump(
         self,
@@ -115,6 +152,7 @@ class WebsiteBlockerManager(QObject):
                 f"addresses_str={joined_addresses}",
                 "--set",
                 f"block_type={block_type}",
+                *self._get_event_stream_args(),
             ]
             # using _MEIPASS to make it compatible with pyinstaller
             # the os.path.join returns the location of block.py
@@ -158,6 +196,7 @@ class WebsiteBlockerManager(QObject):
                 f"addresses_str={joined_addresses}",
                 "--set",
                 f"block_type={block_type}",
+                *self._get_event_stream_args(),
             ]
             # using _MEIPASS to make it compatible with pyinstaller
             # the os.path.join returns the location of block.py
@@ -167,19 +206,66 @@ class WebsiteBlockerManager(QObject):
             subprocess.Popen(args)
         return True
 
+    def _get_event_stream_args(self) -> List[str]:
+        if self.event_server is None:
+            return []
+        return ["--set", f"events_socket={self.event_server.server_path}"]
+
+    def _check_ruleset_version(self, ruleset_version: str) -> None:
+        if ruleset_version != self.expected_ruleset_version:
+            # happens when an older mitmdump instance is still running with a stale list of addresses
+            logger.warning(
+                f"mitmdump is blocking with ruleset {ruleset_version}, expected {self.expected_ruleset_version}"
+            )
+        else:
+            logger.debug(f"mitmdump is blocking with ruleset {ruleset_version}")
+
+    def _add_decision_stats(self, decisions: Dict[str, int]) -> None:
+        """decisions is a dict with count, total_ns and max_ns as sent by block.py"""
+        self.decision_count += decisions["count"]
+        self.decision_total_ns += decisions["total_ns"]
+        self.decision_max_ns = max(self.decision_max_ns, decisions["max_ns"])
+
+    def _log_decision_stats(self) -> None:
+        if not self.decision_count:
+            return
+
+        logger.info(
+            f"mitmdump made {self.decision_count} blocking decisions, "
+            f"{self.decision_total_ns / self.decision_count / 1000:.1f} µs on average and "
+            f"{self.decision_max_ns / 1000:.1f} µs at most"
+        )
+        self.decision_count = 0
+        self.decision_total_ns = 0
+        self.decision_max_ns = 0
+
     def stop_blocking(self, delete_proxy: bool = True) -> None:
         """Stop website blocking in a separate thread."""
         logger.debug("Inside WebsiteBlockerManager.stop_blocking().")
 
+        self._log_decision_stats()
+
         if delete_proxy:
-            proxy_worker: ProxyWorker = ProxyWorker(self.proxy.delete_proxy)
-            self.workers.append(proxy_worker)
-            proxy_worker.start()
+            self._request_proxy_state(enabled=False)
 
         worker: WebsiteBlockerWorker = WebsiteBlockerWorker(self._shutdown_mitmdump)
         self.workers.append(worker)
         worker.start()
 
+    def reset_proxy(self) -> None:
+        """Stop website blocking and reset the system proxy even if it is believed to be reset already."""
+        logger.debug("Inside WebsiteBlockerManager.reset_proxy().")
+        self.proxy_state_manager.invalidate()
+        self._request_proxy_state(enabled=False, force=True)
+        self.stop_blocking(delete_proxy=False)
+
+    def _request_proxy_state(self, enabled: bool, force: bool = False) -> None:
+        """Start a worker which brings the system proxy to the requested state unless one is already running."""
+        if self.proxy_state_manager.request(enabled, force):
+            proxy_worker: ProxyWorker = ProxyWorker(self.proxy_state_manager.sync)
+            self.workers.append(proxy_worker)
+            proxy_worker.start()
+
     def _shutdown_mitmdump(self) -> bool:
         """Helper method to shutdown mitmdump in a worker thread"""
         try:
@@ -189,6 +275,11 @@ class WebsiteBlockerManager(QObject):
                     "SIGINT or SIGKILL instead."
                 )
 
+            import ssl
+            import urllib.request
+
+            import certifi
+
             proxy_url: str = f"http://127.0.0.1:{ConfigValues.PROXY_PORT}"
             proxy_handler = urllib.request.ProxyHandler({"http": proxy_url, "https": proxy_url})
             context = ssl.create_default_context(cafile=certifi.where())